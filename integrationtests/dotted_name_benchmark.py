@@ -0,0 +1,73 @@
+""" Measures the cost of looking up dotted trait names when painting a table
+and refreshing the labels of a tree.
+
+Simulates a TableEditor repainting a table whose ObjectColumns use dotted
+trait names, and a TreeEditor refreshing the labels of its nodes, and reports
+the average time per cell and per label. The cost of the equivalent xgetattr
+calls is reported for comparison.
+
+Usage: python dotted_name_benchmark.py [rows]
+"""
+
+import sys
+import timeit
+
+from traits.api import HasTraits, Instance, Str
+from traits.trait_base import xgetattr
+
+from traitsui.api import ObjectColumn, TreeNode
+
+N_COLUMNS = 10
+
+
+class Address(HasTraits):
+    city = Str('Paris')
+
+
+class Company(HasTraits):
+    address = Instance(Address, ())
+
+
+class Employee(HasTraits):
+    name = Str('Adam')
+    company = Instance(Company, ())
+
+
+NAMES = ['name', 'company.address.city'] * (N_COLUMNS / 2)
+
+
+def paint(columns, employees):
+    for employee in employees:
+        for column in columns:
+            column.get_value(employee)
+
+
+def refresh_labels(node, employees):
+    get_label = node.get_label
+    for employee in employees:
+        get_label(employee)
+
+
+def lookup(employees):
+    for employee in employees:
+        for name in NAMES:
+            xgetattr(employee, name)
+
+
+def report(title, function, calls):
+    times = timeit.repeat(function, number=5, repeat=5)
+    print '%s: %.2f us per call' % (title, min(times) / (5 * calls) * 1e6)
+
+
+def main(rows=1000):
+    employees = [Employee() for i in xrange(rows)]
+    columns = [ObjectColumn(name=name) for name in NAMES]
+    node = TreeNode(node_for=[Employee], label='company.address.city')
+
+    report('xgetattr lookups', lambda: lookup(employees), rows * N_COLUMNS)
+    report('table cells', lambda: paint(columns, employees), rows * N_COLUMNS)
+    report('tree labels', lambda: refresh_labels(node, employees), rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
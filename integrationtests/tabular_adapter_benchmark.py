@@ -0,0 +1,54 @@
+""" Measures the cost of the TabularAdapter calls made when painting a cell.
+
+Simulates a TabularEditor repainting the visible part of a 30 column table
+(the text, background color and font of every cell) and reports the average
+time per cell.
+
+Usage: python tabular_adapter_benchmark.py [rows]
+"""
+
+import sys
+import timeit
+
+from traits.api import HasTraits, Float, List
+
+from traitsui.tabular_adapter import TabularAdapter
+
+N_COLUMNS = 30
+
+
+class Record(HasTraits):
+    pass
+
+for i in range(N_COLUMNS):
+    Record.add_class_trait('x%d' % i, Float(i))
+
+
+class Table(HasTraits):
+    records = List(Record)
+
+
+def paint(adapter, table, rows):
+    get_text     = adapter.get_text
+    get_bg_color = adapter.get_bg_color
+    get_font     = adapter.get_font
+    for row in xrange(rows):
+        for column in xrange(N_COLUMNS):
+            get_text(table, 'records', row, column)
+            get_bg_color(table, 'records', row, column)
+            get_font(table, 'records', row, column)
+
+
+def main(rows=40):
+    table = Table(records=[Record() for i in xrange(rows)])
+    adapter = TabularAdapter(
+        columns=[('X%d' % i, 'x%d' % i) for i in range(N_COLUMNS)])
+
+    times = timeit.repeat(lambda: paint(adapter, table, rows), number=5,
+                          repeat=5)
+    per_cell = min(times) / (5 * rows * N_COLUMNS)
+    print '%d x %d cells: %.2f us per cell' % (rows, N_COLUMNS, per_cell * 1e6)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
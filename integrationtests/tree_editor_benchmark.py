@@ -0,0 +1,90 @@
+""" Measures the cost of common operations on a wide, flat Qt tree.
+
+Shows a TreeEditor whose root has a large number of children and reports the
+average time taken to find the index of a child within its parent (as done
+when deleting or dragging a node), and the time taken to remove a block of
+children from the list they are shown from, to extend the list with as many
+children again, and to replace the whole list.
+
+Requires the Qt toolkit.
+
+Usage: python tree_editor_benchmark.py [children]
+"""
+
+import sys
+import time
+import timeit
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = 'qt4'
+
+from traits.api import HasTraits, Instance, List, Str
+
+from traitsui.api import Item, TreeEditor, TreeNode, View
+
+
+class Leaf(HasTraits):
+    name = Str
+
+
+class Root(HasTraits):
+    name = Str('Root')
+    leaves = List(Leaf)
+
+
+class Model(HasTraits):
+    root = Instance(Root)
+
+    traits_view = View(
+        Item('root',
+             editor=TreeEditor(
+                 nodes=[
+                     TreeNode(node_for=[Root], children='leaves',
+                              label='name', auto_open=True),
+                     TreeNode(node_for=[Leaf], label='name'),
+                 ]),
+             show_label=False),
+        resizable=True)
+
+
+def node_indices(editor, nids):
+    node_index = editor._node_index
+    for nid in nids:
+        node_index(nid)
+
+
+def report(title, seconds, calls=1):
+    print '%s: %.2f us per call' % (title, seconds / calls * 1e6)
+
+
+def main(children=10000):
+    root = Root(leaves=[Leaf(name=str(i)) for i in xrange(children)])
+    model = Model(root=root)
+    ui = model.edit_traits()
+    try:
+        editor = ui.get_editors('root')[0]
+        rnid = editor._tree.topLevelItem(0)
+
+        # The children nearest the end are the worst case for a linear scan:
+        nids = [rnid.child(i) for i in xrange(children - 100, children)]
+        times = timeit.repeat(lambda: node_indices(editor, nids), number=5,
+                              repeat=5)
+        report('node index', min(times), 5 * len(nids))
+
+        start = time.time()
+        del root.leaves[children / 2: children / 2 + 1000]
+        report('remove 1000 children', time.time() - start)
+
+        start = time.time()
+        root.leaves.extend([Leaf(name=str(i)) for i in xrange(children)])
+        report('extend with %d children' % children, time.time() - start)
+
+        start = time.time()
+        root.leaves = [Leaf(name=str(i)) for i in xrange(children)]
+        report('replace all children', time.time() - start)
+    finally:
+        ui.dispose()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
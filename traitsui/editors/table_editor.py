@@ -23,6 +23,8 @@
 
 from __future__ import absolute_import
 
+from bisect import bisect_left
+
 from traits.api import (Int, Float, List, Instance, Str, Color, Font, Any, Tuple,
         Dict, Enum, Trait, Bool, Callable, Range, on_trait_change)
 
@@ -129,6 +131,25 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Should the cells of the table automatically size to the optimal size?
     auto_size = Bool( True )
 
+    # The maximum number of rows (in addition to the visible ones) whose
+    # contents are measured when sizing the cells of the table (Qt4 only).
+    # The sampled rows are spread evenly over the table, and include its first
+    # and last rows. A value of 0 measures every row, which can be slow for
+    # tables with many rows:
+    auto_size_sample = Int( 0 )
+
+    # Should the cells of the table be sized every time the table is updated,
+    # or only when it is first displayed and when its columns change (Qt4
+    # only)?
+    auto_size_on_update = Bool( True )
+
+    # The maximum number of cell values (texts, colors, fonts, etc.) cached
+    # between repaints of the table (Qt4 only). The cache is discarded when
+    # the items, their traits or the columns change, or the editor is
+    # refreshed. A value of 0 disables the cache, so that the columns are
+    # queried for every cell on every repaint:
+    cell_cache_size = Int( 0 )
+
     # Mirrors the Qt QSizePolicy.Policy attribute, for horizontal and vertical
     # dimensions.  For these to be useful, set auto_size to False.  If these
     # are None, then the table size policy will not be set in that dimension
@@ -172,6 +193,13 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Does sorting affect the model (vs. just the view)?
     sort_model = Bool( False )
 
+    # Should the table be filtered, and sorted when a column header is
+    # clicked, on a worker thread (Qt4 only)? The table keeps showing its
+    # previous contents until the results are ready, and a new filter or sort
+    # cancels any which is still running. The filter and the column sort keys
+    # must be safe to compute on a thread other than the UI thread:
+    threaded_sort_filter = Bool( False )
+
     # Should grid lines be shown on the table?
     show_lines = Bool( True )
 
@@ -517,6 +545,63 @@ class BaseTableEditor(object):
             value = bool( eval( condition, globals(), self._menu_context ) )
             setattr( object, trait, value )
 
+#-------------------------------------------------------------------------------
+#  Helper function for toolkit-specific editors to maintain filtered indices:
+#-------------------------------------------------------------------------------
+
+def splice_filtered_indices ( indices, index, n_removed, accepted ):
+    """ Returns the ( start, end, values ) slice assignment which updates the
+        sorted list *indices* of the rows passing a table filter, after the
+        *n_removed* rows starting at *index* are replaced by rows whose filter
+        results are given by the list *accepted*. Only the indices after the
+        changed rows need to be shifted, so appending rows never visits the
+        existing indices.
+    """
+    start = bisect_left( indices, index )
+    end   = bisect_left( indices, index + n_removed, start )
+    delta = len( accepted ) - n_removed
+    values = [ index + i for i, ok in enumerate( accepted ) if ok ]
+    if delta != 0:
+        values.extend( [ i + delta for i in indices[ end: ] ] )
+        end = len( indices )
+
+    return ( start, end, values )
+
+#-------------------------------------------------------------------------------
+#  Helper function for toolkit-specific editors to move rows:
+#-------------------------------------------------------------------------------
+
+def moved_rows ( rows, new_row, n_items ):
+    """ Returns the ( first, order ) permutation which moves the rows in
+        *rows* to *new_row* in a table of *n_items* rows, keeping their
+        relative order: after the move, row first + i holds the item which was
+        in row order[ i ]. Only the span of rows between the moved rows and
+        their destination is included in *order*. Nothing is moved if
+        *new_row* is not a row of the table.
+    """
+    rows = sorted( set( rows ) )
+    if len( rows ) == 0 or not (0 <= new_row < n_items):
+        return ( 0, [] )
+
+    # If the lowest moved row is above the destination, insert after rather
+    # than before the destination:
+    if rows[0] < new_row:
+        new_row += 1
+
+    # Find where the rows are inserted once they have been removed:
+    for row in reversed( rows ):
+        if row <= new_row:
+            new_row -= 1
+    new_row = max( 0, min( new_row, n_items - len( rows ) ) )
+
+    first = min( rows[0], new_row )
+    last  = max( rows[-1], new_row + len( rows ) - 1 )
+    moved = set( rows )
+    order = [ row for row in xrange( first, last + 1 ) if row not in moved ]
+    order[ new_row - first: new_row - first ] = rows
+
+    return ( first, order )
+
 #-------------------------------------------------------------------------------
 #  Helper class for toolkit-specific editors to implement 'reversed' option:
 #-------------------------------------------------------------------------------
@@ -25,7 +25,7 @@
 
 from __future__ import absolute_import
 
-from traits.api import Str, Bool, Property, List, Enum, Instance
+from traits.api import Str, Bool, Float, Int, Property, List, Enum, Instance
 
 from ..ui_traits import Image
 
@@ -67,6 +67,13 @@ class TabularEditor ( BasicEditorFactory ):
     # this feature adds and removed Traits listeners to each item in the list.
     auto_update = Bool( False )
 
+    # The maximum number of times per second that the table is repainted
+    # because of changes to the table items' contents when **auto_update** is
+    # True (Qt4 only). If non-zero, changes are collected (even when made on
+    # another thread) and only the visible rows of the changed items are
+    # repainted. If zero, the table is repainted after every change:
+    auto_update_rate = Float( 0.0 )
+
     # The optional extended name of the trait to synchronize the selection
     # values with:
     selected = Str
@@ -140,6 +147,12 @@ class TabularEditor ( BasicEditorFactory ):
     # this when the amount of data is large.
     auto_resize_rows = Bool( False )
 
+    # The maximum number of rows (in addition to the visible ones) whose
+    # contents are measured when automatically resizing the columns (Qt4
+    # only). The sampled rows are spread evenly over the table, and include
+    # its first and last rows. A value of 0 uses the default Qt measurement:
+    auto_resize_sample = Int( 0 )
+
     # Whether to stretch the last column to fit the available space.
     stretch_last_section = Bool( True )
 
@@ -22,7 +22,10 @@
 
 from __future__ import absolute_import
 
-from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum
+from bisect import bisect_left
+
+from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum, \
+    on_trait_change
 
 from ..tree_node import TreeNode
 
@@ -30,7 +33,9 @@ from ..dock_window_theme import DockWindowTheme
 
 from ..editor_factory import EditorFactory
 
-from ..helper import Orientation
+from ..helper import Orientation, overrides
+
+from ..toolkit import toolkit_object
 
 #-------------------------------------------------------------------------------
 #  Trait definitions:
@@ -56,6 +61,10 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Mapping from TreeNode tuples to MultiTreeNodes
     multi_nodes = Dict
 
+    # Mapping from object classes to the nodes which may handle their
+    # instances (see 'nodes_for'):
+    class_nodes = Dict
+
     # The column header labels if any.
     column_headers = List(Str)
 
@@ -165,6 +174,138 @@ class ToolkitEditorFactory ( EditorFactory ):
     # This works only in the qt backend and if there is only one column in tree
     word_wrap = Bool(False)
 
+    # Should the tree be displayed by a model/view implementation which only
+    # asks the tree nodes about the rows being displayed? This keeps the cost
+    # of huge trees proportional to what is visible, but does not support
+    # context menus or drag and drop (Qt4 only).
+    virtual = Bool(False)
+
+    #---------------------------------------------------------------------------
+    #  'Editor' factory methods:
+    #---------------------------------------------------------------------------
+
+    def _get_simple_editor_class ( self ):
+        """ Returns the editor class to use for "simple" style views.
+            Overridden to return the virtual tree editor if requested and the
+            toolkit supports it.
+        """
+        if self.virtual:
+            try:
+                return toolkit_object( 'tree_editor:VirtualTreeEditor',
+                                       raise_exceptions = True )
+            except:
+                pass
+
+        return super( ToolkitEditorFactory, self )._get_simple_editor_class()
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes which handle a specified object:
+    #---------------------------------------------------------------------------
+
+    def nodes_for ( self, object ):
+        """ Returns the list of nodes whose is_node_for method accepts a
+            specified object, in the order of 'nodes'.
+
+            A node using the TreeNode implementation of is_node_for only
+            looks at the class and interfaces of the object, so it is tested
+            once per class and the result is cached. Nodes which override
+            is_node_for are still asked about every object.
+        """
+        klass = object.__class__
+        nodes = self.class_nodes.get( klass )
+        if nodes is None:
+            nodes = []
+            for node in self.nodes:
+                dynamic = overrides( node, 'is_node_for', TreeNode )
+                if dynamic or node.is_node_for( object ):
+                    nodes.append( ( node, dynamic ) )
+            self.class_nodes[ klass ] = nodes
+
+        return [ node for node, dynamic in nodes
+                 if (not dynamic) or node.is_node_for( object ) ]
+
+    #-- Trait Change Handlers --------------------------------------------------
+
+    @on_trait_change( 'nodes, nodes_items, nodes:node_for' )
+    def _flush_class_nodes ( self ):
+        """ Discards the cached nodes for each class when the nodes change.
+        """
+        self.class_nodes = {}
+
+#-------------------------------------------------------------------------------
+#  Helper function for toolkit-specific editors to update replaced children:
+#-------------------------------------------------------------------------------
+
+def children_diff ( old, new ):
+    """ Returns the ( removed, order ) changes which turn the list of child
+        objects *old* of a tree node into the list *new*, matching children by
+        identity, so that the tree items of the children which are still there
+        can be kept (together with their expanded descendants).
+
+        *removed* is the list of the indices in *old* of the children which
+        are no longer present, in descending order. *order* gives, for each
+        child in *new*, the index in *old* of the child it is, or None if it
+        is a new child. A child appearing several times in both lists is
+        matched in order of appearance.
+    """
+    indices = {}
+    for i, child in enumerate( old ):
+        indices.setdefault( id( child ), [] ).append( i )
+    for positions in indices.itervalues():
+        positions.reverse()
+
+    order = []
+    for child in new:
+        positions = indices.get( id( child ) )
+        if positions:
+            order.append( positions.pop() )
+        else:
+            order.append( None )
+
+    removed = sorted( [ i for positions in indices.itervalues()
+                          for i in positions ], reverse = True )
+
+    return ( removed, order )
+
+#-------------------------------------------------------------------------------
+#  Returns the largest set of children which can stay where they are:
+#-------------------------------------------------------------------------------
+
+def kept_children ( order ):
+    """ Returns the set of the indices in the *order* returned by
+        children_diff of the largest set of old children whose relative order
+        is unchanged (a longest increasing subsequence of *order*), so that
+        only the other children need to be moved.
+        For example: kept_children( [ 5, 0, 1, None, 2 ] ) returns
+        set( [ 0, 1, 2 ] ).
+    """
+    # tails[ k ] is the smallest last old index of an increasing subsequence
+    # of length k + 1 found so far, and ends[ k ] the position in *order* of
+    # that last index:
+    tails    = []
+    ends     = []
+    previous = {}
+    for i, old_index in enumerate( order ):
+        if old_index is None:
+            continue
+
+        k = bisect_left( tails, old_index )
+        previous[ i ] = ends[ k - 1 ] if k > 0 else None
+        if k == len( tails ):
+            tails.append( old_index )
+            ends.append( i )
+        else:
+            tails[ k ] = old_index
+            ends[ k ]  = i
+
+    kept = set()
+    i    = ends[ -1 ] if ends else None
+    while i is not None:
+        kept.add( order[ i ] )
+        i = previous[ i ]
+
+    return kept
+
 # Define the TreeEditor class.
 TreeEditor = ToolkitEditorFactory
 
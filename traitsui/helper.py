@@ -75,6 +75,117 @@ def commatize ( value ):
 
     return '-' + result
 
+#-------------------------------------------------------------------------------
+#  Merge a set of row indices into ranges of consecutive rows:
+#-------------------------------------------------------------------------------
+
+def row_ranges ( rows ):
+    """ Returns the list of ( first, last ) index pairs of the runs of
+        consecutive row indices in *rows*, in ascending order. For example:
+        row_ranges( [ 5, 1, 2, 3, 7, 6 ] ) returns [ ( 1, 3 ), ( 5, 7 ) ].
+    """
+    ranges = []
+    first  = last = None
+    for row in sorted( set( rows ) ):
+        if last is None or row != last + 1:
+            if last is not None:
+                ranges.append( ( first, last ) )
+            first = row
+        last = row
+
+    if last is not None:
+        ranges.append( ( first, last ) )
+
+    return ranges
+
+#-------------------------------------------------------------------------------
+#  Returns the rank of each of a list of sort keys:
+#-------------------------------------------------------------------------------
+
+def sort_ranks ( keys ):
+    """ Returns a list containing the rank of each key in *keys* within the
+        sorted keys, so that ranks[i] < ranks[j] exactly when keys[i] sorts
+        before keys[j]. Equal keys get equal ranks. For example:
+        sort_ranks( [ 'b', 'a', 'c', 'a' ] ) returns [ 1, 0, 2, 0 ].
+
+        *keys* may also be a numpy array, in which case the ranks are computed
+        without visiting each key in Python.
+    """
+    if hasattr( keys, 'dtype' ):
+        import numpy
+
+        return numpy.unique( keys, return_inverse = True )[1].tolist()
+
+    ranks = [ 0 ] * len( keys )
+    rank  = -1
+    last  = None
+    for i in sorted( xrange( len( keys ) ), key = keys.__getitem__ ):
+        key = keys[i]
+        if rank < 0 or key != last:
+            rank += 1
+            last  = key
+        ranks[i] = rank
+
+    return ranks
+
+#-------------------------------------------------------------------------------
+#  Returns where to move a key to keep a list of sort keys sorted:
+#-------------------------------------------------------------------------------
+
+def sorted_index ( keys, index, reverse = False ):
+    """ Returns the index to which the key at *index* in *keys* must be moved
+        for *keys* to be sorted, assuming that all of the other keys already
+        are (in descending order if *reverse* is True). The index is found by
+        a binary search, and the key is placed after any keys equal to it.
+        For example: sorted_index( [ 1, 9, 3, 5 ], 1 ) returns 3.
+    """
+    key    = keys[ index ]
+    lo, hi = 0, len( keys ) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if mid >= index:
+            other = keys[ mid + 1 ]
+        else:
+            other = keys[ mid ]
+        if reverse:
+            after = not (other < key)
+        else:
+            after = not (key < other)
+        if after:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+#-------------------------------------------------------------------------------
+#  Returns the set of names referenced by a code object:
+#-------------------------------------------------------------------------------
+
+def code_names ( code ):
+    """ Returns the set of names referenced by a code object, including those
+        referenced by any code objects nested within it (such as generator
+        expressions or lambdas).
+    """
+    names = set( code.co_names ) | set( code.co_varnames ) | \
+            set( code.co_freevars )
+    for constant in code.co_consts:
+        if hasattr( constant, 'co_names' ):
+            names |= code_names( constant )
+
+    return names
+
+#-------------------------------------------------------------------------------
+#  Returns whether an object overrides a method defined by one of its bases:
+#-------------------------------------------------------------------------------
+
+def overrides ( object, name, base ):
+    """ Returns whether the class of *object* overrides the method called
+        *name* defined by the class *base*.
+    """
+    return (getattr( object.__class__, name ).im_func is not
+            getattr( base, name ).im_func)
+
 #-------------------------------------------------------------------------------
 #  Recomputes the mappings for a new set of enumeration values:
 #-------------------------------------------------------------------------------
@@ -27,6 +27,9 @@ from traits.api \
 from traitsui.ui_traits \
     import convert_image, SequenceTypes
 
+from traitsui.helper \
+    import row_ranges
+
 #-------------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------------
@@ -34,6 +37,87 @@ from traitsui.ui_traits \
 # Layout orientation for a control and its associated editor
 Orientation = Enum( 'horizontal', 'vertical' )
 
+#-------------------------------------------------------------------------------
+#  Build an item selection from a set of row indices:
+#-------------------------------------------------------------------------------
+
+def row_selection ( model, rows, first_column = 0, last_column = 0 ):
+    """ Returns a QItemSelection of the specified *rows* of *model* (between
+        *first_column* and *last_column*), using a single selection range for
+        each run of consecutive rows. This makes selecting many rows at once
+        much cheaper than selecting them one at a time.
+    """
+    selection = QtGui.QItemSelection()
+    for first, last in row_ranges( rows ):
+        selection.select( model.index( first, first_column ),
+                          model.index( last, last_column ) )
+
+    return selection
+
+#-------------------------------------------------------------------------------
+#  Measure the contents of a sample of the rows of a table view:
+#-------------------------------------------------------------------------------
+
+def sample_rows ( view, size ):
+    """ Returns the sorted indices of the rows of a table view to measure
+        when sizing its cells: the visible rows, plus at most *size* other rows
+        spread evenly over the whole table (including the first and last
+        rows).
+    """
+    n    = view.model().rowCount( QtCore.QModelIndex() )
+    rows = set()
+    if n == 0:
+        return []
+
+    first = view.rowAt( 0 )
+    if first >= 0:
+        last = view.rowAt( view.viewport().height() - 1 )
+        if last < 0:
+            last = n - 1
+        rows.update( xrange( first, last + 1 ) )
+
+    if size >= n:
+        rows.update( xrange( n ) )
+    elif size > 1:
+        step = float( n - 1 ) / (size - 1)
+        rows.update( int( round( i * step ) ) for i in xrange( size ) )
+    elif size == 1:
+        rows.add( 0 )
+
+    return sorted( rows )
+
+def sampled_column_width ( view, column, rows ):
+    """ Returns the width needed to display the contents of the specified
+        *rows* of a table view's *column*, as measured by the item delegates.
+
+        The cells are not measured with cached font metrics: each cell may
+        have its own font, icon or check box, and custom renderers may draw
+        anything at all, so only the delegates can size them correctly. The
+        cost is instead bounded by the number of rows sampled.
+    """
+    model  = view.model()
+    option = view.viewOptions()
+    width  = 0
+    for row in rows:
+        index    = model.index( row, column )
+        delegate = view.itemDelegate( index )
+        width    = max( width, delegate.sizeHint( option, index ).width() )
+
+    if view.showGrid():
+        width += 1
+
+    return width
+
+def sampled_row_height ( view, rows ):
+    """ Returns the height needed to display the contents of the specified
+        *rows* of a table view.
+    """
+    height = 0
+    for row in rows:
+        height = max( height, view.sizeHintForRow( row ) )
+
+    return height
+
 #-------------------------------------------------------------------------------
 #  Convert an image file name to a cached QPixmap:
 #-------------------------------------------------------------------------------
@@ -31,6 +31,7 @@ from traits.api import Any, Bool, Event, Int, Instance, List, \
 from traitsui.list_str_adapter import ListStrAdapter
 
 from editor import Editor
+from helper import row_selection
 from list_str_model import ListStrModel
 from traitsui.menu import Menu
 
@@ -321,9 +322,8 @@ class _ListStrEditor(Editor):
         if not self._no_update:
             smodel = self.list_view.selectionModel()
             smodel.clearSelection()
-            for selected_index in selected_indices:
-                smodel.select(self.model.index(selected_index),
-                              QtGui.QItemSelectionModel.Select)
+            smodel.select(row_selection(self.model, selected_indices),
+                          QtGui.QItemSelectionModel.Select)
             if selected_indices:
                 self.list_view.scrollTo(self.model.index(selected_indices[-1]))
 
@@ -332,11 +332,11 @@ class _ListStrEditor(Editor):
         """
         if not self._no_update:
             smodel = self.list_view.selectionModel()
-            for selected_index in event.removed:
-                smodel.select(self.model.index(selected_index),
+            if event.removed:
+                smodel.select(row_selection(self.model, event.removed),
                               QtGui.QItemSelectionModel.Deselect)
-            for selected_index in event.added:
-                smodel.select(self.model.index(selected_index),
+            if event.added:
+                smodel.select(row_selection(self.model, event.added),
                               QtGui.QItemSelectionModel.Select)
 
     #-- List Control Event Handlers --------------------------------------------
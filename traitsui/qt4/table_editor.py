@@ -16,6 +16,10 @@
 #  Imports:
 #-------------------------------------------------------------------------------
 
+import logging
+
+from threading import Thread
+
 from pyface.qt import QtCore, QtGui
 
 from pyface.image_resource import ImageResource
@@ -29,11 +33,19 @@ from traitsui.api import EnumEditor, InstanceEditor, Group, \
     Handler, Item, Label, TableColumn, TableFilter, UI, View, default_handler, \
     spring
 from traitsui.editors.table_editor import BaseTableEditor, \
-    ReversedList, ToolkitEditorFactory, customize_filter
+    ReversedList, ToolkitEditorFactory, customize_filter, \
+    splice_filtered_indices
+from traitsui.helper import sort_ranks
 from traitsui.ui_traits import SequenceTypes, Image
 
 from editor import Editor
+from helper import (row_selection, sample_rows, sampled_column_width,
+    sampled_row_height)
 from table_model import TableModel, SortFilterTableModel
+from toolkit import ui_handler
+
+# Set up a logger:
+logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------------------
 #  'TableEditor' class:
@@ -176,6 +188,12 @@ class TableEditor(Editor, BaseTableEditor):
         if self.factory.sortable and not self.factory.reorderable:
             self.model.sort(0, QtCore.Qt.AscendingOrder)
 
+        # Only an explicit sort by the user reorders the edited list:
+        if self.factory.sortable and self.factory.sort_model:
+            signal = QtCore.SIGNAL('sectionClicked(int)')
+            QtCore.QObject.connect(self.table_view.horizontalHeader(), signal,
+                                   self._on_header_click)
+
         # Connect to the mode specific selection handler and select the first
         # row/column/cell. Do this before creating the edit_view to make sure
         # that it has a valid item to use when constructing its view.
@@ -244,11 +262,12 @@ class TableEditor(Editor, BaseTableEditor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', dispatch='ui')
+            self._update_items, self.extended_name + '_items', dispatch='ui')
 
         # Listen for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+            self._item_trait_changed, self.extended_name + '.-',
+            dispatch='ui')
 
         # Listen for changes on column definitions
         self.on_trait_change(self._update_columns, 'columns', dispatch='ui')
@@ -263,7 +282,8 @@ class TableEditor(Editor, BaseTableEditor):
         self.sync_value(factory.selected, 'selected', is_list=is_list)
         self.sync_value(factory.selected_indices, 'selected_indices', is_list=is_list)
         self.sync_value(factory.filter_name, 'filter', 'from')
-        self.sync_value(factory.filtered_indices, 'filtered_indices', 'to')
+        self.sync_value(factory.filtered_indices, 'filtered_indices', 'to',
+                        is_list=True)
         self.sync_value(factory.update_filter_name, 'update_filter', 'from')
 
         self.auto_size = self.factory.auto_size
@@ -282,6 +302,9 @@ class TableEditor(Editor, BaseTableEditor):
         # continue to interact (the control won't be deleted until later).
         self.table_view.setModel(None)
 
+        # Discard the results of any background filtering or sorting
+        self._cancel_sort_filter()
+
         # Make sure that the auxillary UIs are properly disposed
         if self.toolbar_ui is not None:
             self.toolbar_ui.dispose()
@@ -290,11 +313,11 @@ class TableEditor(Editor, BaseTableEditor):
 
         # Remove listener for 'items' changes on object trait
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self._update_items, self.extended_name + '_items', remove=True)
 
         # Remove listener for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', remove=True)
+            self._item_trait_changed, self.extended_name + '.-', remove=True)
 
         # Remove listeners for column definition changes
         self.on_trait_change(self._update_columns, 'columns', remove=True)
@@ -311,23 +334,59 @@ class TableEditor(Editor, BaseTableEditor):
         """Updates the editor when the object trait changes externally to the
         editor."""
 
+        self._flush_caches()
+        if self._no_notify:
+            return
+
+        self._update_model()
+
+    def _update_items(self, event):
+        """Handles items being added to or removed from the object trait."""
+
+        self._flush_caches()
         if self._no_notify:
             return
 
+        self._update_model(event)
+
+    def _update_model(self, event=None):
+        """Updates the filtering, sorting and sizing of the table after the
+        items change. If the change is described by a list items *event*, the
+        filter is only re-run on the added items, and only the added items are
+        positioned in the current sort."""
+
+        # The items have changed, so the snapshot being filtered or sorted in
+        # the background is out of date: filter synchronously instead, and
+        # restart any pending sort once the model is consistent again.
+        job = self._cancel_sort_filter()
+        if job is not None:
+            event = None
+            if job.order is not None:
+                do_later(self._sort_filter_in_background, job.column,
+                         job.order)
+
         self.table_view.setUpdatesEnabled(False)
         try:
+            splice = self._splice_for(event)
             filtering = len(self.factory.filters) > 0 or self.filter is not None
-            if filtering:
+            if filtering and not self._update_filtered_items(splice):
                 self._update_filtering()
+                splice = None
 
-            # invalidate the model, but do not reset it. Resetting the model
-            # may cause problems if the selection sync'ed traits are being used
-            # externally to manage the selections
-            self.model.invalidate()
+            if splice is not None:
+                self.source_model.items_replaced(*splice)
+                if self.factory.sort_model:
+                    self._sort_added_items(*splice)
+            else:
+                # invalidate the model, but do not reset it. Resetting the
+                # model may cause problems if the selection sync'ed traits are
+                # being used externally to manage the selections
+                self.model.invalidate()
 
-            self.table_view.resizeColumnsToContents()
-            if self.auto_size:
-                self.table_view.resizeRowsToContents()
+            if self.factory.auto_size_on_update:
+                self.table_view.resizeColumnsToContents()
+                if self.auto_size:
+                    self.table_view.resizeRowsToContents()
 
         finally:
             self.table_view.setUpdatesEnabled(True)
@@ -356,6 +415,7 @@ class TableEditor(Editor, BaseTableEditor):
     def refresh_editor(self):
         """Requests that the underlying table widget to redraw itself."""
 
+        self.source_model.flush_cache()
         self.table_view.viewport().update()
 
     #---------------------------------------------------------------------------
@@ -373,6 +433,28 @@ class TableEditor(Editor, BaseTableEditor):
         return self.ui.evaluate(factory.row_factory,
                                 *factory.row_factory_args, **kw)
 
+    #---------------------------------------------------------------------------
+    #  Batch row operations:
+    #---------------------------------------------------------------------------
+
+    def insert_rows(self, row, objects):
+        """Inserts a list of objects at a row of the table, as a single change
+        to the edited list."""
+
+        return self.source_model.insertItems(row, list(objects))
+
+    def delete_rows(self, rows):
+        """Deletes the objects in a sequence of rows of the table, as a single
+        change to the edited list."""
+
+        return self.source_model.removeItems(rows)
+
+    def move_rows(self, rows, new_row):
+        """Moves the objects in a sequence of rows of the table to a new row,
+        as a single change to the edited list."""
+
+        self.source_model.moveRows(list(rows), new_row)
+
     #---------------------------------------------------------------------------
     #  Returns the raw list of model objects:
     #---------------------------------------------------------------------------
@@ -380,12 +462,16 @@ class TableEditor(Editor, BaseTableEditor):
     def items(self):
         """Returns the raw list of model objects."""
 
-        items = self.value
-        if not isinstance(items, SequenceTypes):
-            items = [ items ]
+        items = self._items_view
+        if items is None:
+            items = self.value
+            if not isinstance(items, SequenceTypes):
+                items = [ items ]
 
-        if self.factory.reverse:
-            items = ReversedList(items)
+            if self.factory.reverse:
+                items = ReversedList(items)
+
+            self._items_view = items
 
         return items
 
@@ -403,6 +489,7 @@ class TableEditor(Editor, BaseTableEditor):
             func(*args, **kw)
         finally:
             self._no_notify = old
+            self._flush_caches()
 
     def setx(self, **keywords):
         """Set one or more attributes without notifying the underlying table
@@ -438,41 +525,48 @@ class TableEditor(Editor, BaseTableEditor):
         # Selection mode is 'row' or 'rows'
         if mode.startswith('row'):
             flags |= QtGui.QItemSelectionModel.Rows
-            items = self.items()
-            for obj in objects:
-                try:
-                    row = items.index(obj)
-                except ValueError:
-                    continue
-                indexes.append(self.source_model.index(row, source_column))
-
-        # Selection mode is 'column' or 'columns'
-        elif mode.startswith('column'):
-            flags |= QtGui.QItemSelectionModel.Columns
-            for name in objects:
-                column = self._column_index_from_name(name)
-                if column != -1:
-                    indexes.append(self.source_model.index(source_row, column))
-
-        # Selection mode is 'cell' or 'cells'
+            rows = []
+            for row in self._source_rows_for(objects):
+                index = self.model.mapFromSource(
+                    self.source_model.index(row, source_column))
+                if index.isValid():
+                    rows.append(index.row())
+                    current = index
+
+            # Select each run of consecutive rows as a single range:
+            selection = row_selection(self.model, rows)
+            if rows:
+                self.table_view.setCurrentIndex(current)
+
         else:
-            items = self.items()
-            for obj, name in objects:
-                try:
-                    row = items.index(obj)
-                except ValueError:
-                    continue
-                column = self._column_index_from_name(name)
-                if column != -1:
-                    indexes.append(self.source_model.index(row, column))
+            # Selection mode is 'column' or 'columns'
+            if mode.startswith('column'):
+                flags |= QtGui.QItemSelectionModel.Columns
+                for name in objects:
+                    column = self._column_index_from_name(name)
+                    if column != -1:
+                        indexes.append(
+                            self.source_model.index(source_row, column))
+
+            # Selection mode is 'cell' or 'cells'
+            else:
+                rows = self._source_rows_for([ obj for obj, name in objects ])
+                for (obj, name), row in zip(objects, rows):
+                    column = self._column_index_from_name(name)
+                    if row != -1 and column != -1:
+                        indexes.append(self.source_model.index(row, column))
+
+            # Perform the selection so that only one signal is emitted
+            selection = QtGui.QItemSelection()
+            current = None
+            for index in indexes:
+                index = self.model.mapFromSource(index)
+                if index.isValid():
+                    current = index
+                    selection.select(index, index)
+            if current is not None:
+                self.table_view.setCurrentIndex(current)
 
-        # Perform the selection so that only one signal is emitted
-        selection = QtGui.QItemSelection()
-        for index in indexes:
-            index = self.model.mapFromSource(index)
-            if index.isValid():
-                self.table_view.setCurrentIndex(index)
-                selection.select(index, index)
         smodel = self.table_view.selectionModel()
         try:
             smodel.blockSignals(not notify)
@@ -487,6 +581,89 @@ class TableEditor(Editor, BaseTableEditor):
     #  Private methods:
     #---------------------------------------------------------------------------
 
+    def _source_rows_for(self, objects):
+        """ Returns the source model row index of each of the specified
+            objects, or -1 for an object which is not in the table.
+        """
+        items = self.items()
+        if len(objects) < 2:
+            rows = []
+            for obj in objects:
+                try:
+                    rows.append(items.index(obj))
+                except ValueError:
+                    rows.append(-1)
+            return rows
+
+        # Map item ids to rows in one pass, keeping the first occurrence of
+        # any repeated item:
+        n = len(items)
+        index = dict(zip(map(id, reversed(items)), xrange(n - 1, -1, -1)))
+        rows = []
+        for obj in objects:
+            row = index.get(id(obj), -1)
+            if row == -1:
+                try:
+                    row = items.index(obj)
+                except ValueError:
+                    pass
+            rows.append(row)
+
+        return rows
+
+    def _row_for(self, object):
+        """Returns the source model row of an item, or -1 if it is not in the
+        table, using a map of item ids to rows which is rebuilt after the
+        items change."""
+
+        items = self.items()
+        rows = self._item_rows
+        if rows is not None:
+            row = rows.get(id(object), -1)
+            if 0 <= row < len(items) and items[row] is object:
+                return row
+
+        # Keep the first occurrence of any repeated item:
+        n = len(items)
+        self._item_rows = rows = dict(zip(map(id, reversed(items)),
+                                          xrange(n - 1, -1, -1)))
+        return rows.get(id(object), -1)
+
+    def _splice_items(self, row, count, objects):
+        """Replaces the *count* items starting at *row* with a list of
+        objects, as a single change to the edited list."""
+
+        items = self.value
+        if self.factory.reverse:
+            n = len(items)
+            items[n - row - count: n - row] = objects[::-1]
+        else:
+            items[row: row + count] = objects
+
+    def _splice_filter_cache(self, row, count, objects, rows=None):
+        """Updates the filter cache and filtered indices before the *count*
+        items starting at *row* are replaced with a list of objects. If the
+        objects are already in the table, *rows* gives the row of each, and
+        their filter results are reused rather than computed again."""
+
+        fc = self._filtered_cache
+        if fc is None:
+            return
+
+        if rows is None:
+            accepted = self._filter_items(objects)
+        else:
+            accepted = [ fc[i] for i in rows ]
+        fc[row: row + count] = accepted
+        self._splice_filtered_indices(row, count, accepted)
+
+    def _flush_caches(self):
+        """Discards the cached items view, item rows and cell data."""
+
+        self._items_view = None
+        self._item_rows = None
+        self.source_model.flush_cache()
+
     def _column_index_from_name(self, name):
         """Returns the index of the column with the given name or -1 if no
         column exists with that name."""
@@ -519,12 +696,197 @@ class TableEditor(Editor, BaseTableEditor):
             self.filtered_indices = range(num_items)
             self.filter_summary = 'All %i items' % num_items
         else:
-            if not callable(f):
-                f = f.filter
-            self._filtered_cache = fc = [ f(item) for item in items ]
+            self._filtered_cache = fc = self._filter_items(items)
             self.filtered_indices = fi = [ i for i, ok in enumerate(fc) if ok ]
             self.filter_summary = '%i of %i items' % (len(fi), num_items)
 
+    def _splice_for(self, event):
+        """Returns the ( index, n_removed, n_added ) rows replaced by a list
+        items *event*, or None if the event can not be mapped onto the rows
+        of the table."""
+
+        if event is None or self.factory.reverse:
+            return None
+
+        index, n_removed, n_added = (event.index, len(event.removed),
+                                     len(event.added))
+        n_rows = len(self.items())
+        if (not isinstance(index, int) or index < 0 or
+            index + n_added > n_rows):
+            return None
+
+        return ( index, n_removed, n_added )
+
+    def _update_filtered_items(self, splice):
+        """Updates the filter cache and filtered indices after the rows of a
+        *splice* (see _splice_for) are replaced, running the filter only on
+        the added items. Returns False if this can not be done incrementally,
+        in which case _update_filtering must be used instead."""
+
+        fc = self._filtered_cache
+        if splice is None or fc is None:
+            return False
+
+        index, n_removed, n_added = splice
+        if len(fc) - n_removed + n_added != len(self.items()):
+            return False
+
+        items = self.items()
+        accepted = self._filter_items(items[index: index + n_added])
+        fc[index: index + n_removed] = accepted
+        self._splice_filtered_indices(index, n_removed, accepted)
+
+        return True
+
+    def _update_filtered_item(self, object, row):
+        """Re-runs the filter on a single item whose traits have changed.
+        Returns whether the item's filter result changed."""
+
+        fc = self._filtered_cache
+        if fc is None or row >= len(fc):
+            return False
+
+        ok = self._filter_items([object])[0]
+        changed = bool(ok) != bool(fc[row])
+        fc[row] = ok
+        if changed:
+            self._splice_filtered_indices(row, 1, [ok])
+
+        return changed
+
+    def _sort_added_items(self, index, n_removed, n_added):
+        """Keeps the edited list sorted after items are added to it, moving a
+        single item into place or re-sorting the list for several items."""
+
+        column = self.model.sortColumn()
+        if n_added == 0 or column < 0 or not self.factory.sortable:
+            return
+
+        if n_added == 1:
+            self._move_to_sorted_row(self.items()[index], index)
+        else:
+            self.model.sort_source(column, self.model.sortOrder())
+
+    def _move_to_sorted_row(self, object, row):
+        """Moves an item whose sort key changed to the row which keeps the
+        edited list sorted, keeping it selected if it was."""
+
+        new_row = self.model.sorted_row(row)
+        if new_row == row:
+            self.source_model.rows_changed(row, row)
+            return
+
+        model, source_model = self.model, self.source_model
+        selection = self.table_view.selectionModel()
+        index = model.mapFromSource(source_model.index(row, 0))
+        selected = index.isValid() and selection.isRowSelected(index.row(),
+                                                           index.parent())
+
+        source_model.removeItems([ row ])
+        source_model.insertItems(new_row, [ object ])
+
+        if selected:
+            index = model.mapFromSource(source_model.index(new_row, 0))
+            selection.select(index, QtGui.QItemSelectionModel.Select |
+                                    QtGui.QItemSelectionModel.Rows)
+
+    def _filter_items(self, items):
+        """Returns the result of the current filter for each of a list of
+        items, letting a TableFilter filter them all at once."""
+
+        f = self.filter
+        if callable(f):
+            return [ f(item) for item in items ]
+
+        return f.filter_many(items)
+
+    def _sort_filter_in_background(self, column=None, order=None):
+        """Starts filtering and sorting a snapshot of the items on a worker
+        thread, cancelling any job which is still running. If *order* is
+        given, the model is sorted by *column* once the job completes, without
+        re-running the filter. Otherwise the items are re-filtered and the
+        model is re-sorted by its current sort column."""
+
+        # A restart scheduled with do_later may run after the editor has been
+        # disposed of:
+        if self.control is None:
+            return
+
+        self._cancel_sort_filter()
+
+        filter_items = order is None
+        if filter_items:
+            column = self.model.sortColumn()
+        sort_column = None
+        if 0 <= column < len(self.columns):
+            sort_column = self.columns[column]
+
+        self._sort_filter_job = job = _SortFilterJob(
+            editor = self,
+            items = list(self.items()),
+            filter = self.filter,
+            filter_items = filter_items,
+            column = column,
+            sort_column = sort_column,
+            order = order)
+        job.start()
+
+    def _cancel_sort_filter(self):
+        """Cancels the background filtering and sorting job, if any, and
+        returns it."""
+
+        job = self._sort_filter_job
+        if job is not None:
+            job.cancelled = True
+            self._sort_filter_job = None
+
+        return job
+
+    def _sort_filter_done(self, job):
+        """Swaps the results of a background filtering and sorting job into
+        the model."""
+
+        if job is not self._sort_filter_job or self.control is None:
+            return
+
+        self._sort_filter_job = None
+        if job.failed or len(job.items) != len(self.items()):
+            # Fall back to filtering and sorting synchronously:
+            if job.filter_items:
+                self._update_filtering()
+                self.model.invalidate_with_ranks(-1, None)
+                self.set_selection(self.selected)
+            else:
+                self.model.sort_with_ranks(job.column, job.order, None)
+            return
+
+        if job.filter_items:
+            num_items = len(job.items)
+            self._filtered_cache = job.filtered
+            self.filtered_indices = job.filtered_indices
+            if job.filtered is None:
+                self.filter_summary = 'All %i items' % num_items
+            else:
+                self.filter_summary = '%i of %i items' % (
+                    len(job.filtered_indices), num_items)
+            self.model.invalidate_with_ranks(job.column, job.ranks)
+            self.set_selection(self.selected)
+        else:
+            self.model.sort_with_ranks(job.column, job.order, job.ranks)
+            if job.sort_source:
+                self.model.sort_source(job.column, job.order, job.ranks)
+
+    def _splice_filtered_indices(self, index, n_removed, accepted):
+        """Updates the filtered indices and filter summary after the filter
+        results of a range of rows change."""
+
+        fi = self.filtered_indices
+        start, end, values = splice_filtered_indices(fi, index, n_removed,
+                                                     accepted)
+        fi[start:end] = values
+        self.filter_summary = '%i of %i items' % (len(fi),
+                                                  len(self._filtered_cache))
+
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
@@ -597,12 +959,37 @@ class TableEditor(Editor, BaseTableEditor):
 
     #-- Trait Change Handlers --------------------------------------------------
 
+    def _item_trait_changed(self, object, name, old, new):
+        """Handles a trait on one of the items changing. If its filter result
+        or sort key changed, only its row is re-filtered and re-positioned."""
+
+        # Nothing depends on the row of the item unless the table is
+        # filtered or sorted:
+        if self._filtered_cache is None and self.model.sortColumn() < 0:
+            self.refresh_editor()
+            return
+
+        row = self._row_for(object)
+        if row >= 0:
+            filtered = self._update_filtered_item(object, row)
+            if self.model.update_sort_key(row):
+                if self.factory.sort_model:
+                    self._move_to_sorted_row(object, row)
+                else:
+                    self.source_model.rows_changed(row, row)
+            elif filtered:
+                self.source_model.rows_changed(row, row)
+
+        self.refresh_editor()
+
     def _filter_changed(self, old_filter, new_filter):
         """Handles the current filter being changed."""
 
         if not self._no_notify:
             if new_filter is customize_filter:
                 do_later(self._customize_filters, old_filter)
+            elif self.factory.threaded_sort_filter:
+                self._sort_filter_in_background()
             else:
                 self._update_filtering()
                 self.model.invalidate()
@@ -616,7 +1003,9 @@ class TableEditor(Editor, BaseTableEditor):
             if column.renderer:
                 self.table_view.setItemDelegateForColumn(i, column.renderer)
 
+        self.source_model.flush_cache()
         self.model.reset()
+        self.table_view.flush_font_metrics()
         self.table_view.resizeColumnsToContents()
         if self.auto_size:
             self.table_view.resizeRowsToContents()
@@ -727,6 +1116,20 @@ class TableEditor(Editor, BaseTableEditor):
         # Invoke the column's click handler:
         column.on_click(obj)
 
+    def _on_header_click(self, column):
+        """Handle a column header being clicked, which sorts the table by the
+        column, by sorting the edited list to match."""
+
+        # With threaded sorting, the sort keys are being ranked by the job
+        # started by the click, so reorder the list once it completes:
+        job = self._sort_filter_job
+        if job is not None and job.order is not None:
+            job.sort_source = True
+            return
+
+        header = self.table_view.horizontalHeader()
+        self.model.sort_source(column, header.sortIndicatorOrder())
+
     def _on_dclick(self, index):
         """Handle a cell being double clicked."""
 
@@ -755,17 +1158,38 @@ class TableEditor(Editor, BaseTableEditor):
     def _on_context_remove(self):
         """Handle 'remove item' being selected from the header context menu."""
 
-        self.model.removeRow(self.header_row)
+        self.delete_rows(self._context_rows())
 
     def _on_context_move_up(self):
         """Handle 'move up' being selected from the header context menu."""
 
-        self.model.moveRow(self.header_row, self.header_row - 1)
+        rows = self._context_rows(False)
+        if rows[0] > 0:
+            self.model.moveRows(rows, rows[0] - 1)
 
     def _on_context_move_down(self):
         """Handle 'move down' being selected from the header context menu."""
 
-        self.model.moveRow(self.header_row, self.header_row + 1)
+        rows = self._context_rows(False)
+        if rows[-1] < self.model.rowCount() - 1:
+            self.model.moveRows(rows, rows[-1] + 1)
+
+    def _context_rows(self, source=True):
+        """Returns the rows the header context menu acts on: the selected rows
+        if the row that was right clicked is one of them, and otherwise just
+        that row. The rows are mapped to the source model if *source* is True.
+        """
+
+        model = self.model
+        rows = sorted(index.row() for index in
+                      self.table_view.selectionModel().selectedRows())
+        if self.header_row not in rows:
+            rows = [ self.header_row ]
+        if source:
+            rows = [ model.mapToSource(model.index(row, 0)).row()
+                     for row in rows ]
+
+        return rows
 
 # Define the SimpleEditor class.
 SimpleEditor = TableEditor
@@ -773,6 +1197,83 @@ SimpleEditor = TableEditor
 # Define the ReadonlyEditor class.
 ReadonlyEditor = TableEditor
 
+#-------------------------------------------------------------------------------
+#  '_SortFilterJob' class:
+#-------------------------------------------------------------------------------
+
+class _SortFilterJob(Thread):
+    """ Filters a snapshot of a table editor's items and ranks their sort keys
+        on a worker thread, then passes itself back to the editor on the UI
+        thread.
+    """
+
+    # The number of items filtered between checks for cancellation:
+    chunk_size = 1000
+
+    def __init__(self, editor, items, filter, filter_items, column,
+                 sort_column, order):
+        Thread.__init__(self)
+        self.daemon = True
+
+        self.editor = editor
+        self.items = items
+        self.filter = filter
+        self.filter_items = filter_items
+        self.column = column
+        self.sort_column = sort_column
+        self.order = order
+
+        # Set (from the UI thread) when the results are no longer wanted:
+        self.cancelled = False
+
+        # Set (from the UI thread) if the edited list is to be reordered to
+        # match the sort once it completes:
+        self.sort_source = False
+
+        # The results:
+        self.failed = False
+        self.filtered = None
+        self.filtered_indices = None
+        self.ranks = None
+
+    def run(self):
+        try:
+            if self.filter_items:
+                self._filter()
+            if self.sort_column is not None and not self.cancelled:
+                keys = self.sort_column.get_sort_keys(self.items)
+                if not self.cancelled:
+                    self.ranks = sort_ranks(keys)
+        except:
+            logger.exception('Error filtering or sorting table items')
+            self.failed = True
+
+        if not self.cancelled:
+            ui_handler(self.editor._sort_filter_done, self)
+
+    def _filter(self):
+        """ Computes the filter results for the items in chunks, stopping
+            early if the job is cancelled.
+        """
+        items = self.items
+        f = self.filter
+        if f is None:
+            self.filtered_indices = range(len(items))
+            return
+
+        filtered = []
+        for start in xrange(0, len(items), self.chunk_size):
+            if self.cancelled:
+                return
+            chunk = items[start: start + self.chunk_size]
+            if callable(f):
+                filtered.extend([ f(item) for item in chunk ])
+            else:
+                filtered.extend(f.filter_many(chunk))
+
+        self.filtered = filtered
+        self.filtered_indices = [ i for i, ok in enumerate(filtered) if ok ]
+
 #-------------------------------------------------------------------------------
 #  Qt widgets that have been configured to behave as expected by Traits UI:
 #-------------------------------------------------------------------------------
@@ -854,6 +1355,9 @@ class TableView(QtGui.QTableView):
 
         self._initial_size = False
         self._editor = editor
+
+        # The font metrics used to measure the column labels, keyed by font:
+        self._font_metrics = {}
         factory = editor.factory
 
         # Configure the row headings.
@@ -981,8 +1485,9 @@ class TableView(QtGui.QTableView):
             else:
                 editor.header_row = row
                 if editor.factory.reorderable:
-                    show_up = row > 0
-                    show_down = row < editor.model.rowCount() - 1
+                    rows = editor._context_rows(False)
+                    show_up = rows[0] > 0
+                    show_down = rows[-1] < editor.model.rowCount() - 1
                     editor.header_menu_up.setVisible(show_up)
                     editor.header_menu_down.setVisible(show_down)
                 self._editor.header_menu.exec_(event.globalPos())
@@ -1041,19 +1546,17 @@ class TableView(QtGui.QTableView):
         # Autosize based on column contents and label width. Qt's default
         # implementation of this function does content, we handle the label.
         if requested_width < 1:
-            base_width = QtGui.QTableView.sizeHintForColumn(self, column_index)
-
-            # Determine what font to use in the calculation
-            font = column.get_text_font(None)
-            if font is None:
-                font = self.font()
-                font.setBold(True)
+            sample = editor.factory.auto_size_sample
+            if sample > 0:
+                base_width = sampled_column_width(self, column_index,
+                                                  sample_rows(self, sample))
             else:
-                font = QtGui.QFont(font)
+                base_width = QtGui.QTableView.sizeHintForColumn(self,
+                                                                column_index)
 
             # Determine the width of the column label
             text = column.get_label()
-            width = QtGui.QFontMetrics(font).width(text)
+            width = self._label_font_metrics(column).width(text)
 
             # Add margin to the calculated width as appropriate
             style = self.style()
@@ -1073,6 +1576,51 @@ class TableView(QtGui.QTableView):
         else:
             return requested_width
 
+    def changeEvent(self, event):
+        """Reimplemented to forget the cached font metrics when the font or
+        style of the table changes."""
+
+        if event.type() in (QtCore.QEvent.FontChange,
+                            QtCore.QEvent.StyleChange):
+            self.flush_font_metrics()
+        QtGui.QTableView.changeEvent(self, event)
+
+    def flush_font_metrics(self):
+        """Forgets the font metrics cached for measuring the column labels."""
+
+        self._font_metrics = {}
+
+    def _label_font_metrics(self, column):
+        """Returns the (cached) font metrics used to measure the label of a
+        column."""
+
+        # Determine what font to use in the calculation
+        font = column.get_text_font(None)
+        if font is None:
+            font = self.font()
+            font.setBold(True)
+        else:
+            font = QtGui.QFont(font)
+
+        key = font.key()
+        metrics = self._font_metrics.get(key)
+        if metrics is None:
+            metrics = self._font_metrics[key] = QtGui.QFontMetrics(font)
+        return metrics
+
+    def resizeRowsToContents(self):
+        """Reimplemented to size all of the rows from a sample of their contents
+        when the editor factory's **auto_size_sample** is set."""
+
+        factory = self._editor.factory
+        if factory is None or factory.auto_size_sample <= 0:
+            return QtGui.QTableView.resizeRowsToContents(self)
+
+        height = sampled_row_height(self,
+                                    sample_rows(self, factory.auto_size_sample))
+        if height > 0:
+            self.verticalHeader().setDefaultSectionSize(height)
+
     def resizeColumnsToContents(self):
         """Reimplemented to support proportional column width specifications."""
 
@@ -18,6 +18,8 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.editors.table_editor import moved_rows
+from traitsui.helper import row_ranges, sort_ranks, sorted_index
 from traitsui.ui_traits import SequenceTypes
 
 from .clipboard import PyMimeData 
@@ -65,6 +67,13 @@ class TableModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The cached data of each (row, column, role):
+        self._cache = {}
+
+        # The ( first, rows ) permutation of the items being applied by
+        # permuteItems while the views are told about it, or None:
+        self.permutation = None
+
     #---------------------------------------------------------------------------
     #  QAbstractTableModel interface:
     #---------------------------------------------------------------------------
@@ -80,7 +89,27 @@ class TableModel(QtCore.QAbstractTableModel):
         return len(self._editor.columns)
 
     def data(self, mi, role):
-        """Reimplemented to return the data."""
+        """Reimplemented to return the data, from the cache if enabled."""
+
+        size = self._editor.factory.cell_cache_size
+        if size <= 0 or role == QtCore.Qt.UserRole:
+            return self._data(mi, role)
+
+        key = (mi.row(), mi.column(), role)
+        cache = self._cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        if len(cache) >= size:
+            cache.clear()
+        cache[key] = value = self._data(mi, role)
+
+        return value
+
+    def _data(self, mi, role):
+        """Returns the data for a specified index and role."""
 
         obj = self._editor.items()[mi.row()]
         column = self._editor.columns[mi.column()]
@@ -194,33 +223,20 @@ class TableModel(QtCore.QAbstractTableModel):
         if obj is None:
             obj = editor.create_new_row()
 
-        self.beginInsertRows(parent, row, row)
-        editor.callx(editor.items().insert, row, obj)
-        self.endInsertRows()
-        return True
+        return self.insertItems(row, [ obj ], parent)
 
     def insertRows(self, row, count, parent=QtCore.QModelIndex()):
         """Reimplemented to allow creation of new rows."""
 
         editor = self._editor
-        items = editor.items()
-        self.beginInsertRows(parent, row, row + count - 1)
-        for i in xrange(count):
-            editor.callx(items.insert, row + i, editor.create_new_row())
-        self.endInsertRows()
-        return True
+        return self.insertItems(row,
+            [ editor.create_new_row() for i in xrange(count) ], parent)
 
     def removeRows(self, row, count, parent=QtCore.QModelIndex()):
         """Reimplemented to allow row deletion, as well as reordering via drag
         and drop."""
 
-        editor = self._editor
-        items = editor.items()
-        self.beginRemoveRows(parent, row, row + count - 1)
-        for i in xrange(count):
-            editor.callx(items.pop, row + i)
-        self.endRemoveRows()
-        return True
+        return self.removeItems(range(row, row + count), parent)
 
     def mimeTypes(self):
         """Reimplemented to expose our internal MIME type for drag and drop
@@ -336,7 +352,42 @@ class TableModel(QtCore.QAbstractTableModel):
     #---------------------------------------------------------------------------
     #  TableModel interface:
     #---------------------------------------------------------------------------
+
+    def flush_cache(self):
+        """Discards the cached cell data, so that it is fetched from the
+        columns again when next needed."""
+
+        self._cache.clear()
     
+    def items_replaced(self, index, n_removed, n_added):
+        """Notifies the views that the *n_removed* rows starting at *index*
+        have been replaced by *n_added* rows, so that a sorted view only
+        re-positions the changed rows rather than sorting all of them again.
+        """
+
+        # The rows in both the old and new items have changed data:
+        n_changed = min(n_removed, n_added)
+        if n_changed > 0:
+            self.rows_changed(index, index + n_changed - 1)
+
+        # The list has already been modified when this is called, so each
+        # 'begin' call is immediately followed by its matching 'end' call:
+        first = index + n_changed
+        parent = QtCore.QModelIndex()
+        if n_removed > n_changed:
+            self.beginRemoveRows(parent, first, index + n_removed - 1)
+            self.endRemoveRows()
+        elif n_added > n_changed:
+            self.beginInsertRows(parent, first, index + n_added - 1)
+            self.endInsertRows()
+
+    def rows_changed(self, first, last):
+        """Notifies the views that the data of a range of rows has changed."""
+
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        self.emit(signal, self.index(first, 0),
+                  self.index(last, self.columnCount(None) - 1))
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
 
@@ -344,33 +395,88 @@ class TableModel(QtCore.QAbstractTableModel):
 
     def moveRows(self, current_rows, new_row):
         """Moves a sequence of rows (provided as a list of row indexes) to a new
-        row."""
+        row, as a single change to the list of items."""
 
-        # Sort rows in descending order so they can be removed without
-        # invalidating the indices.
-        current_rows.sort()
-        current_rows.reverse()
+        editor = self._editor
+        first, rows = moved_rows(current_rows, new_row, len(editor.items()))
+        if not rows:
+            return
 
-        # If the the highest selected row is lower than the destination, do an
-        # insertion before rather than after the destination.
-        if current_rows[-1] < new_row:
-            new_row += 1
+        items = editor.items()
+        objects = [ items[row] for row in sorted(set(current_rows)) ]
+        self.permuteItems(first, rows)
 
-        # Remove selected rows...
-        items = self._editor.items()
-        objects = []
-        for row in current_rows:
-            if row <= new_row:
-                new_row -= 1
-            objects.insert(0, items[row])
-            self.removeRow(row)
+        # Update the selection for the new location.
+        editor.set_selection(objects)
 
-        # ...and add them at the new location.
-        for i, obj in enumerate(objects):
-            self.insertRow(new_row + i, obj=obj)
+    def insertItems(self, row, objects, parent=QtCore.QModelIndex()):
+        """Inserts a list of objects at a row, as a single change to the list
+        of items and a single notification of the views."""
 
-        # Update the selection for the new location.
-        self._editor.set_selection(objects)
+        if not objects:
+            return False
+
+        editor = self._editor
+        editor._splice_filter_cache(row, 0, objects)
+        self.beginInsertRows(parent, row, row + len(objects) - 1)
+        editor.callx(editor._splice_items, row, 0, objects)
+        self.endInsertRows()
+        return True
+
+    def removeItems(self, rows, parent=QtCore.QModelIndex()):
+        """Removes the items in a sequence of rows, as a single change to the
+        list of items and a single notification of the views."""
+
+        ranges = row_ranges(rows)
+        if not ranges:
+            return False
+
+        editor = self._editor
+        first, last = ranges[0][0], ranges[-1][1]
+        if len(ranges) == 1:
+            editor._splice_filter_cache(first, last + 1 - first, [])
+            self.beginRemoveRows(parent, first, last)
+            editor.callx(editor._splice_items, first, last + 1 - first, [])
+            self.endRemoveRows()
+            return True
+
+        # Replace the span of rows from the first to the last removed one by
+        # the rows it keeps:
+        removed = set(rows)
+        kept = [ row for row in xrange(first, last + 1) if row not in removed ]
+        items = editor.items()
+        objects = [ items[row] for row in kept ]
+        editor._splice_filter_cache(first, last + 1 - first, objects, kept)
+        self.beginResetModel()
+        editor.callx(editor._splice_items, first, last + 1 - first, objects)
+        self.endResetModel()
+        return True
+
+    def permuteItems(self, first, rows):
+        """Reorders the items in the span of rows starting at *first*, so that
+        the item in row first + i is the one previously in rows[i], as a single
+        change to the list of items and a single notification of the views."""
+
+        editor = self._editor
+        items = editor.items()
+        objects = [ items[row] for row in rows ]
+        editor._splice_filter_cache(first, len(rows), objects, rows)
+
+        self.emit(QtCore.SIGNAL('layoutAboutToBeChanged()'))
+        editor.callx(editor._splice_items, first, len(rows), objects)
+
+        new_rows = dict(zip(rows, xrange(first, first + len(rows))))
+        for index in self.persistentIndexList():
+            row = new_rows.get(index.row())
+            if row is not None:
+                self.changePersistentIndex(index,
+                                           self.index(row, index.column()))
+
+        self.permutation = (first, rows)
+        try:
+            self.emit(QtCore.SIGNAL('layoutChanged()'))
+        finally:
+            self.permutation = None
 
 #-------------------------------------------------------------------------------
 #  'SortFilterTableModel' class:
@@ -387,10 +493,51 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
 
         self._editor = editor
 
+        # The sort key of each source row, the rank of each key, and the
+        # column they are for. The keys are kept up to date as rows change, so
+        # that only the changed rows need to be re-positioned:
+        self._sort_keys = None
+        self._sort_ranks = None
+        self._sort_column = -1
+
     #---------------------------------------------------------------------------
     #  QSortFilterProxyModel interface:
     #---------------------------------------------------------------------------
 
+    def setSourceModel(self, model):
+        """Reimplemented to keep the sort keys up to date when the source
+        changes."""
+
+        # Connect before the base class does, so that the keys are updated
+        # before the proxy re-sorts in response to the same signals.
+        for signal, slot in (
+                ('dataChanged(QModelIndex,QModelIndex)',
+                 self._source_data_changed),
+                ('rowsInserted(QModelIndex,int,int)',
+                 self._source_rows_inserted),
+                ('rowsRemoved(QModelIndex,int,int)',
+                 self._source_rows_removed),
+                ('modelReset()', self.flush_sort_keys),
+                ('layoutChanged()', self._source_layout_changed)):
+            QtCore.QObject.connect(model, QtCore.SIGNAL(signal), slot)
+
+        QtGui.QSortFilterProxyModel.setSourceModel(self, model)
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Reimplemented to compute fresh sort keys for each sort, on a
+        worker thread if the editor is configured to do so."""
+
+        editor = self._editor
+        if column >= 0 and editor.factory.threaded_sort_filter:
+            editor._sort_filter_in_background(column, order)
+        else:
+            self.sort_with_ranks(column, order, None)
+
+    def invalidate(self):
+        """Reimplemented to discard the sort keys."""
+
+        self.invalidate_with_ranks(-1, None)
+
     def filterAcceptsRow(self, source_row, source_parent):
         """"Reimplemented to use a TableFilter for filtering rows."""
 
@@ -405,20 +552,55 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
         return True
 
     def lessThan(self, left_mi, right_mi):
-        """Reimplemented to sort according to the 'cmp' method defined for
-        TableColumn."""
+        """Reimplemented to sort according to the sort keys defined for
+        TableColumn. The keys are computed and ranked once per sort, so each
+        comparison only compares two integers. Once some rows have changed,
+        their keys are compared directly until the next sort."""
 
-        editor = self._editor
-        column = editor.columns[left_mi.column()]
-        items = editor.items()
-        left, right = items[left_mi.row()], items[right_mi.row()]
+        column = left_mi.column()
+        left, right = left_mi.row(), right_mi.row()
+        if column == self._sort_column:
+            ranks = self._sort_ranks
+            if ranks is not None and max(left, right) < len(ranks):
+                return ranks[left] < ranks[right]
+
+            keys = self._sort_keys
+            if keys is not None and max(left, right) < len(keys):
+                return keys[left] < keys[right]
 
-        return column.cmp(left, right) < 0
+        ranks = self._rank_sort_keys(column)
+        return ranks[left] < ranks[right]
 
     #---------------------------------------------------------------------------
     #  SortFilterTableModel interface:
     #---------------------------------------------------------------------------
 
+    def flush_sort_keys(self, *args):
+        """Discards the sort keys, so that they are recomputed by the next
+        sort. This must be called if the sorted values change without the
+        source model being notified."""
+
+        self._sort_keys = self._sort_ranks = None
+
+    def sort_with_ranks(self, column, order, ranks):
+        """Sorts the model by a column using the already computed ranks of
+        its sort keys (see traitsui.helper.sort_ranks), or None to compute
+        them as needed."""
+
+        self._sort_keys = None
+        self._sort_ranks = ranks
+        self._sort_column = column
+        QtGui.QSortFilterProxyModel.sort(self, column, order)
+
+    def invalidate_with_ranks(self, column, ranks):
+        """Re-filters and re-sorts the model using the already computed ranks
+        of the sort keys of a column, or None to compute them as needed."""
+
+        self._sort_keys = None
+        self._sort_ranks = ranks
+        self._sort_column = column
+        QtGui.QSortFilterProxyModel.invalidate(self)
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
 
@@ -432,3 +614,147 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
                          for row in current_rows ]
         new_row = self.mapToSource(self.index(new_row, 0)).row()
         source.moveRows(current_rows, new_row)
+
+    def update_sort_key(self, row):
+        """Updates the saved sort key of a source row whose item has changed.
+        Returns whether the key changed, in which case the row must be
+        re-positioned (by signalling that its data changed)."""
+
+        editor = self._editor
+        column = self.sortColumn()
+        if not editor.factory.sortable or not 0 <= column < len(editor.columns):
+            return False
+
+        items = editor.items()
+        keys = self._sort_keys
+        if (column != self._sort_column or keys is None or
+            len(keys) != len(items)):
+            # The position of the row in the current sort is unknown, so
+            # assume it has changed:
+            self._sort_column = column
+            self._sort_keys = list(editor.columns[column].get_sort_keys(items))
+            self._sort_ranks = None
+            return True
+
+        key = editor.columns[column].get_sort_key(items[row])
+        if not (key < keys[row] or keys[row] < key):
+            return False
+
+        if not isinstance(keys, list):
+            self._sort_keys = keys = list(keys)
+        keys[row] = key
+        self._sort_ranks = None
+        return True
+
+    def sorted_row(self, row):
+        """Returns the source row to which a row must be moved to keep the
+        source model sorted, after its sort key has been updated by
+        update_sort_key. The row is found by a binary search of the other
+        rows' keys, which are assumed to be sorted."""
+
+        column = self.sortColumn()
+        keys = self._sort_keys
+        if keys is None or column != self._sort_column:
+            if not 0 <= column < len(self._editor.columns):
+                return row
+
+            self._rank_sort_keys(column)
+            keys = self._sort_keys
+
+        return sorted_index(keys, row,
+                            self.sortOrder() == QtCore.Qt.DescendingOrder)
+
+    def sort_source(self, column, order, ranks=None):
+        """Reorders the items of the source model to match a sort by a column,
+        for editors whose sorting affects the model, using the already
+        computed ranks of its sort keys if given. This is only done when the
+        user explicitly sorts the table or adds several items to it, never
+        by the sorts the editor does itself."""
+
+        editor = self._editor
+        if not 0 <= column < len(editor.columns):
+            return
+
+        if ranks is None and column == self._sort_column:
+            ranks = self._sort_ranks
+        if ranks is None or len(ranks) != len(editor.items()):
+            ranks = self._rank_sort_keys(column)
+
+        n = len(ranks)
+        rows = sorted(xrange(n), key=ranks.__getitem__,
+                      reverse=(order == QtCore.Qt.DescendingOrder))
+        if rows != range(n):
+            self.sourceModel().permuteItems(0, rows)
+
+    #---------------------------------------------------------------------------
+    #  Private interface:
+    #---------------------------------------------------------------------------
+
+    def _rank_sort_keys(self, column):
+        """Computes and saves the sort key of each source row for the
+        specified column, and their ranks."""
+
+        editor = self._editor
+        keys = editor.columns[column].get_sort_keys(editor.items())
+        self._sort_keys = keys
+        self._sort_ranks = ranks = sort_ranks(keys)
+        self._sort_column = column
+
+        return ranks
+
+    def _splice_sort_keys(self, first, n_removed, n_added):
+        """Updates the saved sort keys after the *n_removed* source rows
+        starting at *first* are replaced by *n_added* rows."""
+
+        self._sort_ranks = None
+        editor = self._editor
+        keys = self._sort_keys
+        column = self._sort_column
+        items = editor.items()
+        if (keys is None or not 0 <= column < len(editor.columns) or
+            len(keys) - n_removed + n_added != len(items)):
+            self._sort_keys = None
+            return
+
+        if not isinstance(keys, list):
+            self._sort_keys = keys = list(keys)
+        get_sort_key = editor.columns[column].get_sort_key
+        keys[first: first + n_removed] = [ get_sort_key(items[row])
+                                    for row in xrange(first, first + n_added) ]
+
+    def _source_data_changed(self, top_left, bottom_right):
+        """Updates the sort keys of the source rows whose data changed."""
+
+        first, last = top_left.row(), bottom_right.row()
+        self._splice_sort_keys(first, last + 1 - first, last + 1 - first)
+
+    def _source_rows_inserted(self, parent, first, last):
+        """Adds the sort keys of the inserted source rows."""
+
+        self._splice_sort_keys(first, 0, last + 1 - first)
+
+    def _source_rows_removed(self, parent, first, last):
+        """Discards the sort keys of the removed source rows."""
+
+        self._splice_sort_keys(first, last + 1 - first, 0)
+
+    def _source_layout_changed(self):
+        """Keeps the sort keys in step with the source rows when the source
+        model permutes its items, and discards them for any other change of
+        its layout."""
+
+        permutation = self.sourceModel().permutation
+        keys = self._sort_keys
+        if permutation is None or keys is None:
+            self.flush_sort_keys()
+            return
+
+        first, rows = permutation
+        span = slice(first, first + len(rows))
+        if not isinstance(keys, list):
+            self._sort_keys = keys = list(keys)
+        keys[span] = [ keys[row] for row in rows ]
+        ranks = self._sort_ranks
+        if ranks is not None:
+            self._sort_ranks = ranks = list(ranks)
+            ranks[span] = [ ranks[row] for row in rows ]
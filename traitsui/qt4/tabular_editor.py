@@ -23,18 +23,23 @@
 #  Imports:
 #-------------------------------------------------------------------------------
 
+import time
+from threading import Lock
+
 from pyface.qt import QtCore, QtGui
 
 from pyface.image_resource import ImageResource
 
-from traits.api import (Any, Bool, Callable, Event, HasStrictTraits, Instance,
-    Int, List, NO_COMPARE, Property, TraitListEvent)
+from traits.api import (Any, Bool, Callable, Event, Float, HasStrictTraits,
+    Instance, Int, List, NO_COMPARE, Property, TraitListEvent)
 
 from traitsui.tabular_adapter import TabularAdapter
 from traitsui.ui_traits import Image
 
 from editor import Editor
+from helper import row_selection, sample_rows, sampled_column_width
 from tabular_model import TabularModel
+from toolkit import ui_handler
 
 
 class HeaderEventFilter(QtCore.QObject) :
@@ -123,6 +128,9 @@ class TabularEditor(Editor):
 
     header_event_filter = Any()
 
+    # The time of the most recent refresh of changed rows:
+    _last_refresh = Float
+
     widget_factory = Callable(lambda *args, **kwds: _TableView(*args, **kwds))
 
     #---------------------------------------------------------------------------
@@ -195,15 +203,24 @@ class TabularEditor(Editor):
         # replacements:
         try:
             self.context_object.on_trait_change(
-                self.update_editor, self.extended_name+'_items', dispatch='ui')
+                self._update_items, self.extended_name+'_items', dispatch='ui')
         except:
             pass
 
         # If the user has requested automatic update, attempt to set up the
         # appropriate listeners:
         if factory.auto_update:
-            self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+            if factory.auto_update_rate > 0:
+                # Changes are collected on the thread they occur on, and
+                # handled together on the UI thread:
+                self._changed_items = {}
+                self._changed_lock = Lock()
+                self.context_object.on_trait_change(
+                    self._item_changed, self.extended_name + '.-')
+            else:
+                self.context_object.on_trait_change(
+                    self.refresh_editor, self.extended_name + '.-',
+                    dispatch='ui')
 
         # Create the mapping from user supplied images to QImages:
         for image_resource in factory.images:
@@ -222,11 +239,17 @@ class TabularEditor(Editor):
         """ Disposes of the contents of an editor.
         """
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self._update_items, self.extended_name + '_items', remove=True)
 
         if self.factory.auto_update:
-            self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', remove=True)
+            if self.factory.auto_update_rate > 0:
+                self.context_object.on_trait_change(
+                    self._item_changed, self.extended_name + '.-',
+                    remove=True)
+            else:
+                self.context_object.on_trait_change(
+                    self.refresh_editor, self.extended_name + '.-',
+                    remove=True)
 
         self.on_trait_change(self.refresh_editor, 'adapter.+update',
                              remove=True)
@@ -241,12 +264,12 @@ class TabularEditor(Editor):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        self.adapter.flush_results()
+        self.model.flush_cache()
+        self._row_index = None
         if not self._no_update:
             self.model.reset()
-            if self.factory.multi_select:
-                self._multi_selected_changed(self.multi_selected)
-            else :
-                self._selected_changed(self.selected)
+            self._update_selection()
 
     #---------------------------------------------------------------------------
     #  TabularEditor interface:
@@ -255,6 +278,8 @@ class TabularEditor(Editor):
     def refresh_editor(self):
         """ Requests the table view to redraw itself.
         """
+        self.adapter.flush_results()
+        self.model.flush_cache()
         self.control.viewport().update()
 
     def callx(self, func, *args, **kw):
@@ -328,6 +353,130 @@ class TabularEditor(Editor):
 
         return self.images.get(image)
 
+    def _update_items(self, event):
+        """ Updates the editor when the items of the object trait are
+            modified in place, signalling only the rows affected by the change.
+        """
+        self.adapter.flush_results()
+        self.model.flush_cache()
+        self._update_row_index(event)
+        if not self._no_update:
+            self.model.items_changed(event)
+            self._update_selection()
+
+    def _update_selection(self):
+        """ Re-synchronizes the view selection with the selected item(s)
+            after the underlying list has changed.
+        """
+        if self.factory.multi_select:
+            self._multi_selected_changed(self.multi_selected)
+        else :
+            self._selected_changed(self.selected)
+
+    def _item_changed(self, item, name, old, new):
+        """ Records that a trait of a table item has changed, and schedules a
+            refresh of the changed rows if one is not already pending. This
+            may be called on any thread.
+        """
+        with self._changed_lock:
+            self._changed_items[id(item)] = item
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+
+        ui_handler(self._schedule_changed_rows_refresh)
+
+    def _schedule_changed_rows_refresh(self):
+        """ Schedules a refresh of the changed rows, delaying it as needed to
+            respect the editor factory's 'auto_update_rate'.
+        """
+        interval = 1.0 / self.factory.auto_update_rate
+        delay = max(0.0, self._last_refresh + interval - time.time())
+        QtCore.QTimer.singleShot(int(delay * 1000),
+                                 self._refresh_changed_rows)
+
+    def _refresh_changed_rows(self):
+        """ Repaints the visible rows of the table items that have changed
+            since the last refresh.
+        """
+        # Take the changes recorded so far, after which any new change will
+        # schedule another refresh:
+        with self._changed_lock:
+            items, self._changed_items = self._changed_items, {}
+            self._refresh_pending = False
+        self._last_refresh = time.time()
+        if self.control is None or len(items) == 0:
+            return
+
+        self.adapter.flush_results()
+        self.model.flush_cache()
+        control = self.control
+        first = control.rowAt(0)
+        if first < 0:
+            return
+
+        last = control.rowAt(control.viewport().height() - 1)
+        if last < 0:
+            last = self.model.rowCount(None) - 1
+
+        try:
+            rows = self._get_rows(items.values())
+        except:
+            # Some of the items are no longer in the table:
+            control.viewport().update()
+        else:
+            self.model.rows_changed([ row for row in rows
+                                      if first <= row <= last ])
+
+    def _update_row_index(self, event):
+        """ Updates the mapping from item ids to row indices after the items
+            of the edited list have been modified.
+        """
+        index = self._row_index
+        if index is None:
+            return
+
+        values = self.value
+        start = event.index
+        if (isinstance(start, int) and len(event.removed) == 0 and
+                start == len(values) - len(event.added)):
+            # Items appended to the end of the list don't move any others:
+            for row, item in enumerate(event.added, start):
+                index.setdefault(id(item), row)
+        else:
+            self._row_index = None
+
+    def _get_rows(self, items):
+        """ Returns the row indices of the specified items of the edited list.
+
+            Items are looked up by identity using a mapping from item ids to
+            row indices, which is built on demand (when looking up more than
+            one item) and maintained until the list is modified. Items which
+            are only equal to a list item are looked up using list.index, which
+            raises a ValueError if an item is not in the list.
+        """
+        values = self.value
+        index = self._row_index
+        if index is None:
+            if len(items) < 2:
+                return [values.index(item) for item in items]
+
+            # Build the mapping in reverse so the first occurrence of any
+            # repeated item wins:
+            n = len(values)
+            index = self._row_index = dict(
+                zip(map(id, reversed(values)), xrange(n - 1, -1, -1)))
+
+        n = len(values)
+        rows = []
+        for item in items:
+            row = index.get(id(item), -1)
+            if not (0 <= row < n and values[row] is item):
+                row = values.index(item)
+            rows.append(row)
+
+        return rows
+
     def _mouse_click(self, index, trait):
         """ Generate a TabularEditorEvent event for a specified model index and
             editor trait name.
@@ -347,7 +496,7 @@ class TabularEditor(Editor):
     def _selected_changed(self, new):
         if not self._no_update:
             try:
-                selected_row = self.value.index(new)
+                selected_row = self._get_rows([new])[0]
             except:
                 pass
             else:
@@ -365,19 +514,17 @@ class TabularEditor(Editor):
 
     def _multi_selected_changed(self, new):
         if not self._no_update:
-            values = self.value
             try:
-                rows = [ values.index(i) for i in new]
+                rows = self._get_rows(new)
             except:
                 pass
             else:
                 self._multi_selected_rows_changed(rows)
 
     def _multi_selected_items_changed(self, event):
-        values = self.value
         try:
-            added = [ values.index(item) for item in event.added ]
-            removed = [ values.index(item) for item in event.removed ]
+            added = self._get_rows(event.added)
+            removed = self._get_rows(event.removed)
         except:
             pass
         else:
@@ -387,9 +534,7 @@ class TabularEditor(Editor):
     def _multi_selected_rows_changed(self, selected_rows):
         if not self._no_update:
             smodel = self.control.selectionModel()
-            selection = QtGui.QItemSelection()
-            for row in selected_rows:
-                selection.select(self.model.index(row, 0), self.model.index(row, 0))
+            selection = row_selection(self.model, selected_rows)
             smodel.clearSelection()
             smodel.select(selection,
                 QtGui.QItemSelectionModel.Select |
@@ -397,12 +542,12 @@ class TabularEditor(Editor):
 
     def _multi_selected_rows_items_changed(self, event):
         smodel = self.control.selectionModel()
-        for row in event.removed:
-            smodel.select(self.model.index(row, 0),
+        if event.removed:
+            smodel.select(row_selection(self.model, event.removed),
                           QtGui.QItemSelectionModel.Deselect |
                           QtGui.QItemSelectionModel.Rows)
-        for row in event.added:
-            smodel.select(self.model.index(row, 0),
+        if event.added:
+            smodel.select(row_selection(self.model, event.added),
                           QtGui.QItemSelectionModel.Select |
                           QtGui.QItemSelectionModel.Rows)
 
@@ -723,6 +868,11 @@ class _TableView(QtGui.QTableView):
         """
         editor = self._editor
         if editor.factory.auto_resize:
+            sample = editor.factory.auto_resize_sample
+            if sample > 0:
+                return sampled_column_width(self, column,
+                                            sample_rows(self, sample))
+
             # Use the default implementation.
             return super(_TableView, self).sizeHintForColumn(column)
 
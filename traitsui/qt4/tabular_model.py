@@ -24,6 +24,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.helper import row_ranges
 from traitsui.ui_traits import SequenceTypes
 
 from .clipboard import PyMimeData
@@ -57,6 +58,10 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # Blocks of prefetched adapter results, keyed by the name of the bulk
+        # adapter method used to fetch them:
+        self._blocks = {}
+
     #---------------------------------------------------------------------------
     #  QAbstractItemModel interface:
     #---------------------------------------------------------------------------
@@ -69,7 +74,12 @@ class TabularModel(QtCore.QAbstractTableModel):
         obj, name = editor.object, editor.name
         row, column = mi.row(), mi.column()
 
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+        if role == QtCore.Qt.DisplayRole:
+            if adapter.prefetch:
+                return self._prefetched('get_texts', row, column)
+            return adapter.get_text(obj, name, row, column)
+
+        elif role == QtCore.Qt.EditRole:
             return adapter.get_text(obj, name, row, column)
 
         elif role == QtCore.Qt.DecorationRole:
@@ -93,7 +103,10 @@ class TabularModel(QtCore.QAbstractTableModel):
             return (alignment | QtCore.Qt.AlignVCenter)
 
         elif role == QtCore.Qt.BackgroundRole:
-            color = adapter.get_bg_color(obj, name, row, column)
+            if adapter.prefetch:
+                color = self._prefetched('get_bg_colors', row, column)
+            else:
+                color = adapter.get_bg_color(obj, name, row, column)
             if color is not None:
                 if isinstance(color, SequenceTypes):
                     q_color = QtGui.QColor(*color)
@@ -102,7 +115,10 @@ class TabularModel(QtCore.QAbstractTableModel):
                 return QtGui.QBrush(q_color)
 
         elif role == QtCore.Qt.ForegroundRole:
-            color = adapter.get_text_color(obj, name, row, column)
+            if adapter.prefetch:
+                color = self._prefetched('get_text_colors', row, column)
+            else:
+                color = adapter.get_text_color(obj, name, row, column)
             if color is not None:
                 if isinstance(color, SequenceTypes):
                     q_color = QtGui.QColor(*color)
@@ -123,6 +139,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         row, column = mi.row(), mi.column()
 
         editor.adapter.set_text(obj, name, row, column, value)
+        self.flush_cache()
         signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
         self.emit(signal, mi, mi)
         return True
@@ -188,6 +205,29 @@ class TabularModel(QtCore.QAbstractTableModel):
         editor = self._editor
         return len(editor.adapter.columns)
 
+    def canFetchMore(self, parent):
+        """ Reimplemented to allow the adapter to supply rows on demand.
+        """
+        if parent.isValid():
+            return False
+
+        editor = self._editor
+        return editor.adapter.can_fetch_more(editor.object, editor.name)
+
+    def fetchMore(self, parent):
+        """ Reimplemented to let the adapter add the next chunk of rows.
+        """
+        if parent.isValid():
+            return
+
+        editor = self._editor
+        n = self.rowCount(parent)
+        editor.callx(editor.adapter.fetch_more, editor.object, editor.name)
+        added = self.rowCount(parent) - n
+        if added > 0:
+            self.beginInsertRows(parent, n, n + added - 1)
+            self.endInsertRows()
+
     def insertRow(self, row, parent=QtCore.QModelIndex(), obj=None):
         """ Reimplemented to allow creation of new rows. Added an optional
             arg to allow the insertion of an existing row object.
@@ -303,6 +343,62 @@ class TabularModel(QtCore.QAbstractTableModel):
     #  TabularModel interface:
     #---------------------------------------------------------------------------
 
+    def flush_cache(self):
+        """ Discards the prefetched adapter results, so that they are fetched
+            again when next needed.
+        """
+        self._blocks.clear()
+
+    def items_changed(self, event):
+        """ Notifies the views of an in-place change to the edited list,
+            described by the TraitListEvent *event*.
+
+            Contiguous changes are signalled as row insertions, removals and
+            data changes so that the views keep their selection and scroll
+            position. Anything else (e.g. an extended slice assignment) falls
+            back to a full model reset.
+        """
+        index = event.index
+        n_removed = len(event.removed)
+        n_added = len(event.added)
+        n_rows = self.rowCount(None)
+
+        # Extended slices and events whose indices do not match the current
+        # list length (e.g. negative indices) cannot be mapped onto rows:
+        if (not isinstance(index, int) or index < 0 or
+                index + n_added > n_rows or
+                index + n_removed > n_rows - n_added + n_removed):
+            self.reset()
+            return
+
+        n_changed = min(n_removed, n_added)
+        if n_changed > 0:
+            last_column = self.columnCount(None) - 1
+            signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+            self.emit(signal, self.index(index, 0),
+                      self.index(index + n_changed - 1, last_column))
+
+        # The list has already been modified when the event arrives, so each
+        # 'begin' call is immediately followed by its matching 'end' call:
+        first = index + n_changed
+        parent = QtCore.QModelIndex()
+        if n_removed > n_changed:
+            self.beginRemoveRows(parent, first, index + n_removed - 1)
+            self.endRemoveRows()
+        elif n_added > n_changed:
+            self.beginInsertRows(parent, first, index + n_added - 1)
+            self.endInsertRows()
+
+    def rows_changed(self, rows):
+        """ Notifies the views that the contents of the specified rows have
+            changed, using a single signal for each run of consecutive rows.
+        """
+        last_column = self.columnCount(None) - 1
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        for first, last in row_ranges(rows):
+            self.emit(signal, self.index(first, 0),
+                      self.index(last, last_column))
+
     def dropItem(self, item, row):
         """ Handle a Python object being dropped onto a row """
         editor = self._editor
@@ -357,3 +453,64 @@ class TabularModel(QtCore.QAbstractTableModel):
         else:
             editor.setx(selected = objects[0])
             editor.selected_row = new_row
+
+    #---------------------------------------------------------------------------
+    #  Private interface:
+    #---------------------------------------------------------------------------
+
+    def _prefetched(self, method, row, column):
+        """ Returns the result of the bulk adapter method *method* for the
+            specified cell. The results for all of the visible cells are
+            fetched at once and reused until the cache is flushed.
+        """
+        block = self._blocks.get(method)
+        if block is not None:
+            first_row, first_column, values = block
+            i, j = row - first_row, column - first_column
+            if 0 <= i < len(values):
+                values = values[i]
+                if 0 <= j < len(values):
+                    return values[j]
+
+        editor = self._editor
+        visible = self._visible_cells()
+        if visible is None:
+            rows, columns = [row], [column]
+        else:
+            rows, columns = visible
+            if (not (rows[0] <= row <= rows[-1]) or
+                    not (columns[0] <= column <= columns[-1])):
+                # Don't cache cells outside the viewport (e.g. when the view
+                # is measuring column widths):
+                return getattr(editor.adapter, method)(
+                    editor.object, editor.name, [row], [column])[0][0]
+
+        values = getattr(editor.adapter, method)(editor.object, editor.name,
+                                                 rows, columns)
+        self._blocks[method] = (rows[0], columns[0], values)
+        return values[row - rows[0]][column - columns[0]]
+
+    def _visible_cells(self):
+        """ Returns the ranges of row and column indices of the cells visible
+            in the editor's table view, or None if they are unknown.
+        """
+        view = self._editor.control
+        if view is None:
+            return None
+
+        n_rows, n_columns = self.rowCount(None), self.columnCount(None)
+        viewport = view.viewport()
+        first_row = view.rowAt(0)
+        first_column = view.columnAt(0)
+        if first_row < 0 or first_column < 0:
+            return None
+
+        last_row = view.rowAt(viewport.height() - 1)
+        if last_row < 0:
+            last_row = n_rows - 1
+        last_column = view.columnAt(viewport.width() - 1)
+        if last_column < 0:
+            last_column = n_columns - 1
+
+        return (xrange(first_row, last_row + 1),
+                xrange(first_column, last_column + 1))
@@ -27,6 +27,7 @@ from pyface.timer.api import do_later
 from traits.api import Any, Event
 from traits.trait_base import enumerate
 from traitsui.api import TreeNode, ObjectTreeNode, MultiTreeNode
+from traitsui.editors.tree_editor import children_diff, kept_children
 from traitsui.undo import ListUndoItem
 from traitsui.tree_node import ITreeNodeAdapterBridge
 from traitsui.menu import Menu, Action, Separator
@@ -34,6 +35,7 @@ from traitsui.menu import Menu, Action, Separator
 from clipboard import clipboard, PyMimeData
 from editor import Editor
 from helper import pixmap_cache
+from tree_model import TreeModel
 
 logger = logging.getLogger(__name__)
 
@@ -158,10 +160,10 @@ class SimpleEditor ( Editor ):
                     self._editor = editor.control
 
                 # Finally, create only the tree control:
-                self.control = self._tree = _TreeWidget(self)
+                self.control = self._tree = self._create_tree()
             else:
                 # If editable, create a tree control and an editor panel:
-                self._tree = _TreeWidget(self)
+                self._tree = self._create_tree()
 
                 self._editor = sa = QtGui.QScrollArea()
                 sa.setFrameShape(QtGui.QFrame.NoFrame)
@@ -180,7 +182,7 @@ class SimpleEditor ( Editor ):
                 splitter.addWidget(sa)
         else:
             # Otherwise, just create the tree control:
-            self.control = self._tree = _TreeWidget(self)
+            self.control = self._tree = self._create_tree()
 
         # Set up the mapping between objects and tree id's:
         self._map = {}
@@ -196,6 +198,15 @@ class SimpleEditor ( Editor ):
         self.sync_value( factory.dclick,   'dclick', 'to' )
         self.sync_value( factory.veto,     'veto',   'from' )
 
+    #---------------------------------------------------------------------------
+    #  Creates the tree control:
+    #---------------------------------------------------------------------------
+
+    def _create_tree ( self ):
+        """ Creates the tree control.
+        """
+        return _TreeWidget(self)
+
     #---------------------------------------------------------------------------
     #  Handles the 'selection' trait being changed:
     #---------------------------------------------------------------------------
@@ -257,12 +268,18 @@ class SimpleEditor ( Editor ):
             # Stop the chatter (specifically about the changing selection).
             self._tree.blockSignals(True)
 
-            self._delete_node(self._tree.invisibleRootItem())
+            self._release_tree()
 
             self._tree = None
 
         super( SimpleEditor, self ).dispose()
 
+    def _release_tree ( self ):
+        """ Releases all of the nodes of the tree control (and so stops
+            listening to their objects) when the editor is disposed.
+        """
+        self._delete_node(self._tree.invisibleRootItem())
+
     #---------------------------------------------------------------------------
     #  Expands from the specified node the specified number of sub-levels:
     #---------------------------------------------------------------------------
@@ -411,10 +428,20 @@ class SimpleEditor ( Editor ):
             cnid = QtGui.QTreeWidgetItem()
             nid.insertChild(index, cnid)
         if self.factory.word_wrap:
-            item = self.ItemDelegate()
-            item.editor = self
-            self._tree.setItemDelegate(item)
-        else:
+            self._set_item_delegate()
+        self._init_item(cnid, node, object)
+
+        return cnid
+
+    def _set_item_delegate(self):
+        """ Sets the delegate which wraps the text of the items. """
+        item = self.ItemDelegate()
+        item.editor = self
+        self._tree.setItemDelegate(item)
+
+    def _init_item(self, cnid, node, object):
+        """ Sets the label, icon, tooltip and colors of a TreeWidgetItem. """
+        if not self.factory.word_wrap:
             cnid.setText(0, node.get_label(object))
         cnid.setIcon(0, self._get_icon(node, object))
         cnid.setToolTip(0, node.get_tooltip(object))
@@ -425,8 +452,6 @@ class SimpleEditor ( Editor ):
         color = node.get_foreground(object)
         if color : cnid.setForeground(0, self._get_brush(color))
 
-        return cnid
-
     def _set_label(self, nid, text, col=0):
         """ Set the label of the specified item """
         if not self.factory.word_wrap or col!=0:
@@ -450,28 +475,66 @@ class SimpleEditor ( Editor ):
         """ Inserts a new node before a specified index into the children of the
             specified node.
         """
+        return self._insert_nodes( nid, index, [ ( object, node ) ] )[0]
 
-        cnid = self._create_item(nid, node, object, index)
+    #---------------------------------------------------------------------------
+    #  Inserts a list of new nodes to the specified node:
+    #---------------------------------------------------------------------------
 
-        has_children = self._has_children(node, object)
-        self._set_node_data( cnid, ( False, node, object ) )
-        self._map.setdefault( id( object ), [] ).append(
-            ( node.get_children_id(object), cnid ) )
-        self._add_listeners( node, object )
+    def _insert_nodes ( self, nid, index, children ):
+        """ Inserts new nodes for a list of ( object, node ) pairs before a
+            specified index (or at the end if *index* is None) into the
+            children of the specified node, and returns the new node ids.
 
-        # Automatically expand the new node (if requested):
-        if has_children:
-            if node.can_auto_open( object ):
-                cnid.setExpanded(True)
+            The new items are added to the tree with a single call, so that
+            the view only lays out the new rows once.
+        """
+        if len( children ) == 0:
+            return []
+
+        if self.factory.word_wrap:
+            self._set_item_delegate()
+
+        cnids     = []
+        auto_open = []
+        for object, node in children:
+            cnid = QtGui.QTreeWidgetItem()
+            self._init_item( cnid, node, object )
+            self._set_node_data( cnid, ( False, node, object ) )
+
+            # Only add the listeners the first time the object is shown by the
+            # node:
+            info = self._map.setdefault( id( object ), [] )
+            for name, onid in info:
+                if self._get_node_data( onid )[1] is node:
+                    break
             else:
-                # Qt only draws the control that expands the tree if there is a
-                # child.  As the tree is being populated lazily we create a
-                # dummy that will be removed when the node is expanded for the
-                # first time.
-                cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+                self._add_listeners( node, object )
+            info.append( ( node.get_children_id( object ), cnid ) )
 
-        # Return the newly created node:
-        return cnid
+            if self._has_children( node, object ):
+                if node.can_auto_open( object ):
+                    # The node can only be expanded once it is in the tree:
+                    auto_open.append( cnid )
+                else:
+                    # Qt only draws the control that expands the tree if there
+                    # is a child.  As the tree is being populated lazily we
+                    # create a dummy that will be removed when the node is
+                    # expanded for the first time.
+                    cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+            cnids.append( cnid )
+
+        if index is None:
+            nid.addChildren( cnids )
+        else:
+            nid.insertChildren( index, cnids )
+
+        # Automatically expand the new nodes (if requested):
+        for cnid in auto_open:
+            cnid.setExpanded(True)
+
+        # Return the newly created nodes:
+        return cnids
 
     #---------------------------------------------------------------------------
     #  Deletes a specified tree node and all its children:
@@ -480,10 +543,6 @@ class SimpleEditor ( Editor ):
     def _delete_node ( self, nid ):
         """ Deletes a specified tree node and all its children.
         """
-
-        for cnid in self._nodes_for( nid ):
-            self._delete_node( cnid )
-
         # See if it is a dummy.
         pnid = nid.parent()
         if pnid is not None and getattr(pnid, '_dummy', None) is nid:
@@ -491,6 +550,27 @@ class SimpleEditor ( Editor ):
             del pnid._dummy
             return
 
+        self._release_node( nid )
+
+        if pnid is None:
+            self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(nid))
+        else:
+            pnid.removeChild(nid)
+
+    #---------------------------------------------------------------------------
+    #  Releases a specified tree node and all its children:
+    #---------------------------------------------------------------------------
+
+    def _release_node ( self, nid ):
+        """ Removes the object map entries and listeners of a specified tree
+            node and all its children. The children are detached from the node
+            in a single call rather than one at a time, since each removal
+            from a wide node would otherwise shift all of the children after
+            it.
+        """
+        for cnid in nid.takeChildren():
+            self._release_node( cnid )
+
         try:
             expanded, node, object = self._get_node_data(nid)
         except AttributeError:
@@ -509,11 +589,6 @@ class SimpleEditor ( Editor ):
                 self._remove_listeners( node, object )
                 del self._map[ id_object ]
 
-        if pnid is None:
-            self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(nid))
-        else:
-            pnid.removeChild(nid)
-
         # If the deleted node had an active editor panel showing, remove it:
         # Note: QTreeWidgetItem does not have an equal operator, so use id()
         if (self._editor is not None) and (id(nid) == id(self._editor._editor_nid)):
@@ -536,10 +611,8 @@ class SimpleEditor ( Editor ):
                 nid.removeChild(dummy)
                 del nid._dummy
 
-            for child in node.get_children( object ):
-                child, child_node = self._node_for( child )
-                if child_node is not None:
-                    self._append_node( nid, child_node, child )
+            children = self._child_nodes_for( node.get_children( object ) )
+            self._insert_nodes( nid, None, children )
 
             # Indicate the item is now populated:
             self._set_node_data( nid, ( True, node, object) )
@@ -551,7 +624,26 @@ class SimpleEditor ( Editor ):
     def _nodes_for ( self, nid ):
         """ Returns all child node ids of a specified node id.
         """
-        return [nid.child(i) for i in range(nid.childCount())]
+        return [nid.child(i) for i in xrange(nid.childCount())]
+
+    #---------------------------------------------------------------------------
+    #  Returns the ( object, node ) pairs for a list of child objects:
+    #---------------------------------------------------------------------------
+
+    def _child_nodes_for ( self, children ):
+        """ Returns the ( object, node ) pairs for the children in a list of
+            child objects which have a node.
+        """
+        return [ ( child, child_node )
+                 for child, child_node in self._nodes_for_children( children )
+                 if child_node is not None ]
+
+    def _nodes_for_children ( self, children ):
+        """ Returns the ( object, node ) pairs for all of the children in a
+            list of child objects, where the node is None for the children
+            which no node is for.
+        """
+        return [ self._node_for( child ) for child in children ]
 
     #---------------------------------------------------------------------------
     #  Return the index of a specified node id within its parent:
@@ -565,14 +657,14 @@ class SimpleEditor ( Editor ):
             if pnid is None:
                 return ( None, None, None )
 
-        for i in range(pnid.childCount()):
-            if pnid.child(i) is nid:
-                _, pnode, pobject = self._get_node_data( pnid )
-                return ( pnode, pobject, i )
-        else:
+        i = pnid.indexOfChild( nid )
+        if i < 0:
             # doesn't match any node, so return None
             return ( None, None, None )
 
+        _, pnode, pobject = self._get_node_data( pnid )
+        return ( pnode, pobject, i )
+
     #---------------------------------------------------------------------------
     #  Returns whether a specified object has any children:
     #---------------------------------------------------------------------------
@@ -648,7 +740,7 @@ class SimpleEditor ( Editor ):
             node.when_children_changed(  object, self._children_updated,  True )
 
         node.when_label_changed( object, self._label_updated, True )
-        node.when_column_labels_change(object, self._column_labels_updated, False)
+        node.when_column_labels_change(object, self._column_labels_updated, True)
 
     #---------------------------------------------------------------------------
     #  Returns the tree node data for a specified object in the form
@@ -695,8 +787,7 @@ class SimpleEditor ( Editor ):
 
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if node.is_node_for( object ) ]
+        nodes   = factory.nodes_for( object )
 
         # If only one found, we're done, return it:
         if len( nodes ) == 1:
@@ -1506,25 +1597,84 @@ class SimpleEditor ( Editor ):
     def _children_replaced ( self, object, name = '', new = None ):
         """ Handles the children of a node being completely replaced.
         """
-        tree = self._tree
-        for expanded, node, nid in self._object_info_for( object, name ):
-            children = node.get_children( object )
-
-            # Only add/remove the changes if the node has already been expanded:
-            if expanded:
-                # Delete all current child nodes:
-                for cnid in self._nodes_for( nid ):
-                    self._delete_node( cnid )
+        # Restore (rather than enable) updates afterwards, in case this
+        # change happens while another batch of changes is being made:
+        tree    = self._tree
+        updates = tree.updatesEnabled()
+        tree.setUpdatesEnabled(False)
+        try:
+            for expanded, node, nid in self._object_info_for( object, name ):
+                children = node.get_children( object )
 
-                # Add all of the children back in as new nodes:
-                for child in children:
-                    child, child_node = self._node_for( child )
-                    if child_node is not None:
-                        self._append_node( nid, child_node, child )
+                # Only add/remove the changes if the node has already been
+                # expanded:
+                if expanded:
+                    self._replace_child_nodes( nid, children )
 
-            # Try to expand the node (if requested):
-            if node.can_auto_open( object ):
-                nid.setExpanded(True)
+                # Try to expand the node (if requested):
+                if node.can_auto_open( object ):
+                    nid.setExpanded(True)
+        finally:
+            tree.setUpdatesEnabled(updates)
+
+    def _replace_child_nodes ( self, nid, children ):
+        """ Updates the child nodes of a node for a new list of children. The
+            nodes of the children which are still present are kept (together
+            with the expansion state of their subtrees). Only the nodes outside
+            the largest set of children whose order is unchanged are moved, so
+            that only the differences are removed, moved and inserted.
+        """
+        new_nodes = self._child_nodes_for( children )
+        old_nids  = self._nodes_for( nid )
+        removed, order = children_diff(
+            [ self._get_node_data( cnid )[2] for cnid in old_nids ],
+            [ child for child, child_node in new_nodes ] )
+
+        for i in removed:
+            self._delete_node( old_nids[ i ] )
+
+        # Take out the nodes of the children which must move, leaving the
+        # others in their new order:
+        kept  = kept_children( order )
+        moved = {}
+        for old_index in order:
+            if old_index is not None and old_index not in kept:
+                cnid = old_nids[ old_index ]
+                moved[ old_index ] = ( cnid, self._expanded_nodes( cnid ) )
+                nid.takeChild( nid.indexOfChild( cnid ) )
+
+        # Put them back in place, and insert each run of new children at once:
+        first = None
+        for i, old_index in enumerate( order + [ -1 ] ):
+            if old_index is None:
+                if first is None:
+                    first = i
+                continue
+
+            if first is not None:
+                self._insert_nodes( nid, first, new_nodes[ first: i ] )
+                first = None
+
+            if old_index in moved:
+                cnid, expanded = moved[ old_index ]
+                nid.insertChild( i, cnid )
+                for snid in expanded:
+                    snid.setExpanded( True )
+
+    def _expanded_nodes ( self, cnid ):
+        """ Returns the node *cnid* and those of its descendants which are
+            expanded (and shown), so that they can be expanded again after the
+            node is moved.
+        """
+        expanded = []
+        pending  = [ cnid ]
+        while pending:
+            snid = pending.pop()
+            if snid.isExpanded():
+                expanded.append( snid )
+                pending.extend( self._nodes_for( snid ) )
+
+        return expanded
 
     #---------------------------------------------------------------------------
     #  Handles the children of a node being changed:
@@ -1540,39 +1690,41 @@ class SimpleEditor ( Editor ):
 
         # Get information about the node that was changed:
         start = event.index
-        n     = len( event.added )
         end   = start + len( event.removed )
         tree  = self._tree
 
-        for expanded, node, nid in self._object_info_for( object, name ):
-            children = node.get_children( object )
-
-            # If the new children aren't all at the end, remove/add them all:
-            #if (n > 0) and ((start + n) != len( children )):
-            #    self._children_replaced( object, name, event )
-            #    return
+        # Only look up the nodes of the added children once:
+        added = None
 
-            # Only add/remove the changes if the node has already been expanded:
-            if expanded:
-                # Remove all of the children that were deleted:
-                for cnid in self._nodes_for( nid )[ start: end ]:
-                    self._delete_node( cnid )
-
-                remaining = len( children ) - len( event.removed )
-                child_index = 0
-                # Add all of the children that were added:
-                for child in event.added:
-                    child, child_node = self._node_for( child )
-                    if child_node is not None:
-                        insert_index = (start + child_index) if \
-                                        (start <= remaining) else None
-                        self._insert_node( nid, insert_index, child_node,
-                                        child )
-                        child_index += 1
-
-            # Try to expand the node (if requested):
-            if node.can_auto_open( object ):
-                nid.setExpanded(True)
+        # Restore (rather than enable) updates afterwards, as for
+        # _children_replaced:
+        updates = tree.updatesEnabled()
+        tree.setUpdatesEnabled(False)
+        try:
+            for expanded, node, nid in self._object_info_for( object, name ):
+                children = node.get_children( object )
+
+                # Only add/remove the changes if the node has already been
+                # expanded:
+                if expanded:
+                    # Remove all of the children that were deleted (from the
+                    # last, so that the indices of the others do not change):
+                    for i in xrange( min( end, nid.childCount() ) - 1,
+                                     start - 1, -1 ):
+                        self._delete_node( nid.child( i ) )
+
+                    # Add all of the children that were added:
+                    if added is None:
+                        added = self._child_nodes_for( event.added )
+                    remaining = len( children ) - len( event.removed )
+                    self._insert_nodes( nid,
+                        start if start <= remaining else None, added )
+
+                # Try to expand the node (if requested):
+                if node.can_auto_open( object ):
+                    nid.setExpanded(True)
+        finally:
+            tree.setUpdatesEnabled(updates)
 
     #---------------------------------------------------------------------------
     #   Handles the label of an object being changed:
@@ -1653,6 +1805,316 @@ class SimpleEditor ( Editor ):
 
 #-- End UI preference save/restore interface -----------------------------------
 
+#-------------------------------------------------------------------------------
+#  'VirtualTreeEditor' class:
+#-------------------------------------------------------------------------------
+
+class VirtualTreeEditor ( SimpleEditor ):
+    """ Tree editor which displays the tree using a TreeModel, so that only
+        the visible rows of the tree are created and asked for their labels
+        and icons. Used when the factory's 'virtual' trait is True.
+
+        Items are only created for the rows a view asks for, so listeners are
+        only added to objects which have been shown. Context menus, drag and
+        drop, and the expansion of children of nodes with auto_open set are
+        not supported.
+    """
+
+    #---------------------------------------------------------------------------
+    #  SimpleEditor interface:
+    #---------------------------------------------------------------------------
+
+    def expand_levels ( self, nid, levels, expand = True ):
+        """ Expands from the specified node the specified number of sub-levels.
+        """
+        if levels > 0:
+            model = self._tree.model()
+            if self._has_children( nid.node, nid.object ):
+                if expand:
+                    self._tree.expand( model.index_for( nid ) )
+                for row in xrange( len( model.children_of( nid ) ) ):
+                    cnid = model.child_item( nid, row )
+                    if cnid is not None:
+                        self.expand_levels( cnid, levels - 1 )
+
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+
+        model   = tree.model()
+        factory = self.factory
+        object, node = self._node_for( self.value )
+        model.set_root( object, node, factory.hide_root )
+
+        if node is not None:
+            nid = model.root
+            if not factory.hide_root:
+                nid = model.child_item( nid, 0 )
+                index = model.index_for( nid )
+                if self._has_children( node, object ):
+                    tree.expand( index )
+                tree.setCurrentIndex( index )
+
+            self.expand_levels( nid, factory.auto_open, False )
+
+        for i in range( model.columnCount() ):
+            tree.resizeColumnToContents( i )
+
+    def _create_tree ( self ):
+        """ Creates the tree control.
+        """
+        return _TreeView(self)
+
+    def _release_tree ( self ):
+        """ Releases all of the items of the tree model when the editor is
+            disposed.
+        """
+        self._tree.model().clear()
+
+    def _selection_changed ( self, selection ):
+        """ Handles the **selection** event. Objects which have not been shown
+            in the tree yet are not selected.
+        """
+        tree  = self._tree
+        model = tree.model()
+        if (isinstance( selection, basestring ) or
+            not isinstance( selection, collections.Iterable )):
+            selection = [ selection ]
+
+        item_selection = QtGui.QItemSelection()
+        current = None
+        for sel in selection:
+            info = self._map.get( id( sel ) )
+            if info:
+                current = model.index_for( info[0][1] )
+                item_selection.select( current, current )
+
+        tree.selectionModel().select( item_selection,
+            QtGui.QItemSelectionModel.ClearAndSelect |
+            QtGui.QItemSelectionModel.Rows )
+        if current is not None and self.factory.selection_mode == 'single':
+            tree.setCurrentIndex( current )
+
+    @staticmethod
+    def _get_node_data ( nid ):
+        """ Gets the node specific data.
+        """
+        return ( nid.children is not None, nid.node, nid.object )
+
+    def _on_item_expanded ( self, nid ):
+        """ Handles a tree node being expanded.
+        """
+        node, object = nid.node, nid.object
+
+        # If 'auto_close' requested for this node type, close all of the node's
+        # siblings that have been shown:
+        if node.can_auto_close( object ):
+            model = self._tree.model()
+            for snid in nid.parent().items.values():
+                if snid is not nid:
+                    self._tree.collapse( model.index_for( snid ) )
+
+        self._update_icon( nid )
+
+    def _update_icon ( self, nid ):
+        """ Updates the icon for a specified node.
+        """
+        self._tree.model().item_changed( nid )
+
+    #---------------------------------------------------------------------------
+    #  TreeModel callbacks:
+    #---------------------------------------------------------------------------
+
+    def _item_created ( self, nid ):
+        """ Adds an item created by the model to the object map, and listens
+            to its object.
+        """
+        node, object = nid.node, nid.object
+        self._map.setdefault( id( object ), [] ).append(
+            ( node.get_children_id( object ), nid ) )
+        self._add_listeners( node, object )
+
+    def _item_released ( self, nid ):
+        """ Removes an item released by the model from the object map, and
+            stops listening to its object if it has no other items.
+        """
+        node, object = nid.node, nid.object
+        id_object   = id( object )
+        object_info = self._map.get( id_object, [] )
+        for i, info in enumerate( object_info ):
+            if info[1] is nid:
+                del object_info[i]
+                break
+
+        if len( object_info ) == 0:
+            self._remove_listeners( node, object )
+            self._map.pop( id_object, None )
+
+        # If the released node had an active editor panel showing, remove it:
+        if (self._editor is not None) and (self._editor._editor_nid is nid):
+            self._clear_editor()
+
+    #---------------------------------------------------------------------------
+    #  Model event handlers:
+    #---------------------------------------------------------------------------
+
+    def _children_replaced ( self, object, name = '', new = None ):
+        """ Handles the children of a node being completely replaced.
+        """
+        model = self._tree.model()
+        for expanded, node, nid in self._object_info_for( object, name ):
+            if expanded:
+                children = []
+                if node.allows_children( object ):
+                    children = self._nodes_for_children(
+                                   node.get_children( object ) )
+                model.set_children( nid, children )
+            model.item_changed( nid )
+
+    def _children_updated ( self, object, name, event ):
+        """ Handles the children of a node being changed.
+        """
+        # Log the change that was made made (removing '_items' from the end of
+        # the name):
+        name = name[:-6]
+        self.log_change( self._get_undo_item, object, name, event )
+
+        if not isinstance( event.index, int ):
+            self._children_replaced( object, name )
+            return
+
+        model = self._tree.model()
+        added = self._nodes_for_children( event.added )
+        for expanded, node, nid in self._object_info_for( object, name ):
+            if expanded:
+                model.replace_children( nid, event.index, len( event.removed ),
+                                        added )
+            model.item_changed( nid )
+
+    def _node_index ( self, nid ):
+        """ Returns the node and object of the parent of an item, and the index
+            of the item within it.
+        """
+        pnid = nid.parent()
+        if pnid is None or (pnid is self._tree.invisibleRootItem() and
+                            not self.factory.hide_root):
+            return ( None, None, None )
+
+        return ( pnid.node, pnid.object, nid.row )
+
+    def _label_updated ( self, object, name, label ):
+        """  Handles the label of an object being changed.
+        """
+        model = self._tree.model()
+        for name2, nid in self._map.get( id( object ), [] ):
+            model.item_changed( nid )
+
+    _column_labels_updated = _label_updated
+
+#-------------------------------------------------------------------------------
+#  '_TreeView' class:
+#-------------------------------------------------------------------------------
+
+class _TreeView(QtGui.QTreeView):
+    """ The tree view used by the VirtualTreeEditor. It provides the few
+        QTreeWidget methods the SimpleEditor relies on, in terms of the
+        TreeModel's items.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree view.
+        """
+        QtGui.QTreeView.__init__(self, parent)
+
+        factory = editor.factory
+        self.setModel(TreeModel(editor, self))
+
+        # Allows the view to lay out the rows without asking for all of them:
+        self.setUniformRowHeights(True)
+        self.setHeaderHidden(len(factory.column_headers) == 0)
+        self.setAlternatingRowColors(factory.alternating_row_colors)
+        self.setExpandsOnDoubleClick(factory.expands_on_dclick)
+        padding = factory.vertical_padding
+        if padding > 0:
+            self.setStyleSheet("""
+            QTreeView::item {
+                padding-top: %spx;
+                padding-bottom: %spx;
+            }
+            """ % (padding, padding))
+
+        if factory.selection_mode == 'extended':
+            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        self.expanded.connect(self._on_expanded)
+        self.collapsed.connect(self._on_collapsed)
+        self.clicked.connect(self._on_clicked)
+        self.doubleClicked.connect(self._on_dclicked)
+        self.activated.connect(self._on_activated)
+        self.selectionModel().selectionChanged.connect(
+            self._on_selection_changed)
+
+        self._editor = editor
+
+    #---------------------------------------------------------------------------
+    #  QTreeWidget methods used by the SimpleEditor:
+    #---------------------------------------------------------------------------
+
+    def invisibleRootItem(self):
+        """ Returns the (hidden) root item of the tree.
+        """
+        return self.model().root
+
+    def itemFromIndex(self, index):
+        """ Returns the item for a model index.
+        """
+        return self.model().item_for(index)
+
+    def indexFromItem(self, item, column=0):
+        """ Returns the model index of an item.
+        """
+        return self.model().index_for(item, column)
+
+    def selectedItems(self):
+        """ Returns the selected items.
+        """
+        return [ self.itemFromIndex(index)
+                 for index in self.selectionModel().selectedRows() ]
+
+    def setCurrentItem(self, item):
+        """ Makes an item the current item.
+        """
+        self.setCurrentIndex(self.indexFromItem(item))
+
+    #---------------------------------------------------------------------------
+    #  Signal handlers:
+    #---------------------------------------------------------------------------
+
+    def _on_expanded(self, index):
+        self._editor._on_item_expanded(self.itemFromIndex(index))
+
+    def _on_collapsed(self, index):
+        self._editor._on_item_collapsed(self.itemFromIndex(index))
+
+    def _on_clicked(self, index):
+        self._editor._on_item_clicked(self.itemFromIndex(index),
+                                      index.column())
+
+    def _on_dclicked(self, index):
+        self._editor._on_item_dclicked(self.itemFromIndex(index),
+                                       index.column())
+
+    def _on_activated(self, index):
+        self._editor._on_item_activated(self.itemFromIndex(index),
+                                        index.column())
+
+    def _on_selection_changed(self, selected, deselected):
+        self._editor._on_tree_sel_changed()
+
 #-------------------------------------------------------------------------------
 #  '_TreeWidget' class:
 #-------------------------------------------------------------------------------
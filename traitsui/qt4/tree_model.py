@@ -0,0 +1,393 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the item model used by the virtual (model/view) tree editor.
+
+    The model only asks the tree nodes about the rows a view actually asks
+    for: the children of an object are fetched when its row count is first
+    needed (i.e. when it is expanded), and an item is only created for a child
+    when the view asks for its index.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from bisect import bisect_left
+
+from pyface.qt import QtCore
+
+#-------------------------------------------------------------------------------
+#  'TreeItem' class:
+#-------------------------------------------------------------------------------
+
+class TreeItem(object):
+    """ A node of the tree shown by a TreeModel. Items are only created for
+        the rows a view has asked for.
+    """
+
+    __slots__ = ('_parent', 'row', 'object', 'node', 'children', 'indices',
+                 'items')
+
+    def __init__(self, parent, row, object, node):
+        """ Initialise the object.
+        """
+        self._parent = parent
+        self.row = row
+        self.object = object
+        self.node = node
+
+        # The ( object, node ) pairs of the children which have a node, or None
+        # if they have not been fetched yet:
+        self.children = None
+
+        # The indices in the list of children of the children which are shown
+        # (one for each row), or None if every child is shown:
+        self.indices = None
+
+        # The items created for the children so far, keyed by row:
+        self.items = {}
+
+    def parent(self):
+        """ Returns the parent item, or None for the root item.
+        """
+        return self._parent
+
+#-------------------------------------------------------------------------------
+#  'TreeModel' class:
+#-------------------------------------------------------------------------------
+
+class TreeModel(QtCore.QAbstractItemModel):
+    """ The model for a virtual tree editor.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractItemModel.__init__(self, parent)
+
+        self._editor = editor
+        self.root = TreeItem(None, 0, None, None)
+        self.root.children = []
+
+    #---------------------------------------------------------------------------
+    #  QAbstractItemModel interface:
+    #---------------------------------------------------------------------------
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """ Reimplemented to create the item for a row when it is first asked
+            for.
+        """
+        if row < 0 or column < 0:
+            return QtCore.QModelIndex()
+
+        item = self.child_item(self.item_for(parent), row)
+        if item is None:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column, item)
+
+    def parent(self, index):
+        """ Reimplemented to return the index of the parent item.
+        """
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.index_for(index.internalPointer().parent())
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of children, fetching them if
+            needed.
+        """
+        if parent.column() > 0:
+            return 0
+
+        return len(self.children_of(self.item_for(parent)))
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of columns.
+        """
+        return max(1, len(self._editor.factory.column_headers))
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to ask the node, so that the children of an object
+            are not fetched until it is expanded.
+        """
+        item = self.item_for(parent)
+        if item.children is not None:
+            return len(item.children) > 0
+
+        return self._editor._has_children(item.node, item.object)
+
+    def data(self, index, role):
+        """ Reimplemented to return the data for an item.
+        """
+        item = index.internalPointer()
+        node, object = item.node, item.object
+        column = index.column()
+        editor = self._editor
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return node.get_label(object)
+
+            labels = node.get_column_labels(object)
+            if column <= len(labels):
+                return labels[column - 1]
+
+            return None
+
+        # The remaining roles only apply to the first column:
+        if column != 0:
+            return None
+
+        if role == QtCore.Qt.DecorationRole:
+            return editor._get_icon(node, object,
+                                    editor._tree.isExpanded(index))
+
+        elif role == QtCore.Qt.ToolTipRole:
+            return node.get_tooltip(object)
+
+        elif role == QtCore.Qt.BackgroundRole:
+            color = node.get_background(object)
+            if color:
+                return editor._get_brush(color)
+
+        elif role == QtCore.Qt.ForegroundRole:
+            color = node.get_foreground(object)
+            if color:
+                return editor._get_brush(color)
+
+        return None
+
+    def flags(self, index):
+        """ Reimplemented to return the flags for an item.
+        """
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role):
+        """ Reimplemented to return the column headers.
+        """
+        headers = self._editor.factory.column_headers
+        if (orientation == QtCore.Qt.Horizontal and
+            role == QtCore.Qt.DisplayRole and section < len(headers)):
+            return headers[section]
+
+        return None
+
+    #---------------------------------------------------------------------------
+    #  TreeModel interface:
+    #---------------------------------------------------------------------------
+
+    def item_for(self, index):
+        """ Returns the item for a model index.
+        """
+        if index.isValid():
+            return index.internalPointer()
+
+        return self.root
+
+    def index_for(self, item, column=0):
+        """ Returns the model index of an item.
+        """
+        if item is None or item is self.root:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(item.row, column, item)
+
+    def children_of(self, item):
+        """ Returns the ( object, node ) pairs of the children of an item,
+            fetching them from its node the first time they are needed.
+            Children which no node is for are not shown, so are left out.
+        """
+        if item.children is None:
+            item.children = []
+            node, object = item.node, item.object
+            if node.allows_children(object):
+                nodes = self._editor._nodes_for_children(
+                    node.get_children(object))
+                item.children = [pair for pair in nodes if pair[1] is not None]
+                if len(item.children) < len(nodes):
+                    item.indices = [i for i, pair in enumerate(nodes)
+                                    if pair[1] is not None]
+
+        return item.children
+
+    def child_item(self, item, row):
+        """ Returns the item for a row of the children of an item, creating
+            it if needed, or None if there is no such row.
+        """
+        child = item.items.get(row)
+        if child is None:
+            children = self.children_of(item)
+            if row >= len(children):
+                return None
+
+            object, node = children[row]
+            item.items[row] = child = TreeItem(item, row, object, node)
+            self._editor._item_created(child)
+
+        return child
+
+    def set_root(self, object, node, hide_root):
+        """ Replaces the whole tree with the tree for a root object. If
+            *hide_root* is False, the root object is the single top level item.
+        """
+        self.beginResetModel()
+        self._release(self.root)
+        if hide_root:
+            self.root = TreeItem(None, 0, object, node)
+            self._editor._item_created(self.root)
+        else:
+            self.root = TreeItem(None, 0, None, None)
+            self.root.children = []
+            if node is not None:
+                self.root.children.append((object, node))
+        self.endResetModel()
+
+    def clear(self):
+        """ Removes all items, releasing them.
+        """
+        self.set_root(None, None, False)
+
+    def replace_children(self, item, index, n_removed, added):
+        """ Replaces the *n_removed* children of an item starting at *index* in
+            its list of children with a list of ( object, node ) pairs, where
+            the node is None for the children which no node is for (and which
+            are not shown), notifying the views of the rows removed and
+            inserted. Nothing needs to be done if the children of the item have
+            not been fetched yet.
+        """
+        if item.children is None:
+            return
+
+        # Once some children are not shown, the rows are not the indices:
+        if item.indices is None and None in [node for object, node in added]:
+            item.indices = range(len(item.children))
+
+        row    = self._row_for(item, index)
+        n_rows = self._row_for(item, index + n_removed) - row
+        if n_rows > 0:
+            self.beginRemoveRows(self.index_for(item), row, row + n_rows - 1)
+            del item.children[row: row + n_rows]
+            if item.indices is not None:
+                del item.indices[row: row + n_rows]
+            self._shift_items(item, row, n_rows, 0)
+            self.endRemoveRows()
+
+        self._insert_children(item, row, index, added,
+                              len(added) - n_removed)
+
+    def set_children(self, item, nodes):
+        """ Replaces all of the children of an item with a list of ( object,
+            node ) pairs, as for **replace_children**.
+        """
+        if item.children is None:
+            return
+
+        n_rows = len(item.children)
+        if n_rows > 0:
+            self.beginRemoveRows(self.index_for(item), 0, n_rows - 1)
+            item.children = []
+            item.indices = None
+            self._shift_items(item, 0, n_rows, 0)
+            self.endRemoveRows()
+
+        if None in [node for object, node in nodes]:
+            item.indices = []
+        self._insert_children(item, 0, 0, nodes)
+
+    def item_changed(self, item):
+        """ Notifies the views that the data of an item has changed.
+        """
+        if item is self.root:
+            return
+
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        self.emit(signal, self.index_for(item),
+                  self.index_for(item, self.columnCount() - 1))
+
+    def walk(self, item=None):
+        """ Returns an iterator over an item and all of the items created
+            below it.
+        """
+        if item is None:
+            item = self.root
+
+        yield item
+        for child in item.items.values():
+            for descendant in self.walk(child):
+                yield descendant
+
+    #---------------------------------------------------------------------------
+    #  Private interface:
+    #---------------------------------------------------------------------------
+
+    def _row_for(self, item, index):
+        """ Returns the row of the first child shown at or after an index in
+            the list of children of an item.
+        """
+        if item.indices is None:
+            return min(index, len(item.children))
+
+        return bisect_left(item.indices, index)
+
+    def _insert_children(self, item, row, index, nodes, shift=0):
+        """ Inserts the rows for the children shown from a list of ( object,
+            node ) pairs inserted at *index* in the list of children of an item
+            (shown from *row*), after which the indices of the later children
+            have changed by *shift*.
+        """
+        children = [pair for pair in nodes if pair[1] is not None]
+        indices  = item.indices
+        if indices is not None:
+            indices[row: row] = [index + i for i, pair in enumerate(nodes)
+                                 if pair[1] is not None]
+            if shift != 0:
+                for i in xrange(row + len(children), len(indices)):
+                    indices[i] += shift
+
+        if len(children) > 0:
+            self.beginInsertRows(self.index_for(item), row,
+                                 row + len(children) - 1)
+            item.children[row: row] = children
+            self._shift_items(item, row, 0, len(children))
+            self.endInsertRows()
+
+    def _shift_items(self, item, index, n_removed, n_added):
+        """ Updates the items created for the children of an item after the
+            *n_removed* children starting at *index* are replaced by
+            *n_added* children.
+        """
+        items = {}
+        for row, child in item.items.iteritems():
+            if row < index:
+                items[row] = child
+            elif row >= index + n_removed:
+                child.row = row - n_removed + n_added
+                items[child.row] = child
+            else:
+                self._release(child)
+        item.items = items
+
+    def _release(self, item):
+        """ Releases an item and all of the items below it.
+        """
+        for descendant in list(self.walk(item)):
+            if descendant.object is not None or descendant.node is not None:
+                self._editor._item_released(descendant)
+        item.items = {}
@@ -26,9 +26,16 @@
 from __future__ import absolute_import
 
 from traits.api import (Any, Bool, Callable, Color, Constant, Either, Enum,
-    Expression, Float, Font, HasPrivateTraits, Instance, Int, Property, Str)
+    Expression, Float, Font, HasPrivateTraits, HasTraits, Instance, Int, List,
+    Property, Str)
 
-from traits.trait_base import user_name_for, xgetattr
+from traits.trait_base import user_name_for
+
+from functools import cmp_to_key
+from operator import attrgetter
+from weakref import WeakKeyDictionary, ref
+
+from .helper import code_names, overrides
 
 from .editor_factory import EditorFactory
 from .menu import Menu
@@ -369,6 +376,30 @@ class TableColumn ( HasPrivateTraits ):
         """
         pass
 
+    #---------------------------------------------------------------------------
+    #  Returns the key used to sort the column for a specified object:
+    #---------------------------------------------------------------------------
+
+    def get_sort_key ( self, object ):
+        """ Returns the key used to sort the column for a specified object.
+            By default the key wraps the column's 'cmp' method, so subclasses
+            which only override 'cmp' still sort correctly.
+        """
+        return cmp_to_key( self.cmp )( object )
+
+    #---------------------------------------------------------------------------
+    #  Returns the sort keys of the column for a list of objects:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the sort keys of the column for each of a list of objects.
+            The result may also be a numpy array, in which case it is sorted
+            as an array.
+        """
+        get_sort_key = self.get_sort_key
+
+        return [ get_sort_key( object ) for object in objects ]
+
     #---------------------------------------------------------------------------
     #  Returns the string representation of the table column:
     #---------------------------------------------------------------------------
@@ -408,6 +439,13 @@ class ObjectColumn ( TableColumn ):
     # Format function to apply to column values:
     format_func = Callable
 
+    # The compiled getter for the (possibly dotted) trait name:
+    _getter = Any( transient = True )
+
+    # The compiled getter for the object containing the trait, and the
+    # (undotted) trait name:
+    _target = Any( transient = True )
+
     #---------------------------------------------------------------------------
     #  Trait view definitions:
     #---------------------------------------------------------------------------
@@ -456,7 +494,7 @@ class ObjectColumn ( TableColumn ):
         """ Gets the unformatted value of the column for a specified object.
         """
         try:
-            return xgetattr( self.get_object( object ), self.name )
+            return self._get_getter()( self.get_object( object ) )
         except:
             return None
 
@@ -525,6 +563,39 @@ class ObjectColumn ( TableColumn ):
         return cmp( self.get_raw_value( object1 ),
                     self.get_raw_value( object2 ) )
 
+    #---------------------------------------------------------------------------
+    #  Returns the key used to sort the column for a specified object:
+    #---------------------------------------------------------------------------
+
+    def get_sort_key ( self, object ):
+        """ Returns the key used to sort the column for a specified object.
+        """
+        if overrides( self, 'cmp', ObjectColumn ):
+            return super( ObjectColumn, self ).get_sort_key( object )
+
+        return self.get_raw_value( object )
+
+    #---------------------------------------------------------------------------
+    #  Returns the sort keys of the column for a list of objects:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the sort keys of the column for each of a list of objects.
+        """
+        if ((self.name == '') or
+            overrides( self, 'cmp', ObjectColumn ) or
+            overrides( self, 'get_raw_value', ObjectColumn ) or
+            overrides( self, 'get_object', TableColumn )):
+            return super( ObjectColumn, self ).get_sort_keys( objects )
+
+        # Fetch all of the values with the compiled getter, falling back to
+        # the (exception safe) per object lookup if any of them fail:
+        getter = self._get_getter()
+        try:
+            return [ getter( object ) for object in objects ]
+        except:
+            return super( ObjectColumn, self ).get_sort_keys( objects )
+
     #---------------------------------------------------------------------------
     #  Returns whether a specified value is valid for dropping on the column
     #  for a specified object:
@@ -552,12 +623,43 @@ class ObjectColumn ( TableColumn ):
         """ Returns the target object and name for the column.
         """
         object = self.get_object( object )
-        name   = self.name
-        col    = name.rfind( '.' )
-        if col < 0:
+        target = self._target
+        if target is None:
+            name = self.name
+            col  = name.rfind( '.' )
+            if col < 0:
+                target = ( None, name )
+            else:
+                target = ( attrgetter( name[ :col ] ), name[ col + 1: ] )
+            self._target = target
+
+        getter, name = target
+        if getter is None:
             return ( object, name )
 
-        return ( xgetattr( object, name[ :col ] ), name[ col + 1: ] )
+        return ( getter( object ), name )
+
+    #---------------------------------------------------------------------------
+    #  Returns the compiled getter for the trait name:
+    #---------------------------------------------------------------------------
+
+    def _get_getter ( self ):
+        """ Returns the compiled getter for the (possibly dotted) trait name.
+        """
+        getter = self._getter
+        if getter is None:
+            self._getter = getter = attrgetter( self.name )
+
+        return getter
+
+    #---------------------------------------------------------------------------
+    #  Handles the 'name' trait being changed:
+    #---------------------------------------------------------------------------
+
+    def _name_changed ( self ):
+        """ Handles a change to the **name** trait.
+        """
+        self._getter = self._target = None
 
 #-------------------------------------------------------------------------------
 #  'ExpressionColumn' class:
@@ -580,6 +682,17 @@ class ExpressionColumn ( ObjectColumn ):
     # The globals dictionary that should be passed to the expression evaluation:
     globals = Any( {} )
 
+    # Should the value of the expression be cached for each object? A cached
+    # value is discarded when one of the traits listed in **depends_on**
+    # changes on the object:
+    cached = Bool( False )
+
+    # The (possibly extended) names of the traits of each object that the
+    # value of the expression depends on. If empty, the traits of the object
+    # named in the expression are used (which does not include the traits of
+    # any objects they refer to):
+    depends_on = List( Str )
+
     #---------------------------------------------------------------------------
     #  Gets the value of the column for a specified object:
     #---------------------------------------------------------------------------
@@ -587,13 +700,125 @@ class ExpressionColumn ( ObjectColumn ):
     def get_raw_value ( self, object ):
         """ Gets the unformatted value of the column for a specified object.
         """
+        if self.cached and isinstance( object, HasTraits ):
+            cache = self._values
+            if cache is None:
+                self._values = cache = WeakKeyDictionary()
+            try:
+                return cache[ object ]
+            except KeyError:
+                pass
+
         try:
-            return eval( self.expression_, self.globals, { 'object': object } )
+            value = self._get_function()( object )
         except:
             logger.exception( 'Error evaluating table column expression: %s' %
                               self.expression )
             return None
 
+        if self.cached and isinstance( object, HasTraits ):
+            self._watch( object, cache )
+            cache[ object ] = value
+
+        return value
+
+    #---------------------------------------------------------------------------
+    #  Discards the cached values:
+    #---------------------------------------------------------------------------
+
+    def flush_cache ( self ):
+        """ Discards all of the cached values of the expression.
+        """
+        watched = self._watched
+        if watched is not None:
+            for object, ( names, handler ) in watched.items():
+                for name in names:
+                    object.on_trait_change( handler, name, remove = True )
+        self._values = self._watched = None
+
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _get_function ( self ):
+        """ Returns the expression compiled as a function of the object.
+        """
+        function = self._function
+        if function is None:
+            try:
+                function = eval( 'lambda object: (%s)' % self.expression,
+                                 self.globals )
+            except SyntaxError:
+                code, globals = self.expression_, self.globals
+                function = lambda object: eval( code, globals,
+                                                { 'object': object } )
+            self._function = function
+
+        return function
+
+    def _watch ( self, object, values ):
+        """ Listens for changes to the traits of an object that its cached
+            value in *values* depends on.
+        """
+        watched = self._watched
+        if watched is None:
+            self._watched = watched = WeakKeyDictionary()
+        elif object in watched:
+            return
+
+        names = self.depends_on
+        if len( names ) == 0:
+            referenced = code_names( self.expression_ )
+            names = [ name for name in object.trait_names()
+                      if name in referenced ]
+
+        # The handler only refers weakly to the object, so that it does not
+        # keep it (or its key in the weak dictionaries) alive:
+        object_ref = ref( object )
+
+        def handler ( ):
+            object = object_ref()
+            if object is not None:
+                values.pop( object, None )
+
+        for name in names:
+            object.on_trait_change( handler, name )
+        watched[ object ] = ( names, handler )
+
+    #---------------------------------------------------------------------------
+    #  Handles the expression or its dependencies being changed:
+    #---------------------------------------------------------------------------
+
+    def _expression_changed ( self ):
+        self._function = None
+        self.flush_cache()
+
+    def _globals_changed ( self ):
+        self._expression_changed()
+
+    def _depends_on_changed ( self ):
+        self.flush_cache()
+
+    def _depends_on_items_changed ( self ):
+        self.flush_cache()
+
+    def _cached_changed ( self ):
+        self.flush_cache()
+
+    #---------------------------------------------------------------------------
+    #  Returns the state to be pickled (override of object):
+    #---------------------------------------------------------------------------
+
+    def __getstate__ ( self ):
+        """ Returns the state to be pickled.
+
+        This definition overrides **object**.
+        """
+        dict = super( ExpressionColumn, self ).__getstate__()
+        for name in ( '_function', '_values', '_watched' ):
+            dict.pop( name, None )
+        return dict
+
 #-------------------------------------------------------------------------------
 #  'NumericColumn' class:
 #-------------------------------------------------------------------------------
@@ -783,6 +1008,32 @@ class NumericColumn ( ObjectColumn ):
         """
         return getattr( object, self.name )
 
+    #---------------------------------------------------------------------------
+    #  Returns the sort keys of the column for a list of objects:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the sort keys of the column for each of a list of objects.
+            Numeric keys are returned as a numpy array when numpy is
+            available, so that they can be sorted without comparing them one
+            pair at a time.
+        """
+        keys = super( NumericColumn, self ).get_sort_keys( objects )
+        try:
+            import numpy
+        except ImportError:
+            return keys
+
+        try:
+            array = numpy.array( keys )
+        except:
+            return keys
+
+        if (array.ndim == 1) and (array.dtype.kind in 'biuf'):
+            return array
+
+        return keys
+
     #---------------------------------------------------------------------------
     #  Returns whether a specified object row is selected or not:
     #---------------------------------------------------------------------------
@@ -24,12 +24,15 @@
 
 from __future__ import absolute_import
 
+import operator
+
 from traits.api import (Any, Bool, Callable, Enum, Event, Expression, HasPrivateTraits,
     Instance, List, Str, Trait)
 
 from .editor_factory import EditorFactory
 from .editors.api import EnumEditor
 from .group import Group
+from .helper import code_names, overrides
 from .include import Include
 from .item import Item
 from .menu import Action
@@ -52,6 +55,30 @@ GenericTableFilterRuleOperation = Trait( '=', {
     'ends with':   'ends_with'
 } )
 
+# The rule operations that can be applied to a whole array of numbers at once:
+VectorOperations = ( 'eq', 'ne', 'lt', 'le', 'gt', 'ge' )
+
+# The value types which can be compared as arrays of numbers:
+VectorTypes = ( int, long, float, bool )
+
+#-------------------------------------------------------------------------------
+#  Returns the values of a trait for a list of objects:
+#-------------------------------------------------------------------------------
+
+def _column ( columns, objects, name ):
+    """ Returns the list of the values of the trait called *name* for each of
+        a list of objects, or None if any of the objects does not have it.
+        The result is saved in the dictionary *columns*, so that each trait is
+        only fetched once when it is used by several rules.
+    """
+    if name not in columns:
+        try:
+            columns[ name ] = [ getattr( object, name ) for object in objects ]
+        except:
+            columns[ name ] = None
+
+    return columns[ name ]
+
 #-------------------------------------------------------------------------------
 #  'TableFilter' class:
 #-------------------------------------------------------------------------------
@@ -134,6 +161,20 @@ class TableFilter ( HasPrivateTraits ):
         """
         return self.allowed( object )
 
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_many ( self, objects ):
+        """ Returns a list containing the result of the filter for each of a
+        list of objects. Subclasses can override this to filter many objects
+        more efficiently than one at a time.
+        """
+        filter = self.filter
+
+        return [ filter( object ) for object in objects ]
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -215,14 +256,79 @@ class EvalTableFilter ( TableFilter ):
         """ Returns whether a specified object meets the filter or search
         criteria.
         """
-        if self._traits is None:
-            self._traits = object.trait_names()
         try:
             return eval( self.expression_, globals(),
-                         object.get( *self._traits ) )
+                         self._context_for( object ) )
         except:
             return False
 
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_many ( self, objects ):
+        """ Returns a list containing the result of the filter for each of a
+        list of objects.
+        """
+        code     = self.expression_
+        names    = globals()
+        context  = self._context_for
+        results  = []
+        append   = results.append
+        for object in objects:
+            try:
+                append( eval( code, names, context( object ) ) )
+            except:
+                append( False )
+
+        return results
+
+    #---------------------------------------------------------------------------
+    #  Returns the local names to evaluate the expression with for an object:
+    #---------------------------------------------------------------------------
+
+    def _context_for ( self, object ):
+        """ Returns a dictionary containing the values of just those traits of
+            an object which are referenced by the expression.
+        """
+        traits = self._traits
+        if traits is None:
+            self._traits = traits = {}
+
+        klass = object.__class__
+        names = traits.get( klass )
+        if names is None:
+            referenced = code_names( self.expression_ )
+            traits[ klass ] = names = [ name for name in object.trait_names()
+                                        if name in referenced ]
+        if len( names ) == 0:
+            return {}
+
+        return object.get( *names )
+
+    #---------------------------------------------------------------------------
+    #  Handles the 'expression' trait being changed:
+    #---------------------------------------------------------------------------
+
+    def _expression_changed ( self ):
+        """ Handles a change to the **expression** trait.
+        """
+        self._traits = None
+
+    #---------------------------------------------------------------------------
+    #  Returns the state to be pickled (override of object):
+    #---------------------------------------------------------------------------
+
+    def __getstate__ ( self ):
+        """ Returns the state to be pickled.
+
+        This definition overrides **object**.
+        """
+        dict = super( EvalTableFilter, self ).__getstate__()
+        dict.pop( '_traits', None )
+        return dict
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -384,6 +490,41 @@ class GenericTableFilterRule ( HasPrivateTraits ):
     def ends_with ( self, value1, value2 ):
         return (value1[ -len( value2 ): ].lower() == value2.lower())
 
+    #---------------------------------------------------------------------------
+    #  Returns whether the rule is true for each of a list of objects:
+    #---------------------------------------------------------------------------
+
+    def is_true_many ( self, objects, values = None ):
+        """ Returns a numpy boolean array of whether the rule is true for each
+            of a list of objects. *values* is the list of the values of the
+            rule's trait for each object, if known. Comparisons of numeric
+            values are performed on the whole array at once.
+        """
+        import numpy
+
+        operation = self.operation_
+        if ((values is not None) and (len( values ) > 0) and
+            (operation in VectorOperations) and
+            (not overrides( self, 'is_true', GenericTableFilterRule )) and
+            (not overrides( self, operation, GenericTableFilterRule ))):
+            types = set( map( type, values ) )
+            type1 = types.pop()
+            if (len( types ) == 0) and (type1 in VectorTypes):
+                value2 = self.value
+                try:
+                    if type1 is not type( value2 ):
+                        value2 = type1( value2 )
+                except:
+                    return numpy.zeros( len( values ), bool )
+
+                array = numpy.array( values )
+                return numpy.asarray( getattr( operator, operation )(
+                                      array, value2 ), bool )
+
+        is_true = self.is_true
+
+        return numpy.array( [ is_true( object ) for object in objects ], bool )
+
 #-------------------------------------------------------------------------------
 #  'GenericTableFilterRuleEnabledColumn' class:
 #-------------------------------------------------------------------------------
@@ -531,6 +672,41 @@ class RuleTableFilter ( TableFilter ):
             is_first = False
         return is_true
 
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_many ( self, objects ):
+        """ Returns a list containing the result of the filter for each of a
+        list of objects. If numpy is available, each referenced trait is
+        fetched once for all of the objects and the rules are combined as
+        boolean arrays.
+        """
+        if overrides( self, 'filter', RuleTableFilter ):
+            return super( RuleTableFilter, self ).filter_many( objects )
+
+        try:
+            import numpy
+        except ImportError:
+            return super( RuleTableFilter, self ).filter_many( objects )
+
+        n       = len( objects )
+        columns = {}
+        result  = numpy.zeros( n, bool )
+        group   = numpy.ones( n, bool )
+        for i, rule in enumerate( self.rules ):
+            if (rule.and_or == 'or') and (i > 0):
+                result |= group
+                group   = numpy.ones( n, bool )
+            if group.any():
+                group &= rule.is_true_many( objects,
+                                            _column( columns, objects,
+                                                     rule.name ) )
+        result |= group
+
+        return result.tolist()
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -684,6 +860,33 @@ class MenuTableFilter ( RuleTableFilter ):
                 return False
         return True
 
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_many ( self, objects ):
+        """ Returns a list containing the result of the filter for each of a
+        list of objects.
+        """
+        if overrides( self, 'filter', MenuTableFilter ):
+            return TableFilter.filter_many( self, objects )
+
+        try:
+            import numpy
+        except ImportError:
+            return TableFilter.filter_many( self, objects )
+
+        columns = {}
+        result  = numpy.ones( len( objects ), bool )
+        for rule in self.rules:
+            if rule.enabled and result.any():
+                result &= rule.is_true_many( objects,
+                                             _column( columns, objects,
+                                                      rule.name ) )
+
+        return result.tolist()
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -24,6 +24,8 @@
 
 from __future__ import absolute_import
 
+from itertools import islice
+
 from traits.api import (Any, Bool, Color, Either, Enum, Event, Float, Font,
     HasPrivateTraits, HasTraits, Instance, Int, Interface, List, Property,
     Str, cached_property, implements, on_trait_change)
@@ -179,6 +181,27 @@ class TabularAdapter ( HasPrivateTraits ):
     # List of optional delegated adapters:
     adapters = List( ITabularAdapter, update = True )
 
+    # The maximum number of cell results (e.g. text, colors, fonts) to
+    # memoize between changes to the table. Editors flush the memoized results
+    # whenever the table is updated or refreshed, so this should only be used
+    # when the values returned by the adapter depend solely upon the items and
+    # the adapter itself. A value of 0 disables memoization:
+    result_cache_size = Int( 0 )
+
+    # An optional iterator (e.g. a generator, a database cursor or a paged file
+    # reader) supplying further items for the edited list. Items are appended
+    # to the list in chunks of *fetch_size* items when the user scrolls to the
+    # end of the table, until the iterator is exhausted (Qt4 only):
+    row_source = Any
+
+    # The number of items taken from *row_source* at a time:
+    fetch_size = Int( 256 )
+
+    # Should the editor fetch the text and colors of all visible cells at once
+    # (using *get_texts*, *get_bg_colors* and *get_text_colors*) and reuse them
+    # until the table is updated or refreshed (Qt4 only)?
+    prefetch = Bool( False )
+
     #-- Traits Set by the Editor -----------------------------------------------
 
     # The object whose trait is being edited:
@@ -204,12 +227,24 @@ class TabularAdapter ( HasPrivateTraits ):
 
     #-- Private Trait Definitions ----------------------------------------------
 
-    # Cache of attribute handlers:
+    # Cache of attribute handlers, keyed by ( item class, method name, column ):
     cache = Any( {} )
 
     # Event fired when the cache is flushed:
     cache_flushed = Event( update = True )
 
+    # Cache of memoized cell results:
+    result_cache = Any( {} )
+
+    # The column ids used by the dispatch table (a copy of *column_map*, or
+    # None if it needs to be rebuilt):
+    _column_ids = Any
+
+    # Can the context traits (e.g. *row*, *item*) be set without notifying
+    # listeners (because there are none)? None if it must be checked again,
+    # because a listener has been added or removed:
+    _quiet_context = Any
+
     # The mapping from column indices to column identifiers (defined by the
     # *columns* trait):
     column_map = Property( depends_on = 'columns' )
@@ -238,6 +273,13 @@ class TabularAdapter ( HasPrivateTraits ):
             item=None,
             value=None,
         )
+        self.flush_results()
+
+    def flush_results ( self ):
+        """ Discards all memoized cell results, so that they are recomputed
+            the next time they are requested.
+        """
+        self.result_cache.clear()
 
     #-- Adapter methods that are sensitive to item type ------------------------
 
@@ -333,6 +375,7 @@ class TabularAdapter ( HasPrivateTraits ):
             *text*.
         """
         self._result_for( 'set_text', object, trait, row, column, text )
+        self.flush_results()
 
     def get_tooltip ( self, object, trait, row, column ):
         """ Returns the tooltip for a specified row.
@@ -349,6 +392,38 @@ class TabularAdapter ( HasPrivateTraits ):
         """
         return self._result_for( 'get_column_menu', object, trait, row, column )
 
+    #-- Adapter methods operating on blocks of items --------------------------
+
+    def get_texts ( self, object, trait, rows, columns ):
+        """ Returns the text to display for the block of *object.trait* items
+            with row indices in *rows* and column indices in *columns*, as a
+            list containing the list of column texts for each row.
+
+            Override this method to format a whole block at once, for example
+            when the items are stored in an array.
+        """
+        get_text = self.get_text
+        return [ [ get_text( object, trait, row, column )
+                   for column in columns ] for row in rows ]
+
+    def get_bg_colors ( self, object, trait, rows, columns ):
+        """ Returns the background colors for the block of *object.trait* items
+            with row indices in *rows* and column indices in *columns*, as a
+            list containing the list of column colors for each row.
+        """
+        get_bg_color = self.get_bg_color
+        return [ [ get_bg_color( object, trait, row, column )
+                   for column in columns ] for row in rows ]
+
+    def get_text_colors ( self, object, trait, rows, columns ):
+        """ Returns the text colors for the block of *object.trait* items with
+            row indices in *rows* and column indices in *columns*, as a list
+            containing the list of column colors for each row.
+        """
+        get_text_color = self.get_text_color
+        return [ [ get_text_color( object, trait, row, column )
+                   for column in columns ] for row in rows ]
+
     #-- Adapter methods that are not sensitive to item type --------------------
 
     def get_item ( self, object, trait, row ):
@@ -368,6 +443,31 @@ class TabularAdapter ( HasPrivateTraits ):
         else:
             return len( getattr( object, trait ) )
 
+    def can_fetch_more ( self, object, trait ):
+        """ Returns whether more items can be added to the specified
+            *object.trait* list on demand (i.e. when the user scrolls to the
+            end of the table).
+        """
+        return self.row_source is not None
+
+    def fetch_more ( self, object, trait ):
+        """ Adds the next chunk of items to the specified *object.trait* list,
+            and returns the number of items added. The default implementation
+            takes up to *fetch_size* items from *row_source*.
+        """
+        source = self.row_source
+        if source is None:
+            return 0
+
+        items = list( islice( source, self.fetch_size ) )
+        if len( items ) < self.fetch_size:
+            self.row_source = None
+
+        if len( items ) > 0:
+            getattr( object, trait ).extend( items )
+
+        return len( items )
+
     def get_default_value ( self, object, trait ):
         """ Returns a new default value for the specified *object.trait* list.
         """
@@ -517,16 +617,65 @@ class TabularAdapter ( HasPrivateTraits ):
         """ Returns/Sets the value of the specified *name* attribute for the
             specified *object.trait[row].column* item.
         """
-        self.object    = object
-        self.name      = trait
-        self.row       = row
-        self.column    = column
-        self.column_id = column_id = self.column_map[ column ]
-        self.value     = value
-        self.item      = item = self.get_item( object, trait, row )
-        item_class     = item.__class__
-        key            = '%s:%s:%d' % ( item_class.__name__, name, column )
-        handler        = self.cache.get( key )
+        if (value is None and self.result_cache_size > 0 and
+            name[:4] == 'get_'):
+            results = self.result_cache
+            key     = ( row, column, name, trait, object )
+            try:
+                return results[ key ]
+            except KeyError:
+                pass
+
+            if len( results ) >= self.result_cache_size:
+                results.clear()
+
+            result = results[ key ] = self._handler_result_for( name, object,
+                                                          trait, row, column )
+            return result
+
+        return self._handler_result_for( name, object, trait, row, column,
+                                         value )
+
+    def _handler_result_for ( self, name, object, trait, row, column,
+                                    value = None ):
+        """ Returns/Sets the value of the specified *name* attribute for the
+            specified *object.trait[row].column* item using the dispatch table
+            entry for the item's class.
+        """
+        column_ids = self._column_ids
+        if column_ids is None:
+            column_ids = self._column_ids = self.column_map
+
+        column_id = column_ids[ column ]
+        item      = self.get_item( object, trait, row )
+
+        quiet = self._quiet_context
+        if quiet is None:
+            quiet = self._quiet_context = not self._context_is_observed()
+
+        if quiet:
+            # Nobody is listening to the context traits, so bypass the trait
+            # machinery and store their values directly:
+            context = self.__dict__
+            context[ 'object' ]    = object
+            context[ 'name' ]      = trait
+            context[ 'row' ]       = row
+            context[ 'column' ]    = column
+            context[ 'column_id' ] = column_id
+            context[ 'value' ]     = value
+            context[ 'item' ]      = item
+        else:
+            self.object    = object
+            self.name      = trait
+            self.row       = row
+            self.column    = column
+            self.column_id = column_id
+            self.value     = value
+            self.item      = item
+
+        item_class = item.__class__
+        key        = ( item_class, name, column )
+        handler    = self.cache.get( key )
         if handler is not None:
             return handler()
 
@@ -585,11 +734,38 @@ class TabularAdapter ( HasPrivateTraits ):
 
         return None
 
-    @on_trait_change( 'columns,adapters.+update' )
+    def _on_trait_change ( self, handler, name = None, remove = False,
+                                 dispatch = 'same', priority = False,
+                                 target = None ):
+        """ Overridden to check for listeners on the context traits again
+            after any listener is added or removed (all of the ways of adding
+            listeners end up here).
+        """
+        super( TabularAdapter, self )._on_trait_change( handler, name, remove,
+                                           dispatch, priority, target )
+        self._quiet_context = None
+
+    def _context_is_observed ( self ):
+        """ Returns whether any change handlers are attached to the traits
+            describing the item currently being adapted.
+        """
+        if self._notifiers( 0 ):
+            return True
+
+        for name in ( 'object', 'name', 'row', 'column', 'column_id', 'value',
+                      'item' ):
+            if self._trait( name, 0 )._notifiers( 0 ):
+                return True
+
+        return False
+
+    @on_trait_change( 'columns,columns_items,adapters.+update' )
     def _flush_cache ( self ):
         """ Flushes the cache when the columns or any trait on any adapter
             changes.
         """
         self.cache = {}
+        self._column_ids = None
+        self.flush_results()
         self.cache_flushed = True
 
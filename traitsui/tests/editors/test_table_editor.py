@@ -0,0 +1,80 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the toolkit independent parts of the table editor.
+"""
+
+from nose.tools import assert_equals
+
+from traitsui.editors.table_editor import moved_rows, splice_filtered_indices
+
+
+def _splice(accepted, index, n_removed, added):
+    """ Applies a splice to a list of filter results and to its filtered
+        indices, and checks the indices against the spliced results.
+    """
+    indices = [i for i, ok in enumerate(accepted) if ok]
+    start, end, values = splice_filtered_indices(indices, index, n_removed,
+                                                 added)
+    indices[start:end] = values
+    accepted[index:index + n_removed] = added
+    assert_equals(indices, [i for i, ok in enumerate(accepted) if ok])
+    return start, end
+
+
+def test_splice_filtered_indices():
+    results = [True, False, True, True, False, True]
+    _splice(list(results), 0, 0, [True, True])
+    _splice(list(results), 2, 2, [False])
+    _splice(list(results), 1, 1, [True])
+    _splice(list(results), 0, 6, [])
+    _splice([], 0, 0, [False, True])
+
+
+def test_append_does_not_visit_existing_indices():
+    start, end = _splice([True] * 10, 10, 0, [True, False])
+    assert_equals((start, end), (10, 10))
+
+
+def _move(rows, new_row, n_items=6):
+    """ Returns the items of a table of *n_items* rows after moving *rows*
+        to *new_row*.
+    """
+    items = range(n_items)
+    first, order = moved_rows(rows, new_row, n_items)
+    items[first:first + len(order)] = [items[row] for row in order]
+    return items
+
+
+def test_moved_rows():
+    assert_equals(_move([2], 1), [0, 2, 1, 3, 4, 5])
+    assert_equals(_move([2], 3), [0, 1, 3, 2, 4, 5])
+    assert_equals(_move([2, 3], 1), [0, 2, 3, 1, 4, 5])
+    assert_equals(_move([2, 3], 4), [0, 1, 4, 2, 3, 5])
+    assert_equals(_move([0, 4], 2), [1, 2, 0, 4, 3, 5])
+    assert_equals(_move([1, 3], 0), [1, 3, 0, 2, 4, 5])
+    assert_equals(_move([0], -1), range(6))
+    assert_equals(_move([], 2), range(6))
+
+
+def test_moved_rows_past_the_edge():
+    # Moving a selection which includes the last row down (or the first row
+    # up) has no valid destination, so nothing moves:
+    assert_equals(_move([3, 5], 6), range(6))
+    assert_equals(_move([0, 3], -1), range(6))
+    assert_equals(moved_rows([3, 9], -1, 10), (0, []))
+
+
+def test_moved_rows_span():
+    first, order = moved_rows([5], 6, 10)
+    assert_equals((first, order), (5, [6, 5]))
@@ -0,0 +1,71 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test that a Qt table editor whose sorting affects the model keeps the edited
+list sorted.
+"""
+
+from traits.api import HasTraits, Int, List
+from traitsui.api import Item, ObjectColumn, TableEditor, View
+
+from traitsui.tests._tools import *
+
+
+class Row(HasTraits):
+    value = Int
+
+
+class Rows(HasTraits):
+    rows = List(Row)
+
+    traits_view = View(
+        Item('rows', show_label=False,
+             editor=TableEditor(columns=[ObjectColumn(name='value')],
+                                sortable=True, sort_model=True)))
+
+
+def _values(obj):
+    return [row.value for row in obj.rows]
+
+
+@skip_if_not_qt4
+def test_opening_does_not_sort_the_list():
+    obj = Rows(rows=[Row(value=v) for v in [5, 1, 9]])
+
+    with store_exceptions_on_all_threads():
+        ui = obj.edit_traits()
+        try:
+            nose.tools.assert_equal(_values(obj), [5, 1, 9])
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_added_items_are_sorted_into_the_list():
+    obj = Rows(rows=[Row(value=v) for v in [1, 5, 9]])
+
+    with store_exceptions_on_all_threads():
+        ui = obj.edit_traits()
+        try:
+            obj.rows.extend([Row(value=v) for v in [7, 0, 3]])
+            nose.tools.assert_equal(_values(obj), [0, 1, 3, 5, 7, 9])
+
+            # A single item is moved into place using the saved sort keys:
+            obj.rows.append(Row(value=4))
+            nose.tools.assert_equal(_values(obj), [0, 1, 3, 4, 5, 7, 9])
+
+            # As is an item whose sort key changes:
+            obj.rows[0].value = 8
+            nose.tools.assert_equal(_values(obj), [1, 3, 4, 5, 7, 8, 9])
+        finally:
+            ui.dispose()
@@ -14,8 +14,9 @@
 #------------------------------------------------------------------------------
 
 
-from traits.api import Bool, HasTraits, Instance, Int, List
+from traits.api import Bool, HasTraits, Instance, Int, List, Str
 from traitsui.api import Item, TreeEditor, TreeNode, View
+from traitsui.editors.tree_editor import children_diff, kept_children
 
 from traitsui.tests._tools import *
 
@@ -77,3 +78,226 @@ def test_tree_editor_listeners_with_shown_root():
 
 def test_tree_editor_listeners_with_hidden_root():
     _test_tree_editor_releases_listeners(hide_root=True)
+
+
+class CountingTreeNode(TreeNode):
+    """ A TreeNode counting the objects it is asked about. """
+
+    n_is_node_for = Int
+
+    def is_node_for(self, object):
+        self.n_is_node_for += 1
+        return super(CountingTreeNode, self).is_node_for(object)
+
+
+def test_nodes_for_is_resolved_once_per_class():
+    bogus_node = TreeNode(node_for=[Bogus], children='bogus_list')
+    other_node = TreeNode(node_for=[BogusTreeView])
+    tree_editor = TreeEditor(nodes=[other_node, bogus_node])
+
+    objects = [Bogus() for i in range(10)]
+    for obj in objects:
+        nose.tools.assert_equal(tree_editor.nodes_for(obj), [bogus_node])
+    nose.tools.assert_equal(tree_editor.class_nodes.keys(), [Bogus])
+
+    # The cache is discarded when the nodes change:
+    other_node.node_for = [Bogus]
+    nose.tools.assert_equal(tree_editor.class_nodes, {})
+    nose.tools.assert_equal(tree_editor.nodes_for(objects[0]),
+                            [other_node, bogus_node])
+    tree_editor.nodes.remove(other_node)
+    nose.tools.assert_equal(tree_editor.nodes_for(objects[0]), [bogus_node])
+
+
+def test_nodes_for_asks_nodes_overriding_is_node_for():
+    counting_node = CountingTreeNode(node_for=[Bogus])
+    tree_editor = TreeEditor(nodes=[counting_node])
+
+    for i in range(3):
+        nose.tools.assert_equal(tree_editor.nodes_for(Bogus()),
+                                [counting_node])
+    nose.tools.assert_equal(counting_node.n_is_node_for, 3)
+
+
+def _apply_children_diff(old, new):
+    """ Rebuilds *new* from *old* the way the tree editors do, removing and
+    moving the old children as described by children_diff, and only taking
+    the children which are new from *new*.
+    """
+    removed, order = children_diff(old, new)
+    nose.tools.assert_equal(removed, sorted(removed, reverse=True))
+
+    # The positions in *old* of the children left after the removals, or
+    # None for a new child:
+    children = range(len(old))
+    for i in removed:
+        del children[i]
+
+    added = []
+    for i, old_index in enumerate(order):
+        if old_index is None:
+            children.insert(i, None)
+            added.append(new[i])
+        else:
+            children.remove(old_index)
+            children.insert(i, old_index)
+
+    nose.tools.assert_equal(len(children), len(new))
+    added.reverse()
+    return [added.pop() if i is None else old[i] for i in children]
+
+
+def test_children_diff():
+    a, b, c, d = [Bogus() for i in range(4)]
+    nose.tools.assert_equal(children_diff([a, b, c], [a, b, c]),
+                            ([], [0, 1, 2]))
+    nose.tools.assert_equal(children_diff([a, b, c], [c, d, a]),
+                            ([1], [2, None, 0]))
+    nose.tools.assert_equal(children_diff([a, b, c], []), ([2, 1, 0], []))
+
+    # Repeated children are matched in order:
+    nose.tools.assert_equal(children_diff([a, b, a], [a, a, a]),
+                            ([1], [0, 2, None]))
+    for old, new in (([a, b], [b, a, c]), ([], [d, d]), ([a, a, c], [c, a])):
+        nose.tools.assert_equal(_apply_children_diff(old, new), new)
+
+
+def test_kept_children():
+    nose.tools.assert_equal(kept_children([]), set())
+    nose.tools.assert_equal(kept_children([None, None]), set())
+    nose.tools.assert_equal(kept_children([0, None, 1, 2]), set([0, 1, 2]))
+
+    # Moving one child to the front keeps all of its siblings:
+    nose.tools.assert_equal(kept_children([5, 0, 1, 2, 3, 4]),
+                            set([0, 1, 2, 3, 4]))
+    nose.tools.assert_equal(kept_children([1, 2, 3, 4, 5, 0]),
+                            set([1, 2, 3, 4, 5]))
+    nose.tools.assert_equal(len(kept_children([0, 3, 1, 2, 4])), 4)
+
+
+class Named(HasTraits):
+    """ A named tree of objects. """
+
+    name = Str
+
+    children = List
+
+
+class NamedTreeView(HasTraits):
+
+    root = Instance(Named)
+
+    traits_view = View(
+        Item('root', show_label=False,
+             editor=TreeEditor(nodes=[TreeNode(node_for=[Named],
+                                               children='children',
+                                               label='name')],
+                               editable=False)))
+
+
+def _is_expanded(editor, nid):
+    if is_current_backend_wx():
+        return editor._tree.IsExpanded(nid)
+    return nid.isExpanded()
+
+
+def _expand(editor, nid):
+    if is_current_backend_wx():
+        editor._tree.Expand(nid)
+    else:
+        nid.setExpanded(True)
+
+
+@skip_if_null
+def test_replaced_children_keep_their_nodes():
+    children = [Named(name=str(i), children=[Named(name='leaf')])
+                for i in range(6)]
+    root = Named(name='root', children=children)
+
+    with store_exceptions_on_all_threads():
+        ui = NamedTreeView(root=root).edit_traits()
+        try:
+            editor = ui.get_editors('root')[0]
+            nid = editor._get_object_nid(root)
+            editor._expand_node(nid)
+            for cnid in editor._nodes_for(nid):
+                editor._expand_node(cnid)
+                _expand(editor, cnid)
+
+            # Move the last child to the front, then the first to the end:
+            for order in (children[-1:] + children[:-1], children):
+                root.children = order
+
+                cnids = editor._nodes_for(nid)
+                nose.tools.assert_equal(
+                    [editor._get_node_data(cnid)[2] for cnid in cnids],
+                    order)
+
+                # None of the children was re-created (and collapsed):
+                for cnid in cnids:
+                    nose.tools.assert_true(_is_expanded(editor, cnid))
+        finally:
+            ui.dispose()
+
+
+def _children_notifiers(obj):
+    return obj.trait('children')._notifiers(False)
+
+
+@skip_if_not_qt4
+def test_inserted_children_are_shown_in_order():
+    root = Named(name='root', children=[Named(name='first')])
+
+    with store_exceptions_on_all_threads():
+        ui = NamedTreeView(root=root).edit_traits()
+        try:
+            editor = ui.get_editors('root')[0]
+            nid = editor._get_object_nid(root)
+            editor._expand_node(nid)
+            _expand(editor, nid)
+
+            # Add several children at the end, then in the middle:
+            added = [Named(name=str(i)) for i in range(3)]
+            root.children.extend(added)
+            inserted = [Named(name=str(i)) for i in range(3, 5)]
+            root.children[1:1] = inserted
+
+            cnids = editor._nodes_for(nid)
+            nose.tools.assert_equal(
+                [editor._get_node_data(cnid)[2] for cnid in cnids],
+                root.children)
+
+            # The listeners are added to each of the new children once:
+            for child in added + inserted:
+                nose.tools.assert_equal(1, len(_children_notifiers(child)))
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_deleted_child_keeps_listeners_of_other_node():
+    shared = Named(name='shared')
+    root = Named(name='root', children=[shared])
+
+    with store_exceptions_on_all_threads():
+        ui = NamedTreeView(root=root).edit_traits()
+        try:
+            editor = ui.get_editors('root')[0]
+            nid = editor._get_object_nid(root)
+            editor._expand_node(nid)
+            _expand(editor, nid)
+
+            # The same object shown twice is only listened to once:
+            root.children.append(shared)
+            nose.tools.assert_equal(2, len(editor._nodes_for(nid)))
+            nose.tools.assert_equal(1, len(_children_notifiers(shared)))
+
+            # Deleting one of its nodes keeps the listeners for the other:
+            del root.children[0]
+            nose.tools.assert_equal(1, len(editor._nodes_for(nid)))
+            nose.tools.assert_equal(1, len(_children_notifiers(shared)))
+
+            del root.children[0]
+            nose.tools.assert_equal(0, len(_children_notifiers(shared)))
+        finally:
+            ui.dispose()
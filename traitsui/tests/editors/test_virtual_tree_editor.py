@@ -0,0 +1,153 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the virtual (model/view) tree editor of the Qt backend.
+"""
+
+from traits.api import HasTraits, Instance, List, Str
+from traitsui.api import Item, TreeEditor, TreeNode, View
+
+from traitsui.tests._tools import *
+
+
+class Folder(HasTraits):
+    name = Str
+    children = List
+
+
+class Leaf(HasTraits):
+    name = Str
+
+
+class RecordingTreeNode(TreeNode):
+    """ A TreeNode recording the objects whose children it is asked for. """
+
+    fetched = List
+
+    def has_children(self, object):
+        return len(object.children) > 0
+
+    def get_children(self, object):
+        self.fetched.append(object.name)
+        return super(RecordingTreeNode, self).get_children(object)
+
+
+class Tree(HasTraits):
+    folder = Instance(Folder)
+
+
+def _edit_tree(folder):
+    """ Shows a folder in a virtual tree editor, and returns the UI, the
+    editor, and the node used for folders.
+    """
+    folder_node = RecordingTreeNode(node_for=[Folder], children='children',
+                                    label='name')
+    editor = TreeEditor(nodes=[folder_node, TreeNode(node_for=[Leaf],
+                                                     label='name')],
+                        virtual=True, editable=False)
+    view = View(Item('folder', editor=editor, show_label=False))
+    ui = Tree(folder=folder).edit_traits(view=view)
+    return ui, ui.get_editors('folder')[0], folder_node
+
+
+def _labels(model, item):
+    """ Returns the labels of the rows below an item of a TreeModel. """
+    from pyface.qt import QtCore
+
+    parent = model.index_for(item)
+    labels = []
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        nose.tools.assert_true(index.isValid())
+        labels.append(model.data(index, QtCore.Qt.DisplayRole))
+    return labels
+
+
+@skip_if_not_qt4
+def test_virtual_selects_editor_class():
+    from traitsui.qt4.tree_editor import VirtualTreeEditor
+
+    with store_exceptions_on_all_threads():
+        ui, editor, node = _edit_tree(Folder(name='root'))
+        try:
+            nose.tools.assert_true(isinstance(editor, VirtualTreeEditor))
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_children_fetched_when_expanded():
+    folder = Folder(name='root', children=[
+        Folder(name='a', children=[Leaf(name='a1')]), Leaf(name='b')])
+
+    with store_exceptions_on_all_threads():
+        ui, editor, node = _edit_tree(folder)
+        try:
+            model = editor._tree.model()
+            root = model.child_item(model.root, 0)
+            a = model.child_item(root, 0)
+
+            # Knowing whether a row can be expanded does not fetch it:
+            nose.tools.assert_true(model.hasChildren(model.index_for(a)))
+            nose.tools.assert_true('a' not in node.fetched)
+
+            nose.tools.assert_equal(_labels(model, a), ['a1'])
+            nose.tools.assert_equal(node.fetched.count('a'), 1)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_children_updated():
+    folder = Folder(name='root', children=[Leaf(name='a'), Folder(name='b')])
+
+    with store_exceptions_on_all_threads():
+        ui, editor, node = _edit_tree(folder)
+        try:
+            model = editor._tree.model()
+            root = model.child_item(model.root, 0)
+            nose.tools.assert_equal(_labels(model, root), ['a', 'b'])
+
+            folder.children.insert(1, Leaf(name='c'))
+            nose.tools.assert_equal(_labels(model, root), ['a', 'c', 'b'])
+
+            folder.children.append(Leaf(name='d'))
+            del folder.children[0]
+            nose.tools.assert_equal(_labels(model, root), ['c', 'b', 'd'])
+
+            folder.children = [Leaf(name='e')]
+            nose.tools.assert_equal(_labels(model, root), ['e'])
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_listeners_released_on_dispose():
+    child = Folder(name='a')
+    folder = Folder(name='root', children=[child])
+
+    with store_exceptions_on_all_threads():
+        ui, editor, node = _edit_tree(folder)
+        model = editor._tree.model()
+        model.child_item(model.child_item(model.root, 0), 0)
+
+        # Listeners are added to the objects which have items:
+        for obj in (folder, child):
+            notifiers = obj.trait('children')._notifiers(False)
+            nose.tools.assert_equal(1, len(notifiers))
+
+        ui.dispose()
+
+        for obj in (folder, child):
+            notifiers = obj.trait('children')._notifiers(False)
+            nose.tools.assert_equal(0, len(notifiers))
@@ -0,0 +1,72 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the tabular adapters used by the ArrayViewEditor.
+"""
+
+import numpy
+from nose.tools import assert_equals
+
+from traits.api import HasTraits, Array, Str
+
+from traitsui.ui_editors.array_view_editor import (ArrayViewAdapter,
+    StructuredArrayAdapter)
+
+
+class Data(HasTraits):
+    data = Array
+
+
+def _cell_texts(adapter, obj, rows, columns):
+    return [[adapter.get_text(obj, 'data', row, column) for column in columns]
+            for row in rows]
+
+
+def test_array_view_adapter_get_texts():
+    obj = Data(data=numpy.arange(12.0).reshape(4, 3))
+    adapter = ArrayViewAdapter(
+        columns=[('Index', 'index'), ('x', 0), ('y', 1), ('z', 2)],
+        format='%.1f')
+    texts = adapter.get_texts(obj, 'data', range(1, 3), range(4))
+    assert_equals(texts, [['1', '3.0', '4.0', '5.0'],
+                          ['2', '6.0', '7.0', '8.0']])
+    assert_equals(texts, _cell_texts(adapter, obj, range(1, 3), range(4)))
+
+
+def test_array_view_adapter_get_texts_transposed():
+    obj = Data(data=numpy.arange(6).reshape(2, 3))
+    adapter = ArrayViewAdapter(columns=[('a', 0), ('b', 1)], transpose=True)
+    texts = adapter.get_texts(obj, 'data', range(3), range(2))
+    assert_equals(texts, [['0', '3'], ['1', '4'], ['2', '5']])
+    assert_equals(texts, _cell_texts(adapter, obj, range(3), range(2)))
+
+
+class RecordAdapter(StructuredArrayAdapter):
+    time_format = Str('%.2f')
+
+
+def test_structured_array_adapter():
+    data = numpy.zeros(5, dtype=[('time', float), ('count', int)])
+    data['time'] = numpy.linspace(0.0, 1.0, 5)
+    data['count'] = numpy.arange(5) * 10
+    obj = Data(data=data)
+    adapter = RecordAdapter(
+        columns=[('Index', 'index'), ('Time', 'time'), ('Count', 'count')])
+
+    assert_equals(adapter.len(obj, 'data'), 5)
+    texts = adapter.get_texts(obj, 'data', [3, 4], range(3))
+    assert_equals(texts, [['3', '0.75', '30'], ['4', '1.00', '40']])
+    assert_equals(texts, _cell_texts(adapter, obj, [3, 4], range(3)))
+
+    adapter.set_text(obj, 'data', 1, 2, '7')
+    assert_equals(obj.data['count'][1], 7)
@@ -0,0 +1,71 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the toolkit independent helper functions.
+"""
+
+from nose.tools import assert_equals
+
+from traitsui.helper import overrides, row_ranges, sort_ranks, sorted_index
+
+
+def test_row_ranges():
+    assert_equals(row_ranges([]), [])
+    assert_equals(row_ranges([4]), [(4, 4)])
+    assert_equals(row_ranges([5, 1, 2, 3, 7, 6]), [(1, 3), (5, 7)])
+    assert_equals(row_ranges([0, 2, 2, 4, 3]), [(0, 0), (2, 4)])
+
+
+def test_sort_ranks():
+    assert_equals(sort_ranks([]), [])
+    assert_equals(sort_ranks(['b', 'a', 'c', 'a']), [1, 0, 2, 0])
+    assert_equals(sort_ranks([3.5, -1, None]), [2, 1, 0])
+
+
+def test_sort_ranks_of_array():
+    import numpy
+    assert_equals(sort_ranks(numpy.array([2.0, 1.0, 2.0, 0.5])), [2, 1, 2, 0])
+
+
+def test_sorted_index():
+    assert_equals(sorted_index([1, 9, 3, 5], 1), 3)
+    assert_equals(sorted_index([1, 3, 0, 5], 2), 0)
+    assert_equals(sorted_index([1, 3, 4, 5], 2), 2)
+    assert_equals(sorted_index([1, 3, 3, 5], 0), 0)
+    assert_equals(sorted_index([3, 1, 3, 5], 0), 2)
+    assert_equals(sorted_index([7], 0), 0)
+
+
+def test_sorted_index_reversed():
+    assert_equals(sorted_index([5, 0, 3, 1], 1, reverse=True), 3)
+    assert_equals(sorted_index([5, 3, 9, 1], 2, reverse=True), 0)
+
+
+class Base(object):
+    def method(self):
+        pass
+
+
+class Derived(Base):
+    def method(self):
+        pass
+
+
+class Inherited(Base):
+    pass
+
+
+def test_overrides():
+    assert overrides(Derived(), 'method', Base)
+    assert not overrides(Inherited(), 'method', Base)
+    assert not overrides(Base(), 'method', Base)
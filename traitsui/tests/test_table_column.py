@@ -0,0 +1,159 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the toolkit independent parts of the table columns.
+"""
+
+from nose.tools import assert_equals
+
+from traits.api import HasTraits, Instance, Int, Str
+
+from traitsui.helper import sort_ranks
+from traitsui.table_column import (ExpressionColumn, ListColumn,
+    NumericColumn, ObjectColumn)
+
+
+class Address(HasTraits):
+    city = Str
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+    address = Instance(Address, ())
+
+
+def _people():
+    return [Person(name=name, age=age, address=Address(city=city))
+            for name, age, city in [('adam', 30, 'paris'),
+                                    ('eve', 28, 'berlin'),
+                                    ('abel', 3, 'rome')]]
+
+
+def _sorted_names(column, people):
+    ranks = sort_ranks(column.get_sort_keys(people))
+    return [person.name for rank, person in sorted(zip(ranks, people))]
+
+
+def test_object_column_sort_keys():
+    people = _people()
+    column = ObjectColumn(name='address.city')
+    assert_equals(column.get_sort_keys(people), ['paris', 'berlin', 'rome'])
+    assert_equals(column.get_sort_key(people[0]), 'paris')
+    assert_equals(_sorted_names(column, people), ['eve', 'adam', 'abel'])
+
+
+def test_object_column_sort_keys_of_missing_attribute():
+    people = _people() + [object()]
+    column = ObjectColumn(name='name')
+    assert_equals(column.get_sort_keys(people), ['adam', 'eve', 'abel', None])
+
+
+class ReversedColumn(ObjectColumn):
+
+    def cmp(self, object1, object2):
+        return -super(ReversedColumn, self).cmp(object1, object2)
+
+
+def test_sort_keys_use_custom_cmp():
+    people = _people()
+    column = ReversedColumn(name='age')
+    assert_equals(_sorted_names(column, people), ['adam', 'eve', 'abel'])
+
+
+def test_list_column_sort_keys():
+    rows = [[1, 'b'], [2, 'a']]
+    column = ListColumn(index=1)
+    assert_equals(sort_ranks(column.get_sort_keys(rows)), [1, 0])
+
+
+def test_numeric_column_sort_keys():
+    people = _people()
+    column = NumericColumn(name='age')
+    keys = column.get_sort_keys(people)
+    assert_equals(keys.tolist(), [30, 28, 3])
+    assert_equals(_sorted_names(column, people), ['abel', 'eve', 'adam'])
+
+
+class Box(HasTraits):
+    width = Int
+    height = Int
+    address = Instance(Address, ())
+
+
+class CountingColumn(ExpressionColumn):
+
+    # The number of times the expression was evaluated:
+    n_evaluated = Int
+
+    def _get_function(self):
+        function = super(CountingColumn, self)._get_function()
+
+        def counting_function(object):
+            self.n_evaluated += 1
+            return function(object)
+
+        return counting_function
+
+
+def test_expression_column():
+    column = ExpressionColumn(expression='object.width * factor',
+                              globals={'factor': 2})
+    assert_equals(column.get_raw_value(Box(width=3)), 6)
+    assert_equals(column.get_value(Box(width=4)), '8')
+
+    # Expressions which are not valid within a lambda still work:
+    column.expression = 'object.height # the height'
+    assert_equals(column.get_raw_value(Box(height=5)), 5)
+
+
+def test_expression_column_not_cached_by_default():
+    column = CountingColumn(expression='object.width * object.height')
+    box = Box(width=2, height=3)
+    column.get_raw_value(box)
+    column.get_raw_value(box)
+    assert_equals(column.n_evaluated, 2)
+
+
+def test_cached_expression_column():
+    column = CountingColumn(expression='object.width * object.height',
+                            cached=True)
+    box = Box(width=2, height=3)
+    for i in range(3):
+        assert_equals(column.get_raw_value(box), 6)
+    assert_equals(column.n_evaluated, 1)
+
+    # Changing a trait named in the expression discards the cached value:
+    box.height = 4
+    assert_equals(column.get_raw_value(box), 8)
+    assert_equals(column.n_evaluated, 2)
+
+    # Other boxes are cached separately:
+    assert_equals(column.get_raw_value(Box(width=1, height=1)), 1)
+    assert_equals(column.n_evaluated, 3)
+
+
+def test_cached_expression_column_depends_on():
+    column = CountingColumn(expression='object.address.city.upper()',
+                            cached=True, depends_on=['address.city'])
+    box = Box(address=Address(city='rome'))
+    assert_equals(column.get_raw_value(box), 'ROME')
+    box.address.city = 'oslo'
+    assert_equals(column.get_raw_value(box), 'OSLO')
+    box.address = Address(city='lima')
+    assert_equals(column.get_raw_value(box), 'LIMA')
+    assert_equals(column.n_evaluated, 3)
+
+    # Changing the expression discards all cached values:
+    column.expression = 'object.address.city'
+    assert_equals(column.get_raw_value(box), 'lima')
@@ -0,0 +1,125 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the table filters.
+"""
+
+import pickle
+
+from nose.tools import assert_equals
+
+from traits.api import Float, HasTraits, Int, Str
+
+from traitsui.api import (EvalTableFilter, MenuTableFilter, RuleTableFilter,
+    TableFilter)
+from traitsui.table_filter import GenericTableFilterRule
+
+
+class Record(HasTraits):
+    name = Str
+    count = Int
+    weight = Float
+
+
+def _records():
+    return [Record(name='item%d' % i, count=i, weight=0.5 * i)
+            for i in range(6)]
+
+
+def test_filter_many():
+    records = _records()
+    table_filter = TableFilter(allowed=lambda record: record.count % 2 == 0)
+    assert_equals(table_filter.filter_many(records),
+                  [True, False, True, False, True, False])
+
+
+def test_eval_filter():
+    records = _records()
+    table_filter = EvalTableFilter(
+        expression='count > 2 and name.endswith("4")')
+    assert_equals(table_filter.filter_many(records),
+                  [False, False, False, False, True, False])
+    assert_equals(table_filter.filter(records[4]), True)
+
+    # Only the referenced traits are fetched from each object:
+    assert_equals(table_filter._traits.values(), [['count', 'name']])
+
+
+def test_eval_filter_expression_changed():
+    records = _records()
+    table_filter = EvalTableFilter(expression='count < 2')
+    assert_equals(table_filter.filter(records[1]), True)
+    table_filter.expression = 'weight >= 2.0'
+    assert_equals(table_filter.filter_many(records),
+                  [False, False, False, False, True, True])
+
+
+def test_eval_filter_errors():
+    table_filter = EvalTableFilter(expression='1 / count > 0')
+    assert_equals(table_filter.filter_many(_records()[:2]), [False, True])
+    assert_equals(table_filter.filter(object()), False)
+
+
+def test_pickle_eval_filter():
+    table_filter = EvalTableFilter(expression='count == 3')
+    table_filter.filter(_records()[0])
+    table_filter = pickle.loads(pickle.dumps(table_filter))
+    assert_equals(table_filter.filter_many(_records())[3], True)
+
+
+def _rule(table_filter, name, operation, value, and_or='and'):
+    return GenericTableFilterRule(filter=table_filter, name=name,
+                                  operation=operation, value=value,
+                                  and_or=and_or)
+
+
+def _check_filter_many(table_filter, records):
+    results = table_filter.filter_many(records)
+    assert_equals(results, [table_filter.filter(r) for r in records])
+    return results
+
+
+def test_rule_filter_many():
+    records = _records() + [Record(name='other', count=10, weight=1.0)]
+    table_filter = RuleTableFilter()
+    assert_equals(_check_filter_many(table_filter, records), [True] * 7)
+
+    table_filter.rules = [
+        _rule(table_filter, 'count', '>=', 2),
+        _rule(table_filter, 'weight', '<', '2.0'),
+        _rule(table_filter, 'name', 'starts with', 'OTH', 'or'),
+        _rule(table_filter, 'count', '=', 0, 'or'),
+    ]
+    assert_equals(_check_filter_many(table_filter, records),
+                  [True, False, True, True, False, False, True])
+
+
+def test_rule_filter_many_mixed_values():
+    records = [Record(count=1), HasTraits(), Record(count=3)]
+    table_filter = RuleTableFilter()
+    table_filter.rules = [_rule(table_filter, 'count', '>', 2),
+                          _rule(table_filter, 'count', '<', 'x')]
+    assert_equals(_check_filter_many(table_filter, records),
+                  [False, False, False])
+
+
+def test_menu_filter_many():
+    records = _records()
+    table_filter = MenuTableFilter()
+    table_filter.rules = [_rule(table_filter, 'count', '<', 4),
+                          _rule(table_filter, 'name', 'ends with', '1')]
+    assert_equals(_check_filter_many(table_filter, records),
+                  [False, True, False, False, False, False])
+    table_filter.rules[1].enabled = False
+    assert_equals(_check_filter_many(table_filter, records),
+                  [True, True, True, True, False, False])
@@ -0,0 +1,170 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test the toolkit independent parts of the TabularAdapter.
+"""
+
+from nose.tools import assert_equals
+
+from traits.api import HasTraits, Int, List, Property, Str
+
+from traitsui.tabular_adapter import TabularAdapter
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+
+
+class People(HasTraits):
+    people = List(Person)
+
+
+class CountingAdapter(TabularAdapter):
+    columns = [('Name', 'name'), ('Age', 'age')]
+
+    # The number of times the text of a cell was computed:
+    n_text = Int
+
+    name_text = Property
+
+    def _get_name_text(self):
+        self.n_text += 1
+        return self.item.name.upper()
+
+
+def _people():
+    return People(people=[Person(name='adam', age=30),
+                          Person(name='eve', age=28)])
+
+
+def test_get_text():
+    adapter = CountingAdapter()
+    obj = _people()
+    assert_equals(adapter.get_text(obj, 'people', 0, 0), 'ADAM')
+    assert_equals(adapter.get_text(obj, 'people', 1, 0), 'EVE')
+    assert_equals(adapter.get_text(obj, 'people', 1, 1), '28')
+
+
+def test_results_not_memoized_by_default():
+    adapter = CountingAdapter()
+    obj = _people()
+    adapter.get_text(obj, 'people', 0, 0)
+    adapter.get_text(obj, 'people', 0, 0)
+    assert_equals(adapter.n_text, 2)
+
+
+def test_memoized_results():
+    adapter = CountingAdapter(result_cache_size=100)
+    obj = _people()
+    for i in range(3):
+        assert_equals(adapter.get_text(obj, 'people', 0, 0), 'ADAM')
+    assert_equals(adapter.n_text, 1)
+
+    # Memoized results are only discarded when explicitly flushed:
+    obj.people[0].name = 'abel'
+    assert_equals(adapter.get_text(obj, 'people', 0, 0), 'ADAM')
+    adapter.flush_results()
+    assert_equals(adapter.get_text(obj, 'people', 0, 0), 'ABEL')
+    assert_equals(adapter.n_text, 2)
+
+
+def test_memoized_results_flushed_by_set_text():
+    adapter = CountingAdapter(result_cache_size=100)
+    obj = _people()
+    assert_equals(adapter.get_text(obj, 'people', 1, 1), '28')
+    adapter.set_text(obj, 'people', 1, 1, '29')
+    assert_equals(adapter.get_text(obj, 'people', 1, 1), '29')
+
+
+def test_memoized_results_bounded():
+    adapter = CountingAdapter(result_cache_size=1)
+    obj = _people()
+    adapter.get_text(obj, 'people', 0, 0)
+    adapter.get_text(obj, 'people', 1, 0)
+    assert_equals(len(adapter.result_cache), 1)
+    adapter.get_text(obj, 'people', 0, 0)
+    assert_equals(adapter.n_text, 3)
+
+
+class Employee(Person):
+    pass
+
+
+class ClassAdapter(TabularAdapter):
+    columns = [('Name', 'name'), ('Age', 'age')]
+
+    Employee_name_text = Property
+
+    # The rows seen by a listener on the 'row' trait:
+    rows = List(Int)
+
+    def _get_Employee_name_text(self):
+        return 'Employee ' + self.item.name
+
+    def _row_changed(self, row):
+        self.rows.append(row)
+
+
+def test_dispatch_by_item_class():
+    adapter = ClassAdapter()
+    obj = People(people=[Person(name='adam'), Employee(name='eve')])
+    assert_equals(adapter.get_text(obj, 'people', 0, 0), 'adam')
+    assert_equals(adapter.get_text(obj, 'people', 1, 0), 'Employee eve')
+
+    # The dispatch table is rebuilt when the columns change:
+    adapter.columns = [('Age', 'age'), ('Name', 'name')]
+    assert_equals(adapter.get_text(obj, 'people', 1, 0), '0')
+    assert_equals(adapter.get_text(obj, 'people', 1, 1), 'Employee eve')
+
+
+def test_observed_context_is_notified():
+    adapter = ClassAdapter()
+    obj = People(people=[Person(name='adam'), Employee(name='eve')])
+    adapter.get_text(obj, 'people', 1, 0)
+    assert_equals(adapter.rows, [1])
+
+
+def test_context_listener_added_after_first_use():
+    adapter = CountingAdapter()
+    obj = _people()
+    adapter.get_text(obj, 'people', 0, 0)
+
+    rows = []
+    adapter.on_trait_change(lambda new: rows.append(new), 'row')
+    adapter.get_text(obj, 'people', 1, 0)
+    assert_equals(rows, [1])
+
+
+def test_get_texts():
+    adapter = CountingAdapter()
+    obj = _people()
+    texts = adapter.get_texts(obj, 'people', range(2), range(2))
+    assert_equals(texts, [['ADAM', '30'], ['EVE', '28']])
+    texts = adapter.get_texts(obj, 'people', [1], [1])
+    assert_equals(texts, [['28']])
+
+
+def test_fetch_more():
+    adapter = CountingAdapter(
+        row_source=(Person(name=str(i)) for i in range(5)), fetch_size=2)
+    obj = People()
+    assert adapter.can_fetch_more(obj, 'people')
+    assert_equals(adapter.fetch_more(obj, 'people'), 2)
+    assert_equals(adapter.fetch_more(obj, 'people'), 2)
+    assert_equals(adapter.len(obj, 'people'), 4)
+    assert adapter.can_fetch_more(obj, 'people')
+    assert_equals(adapter.fetch_more(obj, 'people'), 1)
+    assert not adapter.can_fetch_more(obj, 'people')
+    assert_equals(adapter.fetch_more(obj, 'people'), 0)
+    assert_equals([p.name for p in obj.people], ['0', '1', '2', '3', '4'])
@@ -25,6 +25,8 @@
 
 from __future__ import absolute_import
 
+from operator import attrgetter
+
 from traits.api import (AdaptedTo, Adapter, Any, Bool, Callable, Either,
     HasPrivateTraits, Instance, Interface, isinterface, List, Property, Str,
     cached_property)
@@ -152,6 +154,10 @@ class TreeNode ( HasPrivateTraits ):
     # Selector or name for foreground color
     foreground = Any
 
+    # The compiled getter for each (possibly dotted) trait name used to get a
+    # label or tooltip:
+    _getters = Any( {}, transient = True )
+
     # fixme: The 'menu' trait should really be defined as:
     #        Instance( 'traitsui.menu.MenuBar' ), but it doesn't work
     #        right currently.
@@ -296,7 +302,7 @@ class TreeNode ( HasPrivateTraits ):
         if label[:1] == '=':
             return label[1:]
 
-        label = xgetattr( object, label, '' )
+        label = self._get_value( object, label, '' )
 
         if self.formatter is None:
             return label
@@ -331,7 +337,7 @@ class TreeNode ( HasPrivateTraits ):
         """ Get the labels for any columns that have been defined.
         """
         trait = self.column_labels
-        labels = xgetattr(object, trait, [])
+        labels = self._get_value(object, trait, [])
         formatted = []
         for formatter, label in map(None, self.column_formatters, labels):
             # If the list of column formatters is shorter than the list of
@@ -372,7 +378,7 @@ class TreeNode ( HasPrivateTraits ):
         if tooltip[:1] == '=':
             return tooltip[1:]
 
-        tooltip = xgetattr( object, tooltip, '' )
+        tooltip = self._get_value( object, tooltip, '' )
 
         if self.tooltip_formatter is None:
             return tooltip
@@ -668,6 +674,26 @@ class TreeNode ( HasPrivateTraits ):
 
         return object.__class__
 
+    #---------------------------------------------------------------------------
+    #  Returns the value of a (possibly dotted) trait name of an object:
+    #---------------------------------------------------------------------------
+
+    def _get_value ( self, object, name, default ):
+        """ Returns the value of a (possibly dotted) trait name of an object,
+            or *default* if it does not exist. This is equivalent to
+            xgetattr( object, name, default ), but the name is only parsed
+            once.
+        """
+        getters = self._getters
+        getter  = getters.get( name )
+        if getter is None:
+            getters[ name ] = getter = attrgetter( name )
+
+        try:
+            return getter( object )
+        except AttributeError:
+            return default
+
 #-------------------------------------------------------------------------------
 #  'ITreeNode' class
 #-------------------------------------------------------------------------------
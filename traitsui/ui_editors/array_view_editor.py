@@ -15,13 +15,16 @@
 
 #-------------------------------------------------------------------------------
 
-""" Defines an ArrayViewEditor for displaying 1-d or 2-d arrays of values.
+""" Defines an ArrayViewEditor for displaying 1-d or 2-d arrays of values, or
+    1-d structured arrays (including record arrays and memory-mapped arrays).
 """
 
 #-- Imports --------------------------------------------------------------------
 
 from __future__ import absolute_import
 
+import numpy
+
 from traits.api import Instance, Property, List, Str, Bool, Font
 
 from ..api import View, Item, TabularEditor, BasicEditorFactory
@@ -32,7 +35,21 @@ from ..toolkit import toolkit_object
 
 from ..ui_editor import UIEditor
 
-#-- Tabular Adapter Definition -------------------------------------------------
+#-- Helper Functions -----------------------------------------------------------
+
+def format_values ( format, values ):
+    """ Returns the list of strings obtained by applying the Python format
+        string *format* to each value of a 1D array.
+    """
+    if values.ndim == 1:
+        try:
+            return numpy.char.mod( format, values ).tolist()
+        except ( TypeError, ValueError ):
+            pass
+
+    return [ format % value for value in values ]
+
+#-- Tabular Adapter Definitions ------------------------------------------------
 
 class ArrayViewAdapter ( TabularAdapter ):
 
@@ -45,6 +62,9 @@ class ArrayViewAdapter ( TabularAdapter ):
     alignment  = 'right'
     index_text = Property
 
+    # The text of the visible cells is formatted a block at a time:
+    prefetch = True
+
     def _get_index_text ( self ):
         return str( self.row )
 
@@ -74,6 +94,80 @@ class ArrayViewAdapter ( TabularAdapter ):
 
         return super( ArrayViewAdapter, self ).len( object, trait )
 
+    def get_texts ( self, object, trait, rows, columns ):
+        """ Returns the text to display for a block of array items, formatting
+            each column of the block with a single vectorized operation.
+        """
+        if len( rows ) == 0:
+            return []
+
+        array = getattr( object, trait )
+        if self.transpose:
+            array = array.T
+
+        rows  = numpy.asarray( rows, dtype = int )
+        block = array[ rows ]
+        texts = []
+        for column in columns:
+            column_id = self.column_map[ column ]
+            if column_id == 'index':
+                texts.append( [ str( row ) for row in rows ] )
+            else:
+                if self.is_2d:
+                    values = block[ :, column_id ]
+                else:
+                    values = block
+                format = self.get_format( object, trait, rows[0], column )
+                texts.append( format_values( format, values ) )
+
+        return map( list, zip( *texts ) )
+
+
+class StructuredArrayAdapter ( TabularAdapter ):
+    """ Adapts a 1D structured array (including record arrays and
+        memory-mapped arrays) for display in a TabularEditor, with the fields
+        of the array as the columns.
+
+        Each column id is either the name of a field or the string 'index'
+        (for a column displaying the row index). The array is never copied:
+        only the records in the visible block of rows are read and formatted.
+    """
+
+    alignment  = 'right'
+    index_text = Property
+
+    # The text of the visible cells is formatted a block at a time:
+    prefetch = True
+
+    def _get_index_text ( self ):
+        return str( self.row )
+
+    def _get_content ( self ):
+        return self.item[ self.column_id ]
+
+    def _set_text ( self, value ):
+        getattr( self.object, self.name )[ self.column_id ][ self.row ] = value
+
+    def get_texts ( self, object, trait, rows, columns ):
+        """ Returns the text to display for a block of records, formatting
+            each field of the block with a single vectorized operation.
+        """
+        if len( rows ) == 0:
+            return []
+
+        rows  = numpy.asarray( rows, dtype = int )
+        block = getattr( object, trait )[ rows ]
+        texts = []
+        for column in columns:
+            column_id = self.column_map[ column ]
+            if column_id == 'index':
+                texts.append( [ str( row ) for row in rows ] )
+            else:
+                format = self.get_format( object, trait, rows[0], column )
+                texts.append( format_values( format, block[ column_id ] ) )
+
+        return map( list, zip( *texts ) )
+
 # Define the actual abstract Traits UI array view editor (each backend should
 # implement its own editor that inherits from this class.
 class _ArrayViewEditor ( UIEditor ):
@@ -85,7 +179,7 @@ class _ArrayViewEditor ( UIEditor ):
     show_titles = Bool( False )
 
     # The tabular adapter being used for the editor view:
-    adapter = Instance( ArrayViewAdapter )
+    adapter = Instance( TabularAdapter )
 
     #-- Private Methods --------------------------------------------------------
 
@@ -110,6 +204,14 @@ class _ArrayViewEditor ( UIEditor ):
         # Make sure that the value is an array of the correct shape:
         shape = self.value.shape
         len_shape = len( shape )
+        names = self.value.dtype.names
+        if names is not None:
+            if len_shape != 1:
+                raise ValueError( "ArrayViewEditor can only display 1D "
+                                  "structured arrays" )
+
+            return self._init_structured_ui( parent, names )
+
         if (len_shape == 0) or (len_shape > 2):
             raise ValueError( "ArrayViewEditor can only display 1D or 2D "
                               "arrays" )
@@ -155,6 +257,27 @@ class _ArrayViewEditor ( UIEditor ):
                                  parent = parent,
                                  kind   = 'subpanel' )
 
+    def _init_structured_ui ( self, parent, names ):
+        """ Creates the Traits UI for displaying a structured array, using one
+            column per field.
+        """
+        factory = self.factory
+        titles  = factory.titles[:len( names )]
+        titles  = titles + list( names[len( titles ):] )
+        columns = zip( titles, names )
+        self.show_titles = True
+
+        if factory.show_index:
+            columns.insert( 0, ( 'Index', 'index' ) )
+
+        self.adapter = StructuredArrayAdapter( columns = columns,
+                                               format  = factory.format,
+                                               font    = factory.font )
+
+        return self.edit_traits( view   = '_array_view',
+                                 parent = parent,
+                                 kind   = 'subpanel' )
+
 # Define the ArrayViewEditor class used by client code:
 class ArrayViewEditor ( BasicEditorFactory ):
 
@@ -164,7 +287,8 @@ class ArrayViewEditor ( BasicEditorFactory ):
     # Should an index column be displayed:
     show_index = Bool( True )
 
-    # List of (optional) column titles:
+    # List of (optional) column titles (for structured arrays, the field names
+    # are used for any missing titles):
     titles = List( Str )
 
     # Should the array be logically transposed:
@@ -817,10 +817,12 @@ class TableModel ( GridModel ):
                 nitems = [ nitem for nitem in enumerate( items ) ]
                 self.filter_summary = 'All %s items' % len( nitems )
             else:
-                if not callable( filter ):
-                    filter = filter.filter
+                if callable( filter ):
+                    accepted = [ filter( item ) for item in items ]
+                else:
+                    accepted = filter.filter_many( items )
                 nitems = [ nitem for nitem in enumerate( items )
-                           if filter( nitem[1] ) ]
+                           if accepted[ nitem[0] ] ]
                 self.filter_summary = '%s of %s items' % ( len( nitems ),
                                                            len( items ) )
             sorter = self._sorter
@@ -423,6 +423,7 @@ class TabularEditor ( Editor ):
     def _refresh_row ( self, row ):
         """ Updates the editor control when a specified table row changes.
         """
+        self.adapter.flush_results()
         self.control.RefreshRect(
              self.control.GetItemRect( row, wx.LIST_RECT_BOUNDS ) )
 
@@ -440,6 +441,8 @@ class TabularEditor ( Editor ):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        self.adapter.flush_results()
+
         control = self.control
         n       = self.adapter.len( self.object, self.name )
         top     = control.GetTopItem()
@@ -872,6 +875,7 @@ class TabularEditor ( Editor ):
     def _refresh ( self ):
         """ Refreshes the contents of the editor's list control.
         """
+        self.adapter.flush_results()
         n = self.adapter.len( self.object, self.name )
         if n > 0:
             self.control.RefreshItems( 0, n - 1)
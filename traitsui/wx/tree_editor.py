@@ -51,7 +51,7 @@ from traitsui.api \
 # compatibility. The class has been moved to the
 # traitsui.editors.tree_editor file.
 from traitsui.editors.tree_editor \
-    import ToolkitEditorFactory
+    import ToolkitEditorFactory, children_diff, kept_children
 
 from traitsui.undo \
     import ListUndoItem
@@ -798,8 +798,9 @@ class SimpleEditor ( Editor ):
 
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if object is not None and node.is_node_for( object ) ]
+        nodes   = []
+        if object is not None:
+            nodes = factory.nodes_for( object )
 
         # If only one found, we're done, return it:
         if len( nodes ) == 1:
@@ -1900,15 +1901,7 @@ class SimpleEditor ( Editor ):
 
             # Only add/remove the changes if the node has already been expanded:
             if expanded:
-                # Delete all current child nodes:
-                for cnid in self._nodes_for( nid ):
-                    self._delete_node( cnid )
-
-                # Add all of the children back in as new nodes:
-                for child in children:
-                    child, child_node = self._node_for( child )
-                    if child_node is not None:
-                        self._append_node( nid, child_node, child )
+                self._replace_child_nodes( nid, children )
 
             # Indicate whether the node has any children now:
             tree.SetItemHasChildren( nid, len( children ) > 0 )
@@ -1917,6 +1910,32 @@ class SimpleEditor ( Editor ):
             if node.can_auto_open( object ):
                 tree.Expand( nid )
 
+    def _replace_child_nodes ( self, nid, children ):
+        """ Updates the child nodes of a node for a new list of children. The
+            nodes of the largest set of children which are still present in
+            the same relative order are kept (together with their expanded
+            subtrees), so that only the differences are removed and inserted.
+            Since tree items can not be moved, the other children are
+            re-created.
+        """
+        new_nodes = [ self._node_for( child ) for child in children ]
+        new_nodes = [ ( child, child_node ) for child, child_node in new_nodes
+                      if child_node is not None ]
+        old_nids  = self._nodes_for( nid )
+        order = children_diff(
+            [ self._get_node_data( cnid )[2] for cnid in old_nids ],
+            [ child for child, child_node in new_nodes ] )[1]
+
+        kept = kept_children( order )
+        for i in xrange( len( old_nids ) - 1, -1, -1 ):
+            if i not in kept:
+                self._delete_node( old_nids[ i ] )
+
+        for i, old_index in enumerate( order ):
+            if old_index not in kept:
+                child, child_node = new_nodes[ i ]
+                self._insert_node( nid, i, child_node, child )
+
     #---------------------------------------------------------------------------
     #  Handles the children of a node being changed:
     #---------------------------------------------------------------------------